@@ -2,13 +2,29 @@
 
 import base64
 import mimetypes
+import time
 from abc import ABC, abstractmethod
+from typing import Callable, Iterator
 
-import requests
 from openai import OpenAI
 from anthropic import Anthropic
 
-from config.settings import OPENAI_MODEL, CLAUDE_MODEL
+from analyzer.resilience import (
+    LatencyTracker,
+    call_with_retry,
+    stream_with_retry,
+    hedged_stream,
+    register_stream_closer,
+)
+from config.settings import (
+    OPENAI_MODEL, CLAUDE_MODEL,
+    AI_REQUEST_TIMEOUT,
+    AI_HEDGE_ENABLED, AI_HEDGE_REASONING, AI_HEDGE_DEFAULT_TTFT,
+)
+from utils.http_session import shared_session
+
+# (클라이언트, 호출 종류)별 지연 기록 — Streamlit 재실행 간에도 유지되어 p95 학습
+_LATENCY: dict[tuple[str, str], LatencyTracker] = {}
 
 
 def _sanitize_image_urls(urls: list[str]) -> list[str]:
@@ -34,10 +50,8 @@ def _download_image_as_base64(url: str) -> tuple[str, str] | None:
     실패 시 None 반환.
     """
     try:
-        resp = requests.get(url, timeout=10, headers={
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                          "AppleWebKit/537.36 Chrome/145.0.0.0 Safari/537.36",
-        })
+        # 이미지 여러 장이 같은 CDN에서 오므로 공용 세션으로 연결 재사용
+        resp = shared_session().get(url, timeout=10)
         if resp.status_code != 200:
             return None
 
@@ -64,8 +78,22 @@ def _download_image_as_base64(url: str) -> tuple[str, str] | None:
 
 
 class AIClient(ABC):
+    """AI 클라이언트 공통 인터페이스.
+
+    하위 클래스는 SDK 호출 한 번을 _run()/_run_stream()으로 감싸서
+    재시도·데드라인·헤지를 공통 적용한다. request(timeout) / make_stream(timeout)은
+    데드라인까지 남은 시간으로 줄어든 요청 타임아웃을 받는다.
+    hedge=True는 종합 리포트처럼 지연에 민감한 호출에만 사용. 단건 호출도 헤지할 때는
+    스트림으로 받아 합치므로(make_stream), 진 요청은 연결을 끊어 생성이 멈춘다.
+    """
+
+    hedge_enabled = AI_HEDGE_ENABLED
+
     @abstractmethod
-    def analyze(self, system_prompt: str, user_data: str, max_tokens: int = 2000) -> str:
+    def analyze(
+        self, system_prompt: str, user_data: str, max_tokens: int = 2000,
+        hedge: bool = False,
+    ) -> str:
         pass
 
     @abstractmethod
@@ -74,6 +102,57 @@ class AIClient(ABC):
     ) -> str:
         pass
 
+    @abstractmethod
+    def analyze_stream(
+        self, system_prompt: str, user_data: str, max_tokens: int = 2000,
+        hedge: bool = False,
+    ) -> Iterator[str]:
+        """analyze()의 스트리밍 버전. 생성되는 텍스트 조각을 순서대로 yield."""
+        pass
+
+    @abstractmethod
+    def analyze_with_images_stream(
+        self, prompt: str, image_urls: list[str], max_tokens: int = 2000
+    ) -> Iterator[str]:
+        """analyze_with_images()의 스트리밍 버전."""
+        pass
+
+    def _tracker(self, kind: str) -> LatencyTracker:
+        return _LATENCY.setdefault((type(self).__name__, kind), LatencyTracker())
+
+    def _run(
+        self, request: Callable[[float], str], hedge: bool = False,
+        make_stream: Callable[[float], Iterator[str]] | None = None,
+    ) -> str:
+        """단건 호출: 재시도. 헤지하면 같은 요청을 스트림(make_stream)으로 받아 합친다
+        — 응답 전체를 기다리는 요청은 진 쪽을 중간에 멈출 수 없어 비용이 두 배가 되므로."""
+        if hedge and self.hedge_enabled and make_stream is not None:
+            return "".join(self._run_stream(make_stream, hedge=True))
+        return call_with_retry(request)
+
+    def _run_stream(
+        self, make_stream: Callable[[float], Iterator[str]], hedge: bool = False
+    ) -> Iterator[str]:
+        """스트리밍 호출: 재시도 + (선택) 첫 조각 지연(TTFT) p95 기준 헤지"""
+        tracker = self._tracker("ttft")
+
+        def attempt(timeout: float) -> Iterator[str]:
+            # 시도별 TTFT만 기록 (재시도 대기 시간이 p95에 섞이지 않도록)
+            start = time.monotonic()
+            first = True
+            for chunk in make_stream(timeout):
+                if first:
+                    tracker.record(time.monotonic() - start)
+                    first = False
+                yield chunk
+
+        if hedge and self.hedge_enabled:
+            yield from hedged_stream(
+                lambda: stream_with_retry(attempt), tracker.percentile() or AI_HEDGE_DEFAULT_TTFT
+            )
+        else:
+            yield from stream_with_retry(attempt)
+
 
 class OpenAIClient(AIClient):
     """o4-mini (reasoning 모델) 클라이언트.
@@ -82,22 +161,28 @@ class OpenAIClient(AIClient):
     - max_tokens 대신 max_completion_tokens 사용
     - temperature 설정 불가 (고정)
     - system role 대신 developer role 사용
+    - 첫 조각 전 추론 시간이 길고 편차가 커서 기본적으로 헤지하지 않음 (AI_HEDGE_REASONING)
     """
 
+    hedge_enabled = AI_HEDGE_ENABLED and AI_HEDGE_REASONING
+
     def __init__(self, api_key: str, model: str = OPENAI_MODEL):
-        self.client = OpenAI(api_key=api_key)
+        # 재시도는 resilience 계층에서 처리하므로 SDK 자체 재시도는 끔
+        self.client = OpenAI(api_key=api_key, timeout=AI_REQUEST_TIMEOUT, max_retries=0)
         self.model = model
 
-    def analyze(self, system_prompt: str, user_data: str, max_tokens: int = 2000) -> str:
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "developer", "content": system_prompt},
-                {"role": "user", "content": user_data},
-            ],
-            max_completion_tokens=max_tokens,
+    def analyze(
+        self, system_prompt: str, user_data: str, max_tokens: int = 2000,
+        hedge: bool = False,
+    ) -> str:
+        messages = [
+            {"role": "developer", "content": system_prompt},
+            {"role": "user", "content": user_data},
+        ]
+        return self._run(
+            lambda timeout: self._complete(messages, max_tokens, timeout), hedge,
+            lambda timeout: self._stream_completion(messages, max_tokens, timeout),
         )
-        return response.choices[0].message.content
 
     def analyze_with_images(
         self, prompt: str, image_urls: list[str], max_tokens: int = 2000
@@ -106,6 +191,68 @@ class OpenAIClient(AIClient):
         if not clean_urls:
             return self.analyze("You are an e-commerce analyst.", prompt, max_tokens)
 
+        messages = [{"role": "user", "content": self._build_image_content(prompt, clean_urls)}]
+        return self._run(lambda timeout: self._complete(messages, max_tokens, timeout))
+
+    def analyze_stream(
+        self, system_prompt: str, user_data: str, max_tokens: int = 2000,
+        hedge: bool = False,
+    ) -> Iterator[str]:
+        messages = [
+            {"role": "developer", "content": system_prompt},
+            {"role": "user", "content": user_data},
+        ]
+        yield from self._run_stream(
+            lambda timeout: self._stream_completion(messages, max_tokens, timeout), hedge
+        )
+
+    def analyze_with_images_stream(
+        self, prompt: str, image_urls: list[str], max_tokens: int = 2000
+    ) -> Iterator[str]:
+        clean_urls = _sanitize_image_urls(image_urls)
+        if not clean_urls:
+            yield from self.analyze_stream(
+                "You are an e-commerce analyst.", prompt, max_tokens
+            )
+            return
+
+        messages = [{"role": "user", "content": self._build_image_content(prompt, clean_urls)}]
+        yield from self._run_stream(
+            lambda timeout: self._stream_completion(messages, max_tokens, timeout)
+        )
+
+    def _complete(self, messages: list[dict], max_tokens: int, timeout: float = AI_REQUEST_TIMEOUT) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_completion_tokens=max_tokens,
+            timeout=timeout,
+        )
+        return response.choices[0].message.content
+
+    def _stream_completion(
+        self, messages: list[dict], max_tokens: int, timeout: float = AI_REQUEST_TIMEOUT
+    ) -> Iterator[str]:
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_completion_tokens=max_tokens,
+            stream=True,
+            timeout=timeout,
+        )
+        register_stream_closer(stream.response.close)
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content
+                if text:
+                    yield text
+        finally:
+            # 헤지에서 진 스트림이 연결을 붙잡고 있지 않도록 닫음
+            stream.response.close()
+
+    def _build_image_content(self, prompt: str, clean_urls: list[str]) -> list[dict]:
         content = [{"type": "text", "text": prompt}]
         for url in clean_urls[:10]:
             # base64 다운로드 시도, 실패 시 URL 직접 전달
@@ -121,28 +268,27 @@ class OpenAIClient(AIClient):
                     "type": "image_url",
                     "image_url": {"url": url},
                 })
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": content}],
-            max_completion_tokens=max_tokens,
-        )
-        return response.choices[0].message.content
+        return content
 
 
 class ClaudeClient(AIClient):
     def __init__(self, api_key: str, model: str = CLAUDE_MODEL):
-        self.client = Anthropic(api_key=api_key)
+        # 재시도는 resilience 계층에서 처리하므로 SDK 자체 재시도는 끔
+        self.client = Anthropic(api_key=api_key, timeout=AI_REQUEST_TIMEOUT, max_retries=0)
         self.model = model
 
-    def analyze(self, system_prompt: str, user_data: str, max_tokens: int = 2000) -> str:
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_data}],
+    def analyze(
+        self, system_prompt: str, user_data: str, max_tokens: int = 2000,
+        hedge: bool = False,
+    ) -> str:
+        request = {
+            "system": system_prompt,
+            "messages": [{"role": "user", "content": user_data}],
+        }
+        return self._run(
+            lambda timeout: self._complete(request, max_tokens, timeout), hedge,
+            lambda timeout: self._stream_completion(request, max_tokens, timeout),
         )
-        return response.content[0].text
 
     def analyze_with_images(
         self, prompt: str, image_urls: list[str], max_tokens: int = 2000
@@ -155,7 +301,78 @@ class ClaudeClient(AIClient):
                 max_tokens,
             )
 
-        # Claude: base64로 다운로드하여 전달 (robots.txt 차단 우회)
+        content = self._build_image_content(prompt, clean_urls)
+        if content is None:
+            return self.analyze(
+                prompt,
+                "이미지 다운로드에 실패했습니다. 텍스트 정보만으로 분석해주세요.",
+                max_tokens,
+            )
+
+        request = {"messages": [{"role": "user", "content": content}]}
+        return self._run(lambda timeout: self._complete(request, max_tokens, timeout))
+
+    def analyze_stream(
+        self, system_prompt: str, user_data: str, max_tokens: int = 2000,
+        hedge: bool = False,
+    ) -> Iterator[str]:
+        request = {
+            "system": system_prompt,
+            "messages": [{"role": "user", "content": user_data}],
+        }
+        yield from self._run_stream(
+            lambda timeout: self._stream_completion(request, max_tokens, timeout), hedge
+        )
+
+    def analyze_with_images_stream(
+        self, prompt: str, image_urls: list[str], max_tokens: int = 2000
+    ) -> Iterator[str]:
+        clean_urls = _sanitize_image_urls(image_urls)
+        if not clean_urls:
+            yield from self.analyze_stream(
+                prompt,
+                "이미지가 제공되지 않았습니다. 텍스트 정보만으로 분석해주세요.",
+                max_tokens,
+            )
+            return
+
+        content = self._build_image_content(prompt, clean_urls)
+        if content is None:
+            yield from self.analyze_stream(
+                prompt,
+                "이미지 다운로드에 실패했습니다. 텍스트 정보만으로 분석해주세요.",
+                max_tokens,
+            )
+            return
+
+        request = {"messages": [{"role": "user", "content": content}]}
+        yield from self._run_stream(
+            lambda timeout: self._stream_completion(request, max_tokens, timeout)
+        )
+
+    def _complete(self, request: dict, max_tokens: int, timeout: float = AI_REQUEST_TIMEOUT) -> str:
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            **request,
+        )
+        return response.content[0].text
+
+    def _stream_completion(
+        self, request: dict, max_tokens: int, timeout: float = AI_REQUEST_TIMEOUT
+    ) -> Iterator[str]:
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            **request,
+        ) as stream:
+            register_stream_closer(stream.close)
+            yield from stream.text_stream
+
+    def _build_image_content(self, prompt: str, clean_urls: list[str]) -> list[dict] | None:
+        """Claude: base64로 다운로드하여 전달 (robots.txt 차단 우회). 이미지가 하나도 없으면 None."""
         content = [{"type": "text", "text": prompt}]
         image_count = 0
         for url in clean_urls[:10]:
@@ -171,20 +388,7 @@ class ClaudeClient(AIClient):
                     },
                 })
                 image_count += 1
-
-        if image_count == 0:
-            return self.analyze(
-                prompt,
-                "이미지 다운로드에 실패했습니다. 텍스트 정보만으로 분석해주세요.",
-                max_tokens,
-            )
-
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            messages=[{"role": "user", "content": content}],
-        )
-        return response.content[0].text
+        return content if image_count else None
 
 
 def create_ai_client(provider: str, api_key: str) -> AIClient:
@@ -0,0 +1,102 @@
+"""여러 상품 비교 (지표 표 + AI 비교 리포트)
+
+상품별 수집 데이터에서 비교 지표를 로컬로 계산해 나란히 놓고,
+각 상품의 분석 결과와 함께 AI에 보내 비교 리포트를 만든다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from analyzer.ai_client import AIClient
+from analyzer.prompts import COMPARISON_PROMPT
+from analyzer.qna_categories import category_stats
+from analyzer.review_stats import compute_review_stats
+from config.settings import MAX_TOKENS_COMPARE, COMPARE_REPORT_CHARS
+from models.records import ReviewSet, QnASet
+from utils.text_cleaner import truncate_text
+
+
+@dataclass(slots=True)
+class ComparedProduct:
+    name: str
+    platform: str
+    product_data: dict | None = None
+    reviews: ReviewSet = field(default_factory=ReviewSet)
+    qna_pairs: QnASet = field(default_factory=QnASet)
+    results: dict[str, str] = field(default_factory=dict)  # 섹션 → 분석 결과 (모델 하나 기준)
+
+
+def comparison_rows(products: list[ComparedProduct]) -> list[tuple[str, list]]:
+    """(지표명, 상품별 값 목록) 행 목록. 값이 없으면 None."""
+    metrics: dict[str, list] = {
+        "플랫폼": [], "가격": [], "표시 별점": [], "표시 리뷰 수": [],
+        "수집 리뷰": [], "리뷰 범위": [], "평균 별점(수집)": [], "도움수 가중 평균": [],
+        "1~2점 비율(%)": [], "수집 문의": [], "답변률(%)": [], "주요 문의 유형": [],
+    }
+    for p in products:
+        data = p.product_data or {}
+        stats = compute_review_stats(p.reviews)
+        low = stats.histogram[1] + stats.histogram[2]
+        answered = sum(1 for q in p.qna_pairs if q.is_answered)
+        categories = category_stats(p.qna_pairs, samples_per_category=0) if p.qna_pairs else []
+
+        metrics["플랫폼"].append(p.platform)
+        metrics["가격"].append(data.get("price") or None)
+        metrics["표시 별점"].append(data.get("rating"))
+        metrics["표시 리뷰 수"].append(data.get("review_count"))
+        metrics["수집 리뷰"].append(stats.total)
+        metrics["리뷰 범위"].append("층화 표본 (별점 가중 추정)" if stats.weighted else "전체")
+        metrics["평균 별점(수집)"].append(stats.mean)
+        metrics["도움수 가중 평균"].append(stats.helpful_weighted_mean)
+        metrics["1~2점 비율(%)"].append(round(low / stats.rated * 100, 1) if stats.rated else None)
+        metrics["수집 문의"].append(len(p.qna_pairs))
+        metrics["답변률(%)"].append(
+            round(answered / len(p.qna_pairs) * 100, 1) if p.qna_pairs else None
+        )
+        metrics["주요 문의 유형"].append(", ".join(c.name for c in categories[:3]) or None)
+    return list(metrics.items())
+
+
+def format_comparison_table(products: list[ComparedProduct]) -> str:
+    """지표를 행, 상품을 열로 둔 마크다운 표"""
+    lines = [
+        "| 지표 | " + " | ".join(p.name for p in products) + " |",
+        "|---|" + "---|" * len(products),
+    ]
+    for metric, values in comparison_rows(products):
+        cells = ["-" if v is None else str(v) for v in values]
+        lines.append(f"| {metric} | " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+class ComparisonAnalyzer:
+    def __init__(self, ai_client: AIClient):
+        self.ai = ai_client
+
+    def analyze_stream(self, products: list[ComparedProduct]) -> Iterator[str]:
+        """상품 비교 리포트 (스트리밍)"""
+        if len(products) < 2:
+            yield "비교할 상품이 2개 이상 필요합니다."
+            return
+
+        yield from self.ai.analyze_stream(
+            COMPARISON_PROMPT,
+            self._build_user_data(products),
+            MAX_TOKENS_COMPARE,
+            hedge=True,
+        )
+
+    def _build_user_data(self, products: list[ComparedProduct]) -> str:
+        parts = [f"## 비교 지표\n{format_comparison_table(products)}"]
+        for i, p in enumerate(products, 1):
+            role = "기준 상품" if i == 1 else "경쟁 상품"
+            title = (p.product_data or {}).get("title") or p.name
+            parts.append(f"\n## {i}. {p.name} ({role}) — {title}")
+            # 종합 리포트가 있으면 그것만, 없으면 개별 분석 결과를 요약 길이로
+            if p.results.get("full"):
+                parts.append(truncate_text(p.results["full"], COMPARE_REPORT_CHARS))
+                continue
+            for section, heading in (("review", "리뷰 분석"), ("qna", "Q&A 분석"), ("story", "스토리 분석")):
+                if p.results.get(section):
+                    parts.append(f"### {heading}\n{truncate_text(p.results[section], COMPARE_REPORT_CHARS // 3)}")
+        return "\n".join(parts)
@@ -0,0 +1,144 @@
+"""감시 모드 변화 분석 (이전 스냅샷 대비 신규 리뷰·Q&A만 AI에 전달)
+
+- diff_snapshot(): 이전 수집분과 이번 수집분을 키로 비교해 신규 리뷰 / 신규 문의 / 새로 답변된 문의 추출
+- format_trend_table(): 회차별 별점·리뷰 수 추이 마크다운 표
+- DeltaAnalyzer: 변화분만으로 "무엇이 바뀌었나" 리포트 생성
+"""
+
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+
+from analyzer.ai_client import AIClient
+from analyzer.keywords import terms, contrast_terms
+from analyzer.prompts import DELTA_PROMPT
+from analyzer.qna_categories import category_stats, format_category_table
+from analyzer.review_clusters import cluster_reviews
+from analyzer.review_stats import compute_review_stats, format_stats_for_prompt
+from config.settings import MAX_TOKENS_DELTA, KEYWORD_TOP_N, REVIEW_PROMPT_SAMPLE, REVIEW_CLUSTERS
+from models.records import ReviewSet, QnASet, review_key, qna_key
+
+
+@dataclass(slots=True)
+class ProductDelta:
+    previous: ReviewSet = field(default_factory=ReviewSet)      # 이전까지 누적된 리뷰
+    new_reviews: ReviewSet = field(default_factory=ReviewSet)
+    new_qna: QnASet = field(default_factory=QnASet)
+    newly_answered: QnASet = field(default_factory=QnASet)      # 이전엔 미답변이던 문의
+
+    @property
+    def empty(self) -> bool:
+        return not (self.new_reviews or self.new_qna or self.newly_answered)
+
+
+def diff_snapshot(
+    old_reviews: ReviewSet, old_qna: QnASet, reviews: ReviewSet, qna_pairs: QnASet
+) -> ProductDelta:
+    """이전 스냅샷 대비 변화분"""
+    known_reviews = {review_key(r) for r in old_reviews}
+    old_answered = {qna_key(q): q.is_answered for q in old_qna}
+
+    delta = ProductDelta(previous=old_reviews)
+    for r in reviews:
+        key = review_key(r)
+        if key not in known_reviews:
+            known_reviews.add(key)      # 같은 회차 안의 중복 제거
+            delta.new_reviews.append(r)
+    seen = set()
+    for q in qna_pairs:
+        key = qna_key(q)
+        if key in seen:
+            continue
+        seen.add(key)
+        if key not in old_answered:
+            delta.new_qna.append(q)
+        elif q.is_answered and not old_answered[key]:
+            delta.newly_answered.append(q)
+    return delta
+
+
+def format_trend_table(history: list[dict], max_rows: int = 12) -> str:
+    """회차별 추이 마크다운 표 (최근 max_rows회)"""
+    lines = [
+        "| 수집 시각 | 표시 별점 | 표시 리뷰 수 | 가격 | 수집 평균 별점 | 신규 리뷰 | 신규 문의 |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for h in history[-max_rows:]:
+        cells = [
+            h.get("checked_at"), h.get("rating"), h.get("review_count"), h.get("price"),
+            h.get("collected_mean"), h.get("new_reviews"), h.get("new_qna"),
+        ]
+        lines.append("| " + " | ".join("-" if c in (None, "") else str(c) for c in cells) + " |")
+    return "\n".join(lines)
+
+
+def _keyword_shift(previous: ReviewSet, new_reviews: ReviewSet) -> str:
+    """이전 리뷰 대비 신규 리뷰에서 늘어난 키워드 표"""
+    groups = {"new": Counter(), "old": Counter()}
+    for name, reviews in (("new", new_reviews), ("old", previous)):
+        for text in (r.text for r in reviews):
+            groups[name].update(terms(text))
+    sizes = {"new": len(new_reviews), "old": len(previous)}
+    rows = contrast_terms(groups, sizes, KEYWORD_TOP_N)["new"]
+    if not rows:
+        return ""
+    lines = ["| 키워드 | 신규 리뷰 언급 수 | G² |", "|---|---|---|"]
+    lines += [f"| {term} | {count} | {g2} |" for term, count, g2 in rows]
+    return "\n".join(lines)
+
+
+class DeltaAnalyzer:
+    def __init__(self, ai_client: AIClient):
+        self.ai = ai_client
+
+    def analyze(self, title: str, delta: ProductDelta, history: list[dict]) -> str:
+        """변화 리포트. 변화가 없으면 AI를 호출하지 않는다."""
+        if delta.empty:
+            return "이전 수집 이후 새 리뷰·문의가 없습니다."
+
+        return self.ai.analyze(DELTA_PROMPT, self._build_user_data(title, delta, history), MAX_TOKENS_DELTA)
+
+    def _build_user_data(self, title: str, delta: ProductDelta, history: list[dict]) -> str:
+        parts = [f"## 상품\n{title}", f"## 회차별 추이\n{format_trend_table(history)}"]
+
+        if delta.new_reviews:
+            before = format_stats_for_prompt(compute_review_stats(delta.previous)) if delta.previous else "없음"
+            after = format_stats_for_prompt(compute_review_stats(delta.new_reviews))
+            parts.append(f"## 이전 누적 리뷰 ({len(delta.previous)}건) 별점 분포\n{before}")
+            parts.append(f"## 신규 리뷰 ({len(delta.new_reviews)}건) 별점 분포\n{after}")
+            shift = _keyword_shift(delta.previous, delta.new_reviews)
+            if shift:
+                parts.append(f"## 신규 리뷰에서 늘어난 키워드\n{shift}")
+            parts.append(f"## 신규 리뷰\n```json\n{self._prepare_reviews(delta.new_reviews)}\n```")
+
+        if delta.new_qna:
+            stats = category_stats(delta.new_qna)
+            samples = [
+                {"category": s.name, "question": delta.new_qna[i].question, "answer": delta.new_qna[i].answer}
+                for s in stats for i in s.samples
+            ]
+            parts.append(f"## 신규 문의 카테고리\n{format_category_table(stats, len(delta.new_qna))}")
+            parts.append(f"## 신규 문의 표본\n```json\n{json.dumps(samples, ensure_ascii=False, indent=1)}\n```")
+
+        if delta.newly_answered:
+            answered = [{"question": q.question, "answer": q.answer} for q in delta.newly_answered]
+            parts.append(
+                f"## 새로 답변된 기존 문의 ({len(answered)}건)\n"
+                f"```json\n{json.dumps(answered[:REVIEW_PROMPT_SAMPLE], ensure_ascii=False, indent=1)}\n```"
+            )
+        return "\n\n".join(parts)
+
+    def _prepare_reviews(self, reviews: ReviewSet) -> str:
+        def entry(r):
+            return {"rating": r.rating, "date": r.date, "content": r.text}
+
+        if len(reviews) <= REVIEW_PROMPT_SAMPLE:
+            return json.dumps([entry(r) for r in reviews], ensure_ascii=False, indent=1)
+
+        clusters = cluster_reviews(reviews, REVIEW_PROMPT_SAMPLE, REVIEW_CLUSTERS)
+        grouped = [
+            {"cluster": n, "size": c.size, "avg_rating": c.mean_rating,
+             "reviews": [entry(reviews[i]) for i in c.exemplars]}
+            for n, c in enumerate(clusters, 1)
+        ]
+        return json.dumps(grouped, ensure_ascii=False, indent=1)
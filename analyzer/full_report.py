@@ -1,5 +1,7 @@
 """종합 리포트 생성기"""
 
+from typing import Iterator
+
 from analyzer.ai_client import AIClient
 from analyzer.prompts import FULL_REPORT_PROMPT
 from config.settings import MAX_TOKENS_FULL
@@ -17,6 +19,49 @@ class FullReportAnalyzer:
         qna_result: str,
     ) -> str:
         """3개 분석 결과를 통합한 종합 리포트 생성"""
+        user_data = self._build_user_data(
+            product_data, story_result, review_result, qna_result
+        )
+        if not user_data:
+            return "통합 분석할 데이터가 없습니다."
+
+        # 종합 리포트는 가장 길고 마지막에 실행되므로 헤지 요청으로 꼬리 지연 완화
+        return self.ai.analyze(
+            FULL_REPORT_PROMPT,
+            user_data,
+            MAX_TOKENS_FULL,
+            hedge=True,
+        )
+
+    def analyze_stream(
+        self,
+        product_data: dict | None,
+        story_result: str,
+        review_result: str,
+        qna_result: str,
+    ) -> Iterator[str]:
+        """analyze()의 스트리밍 버전"""
+        user_data = self._build_user_data(
+            product_data, story_result, review_result, qna_result
+        )
+        if not user_data:
+            yield "통합 분석할 데이터가 없습니다."
+            return
+
+        yield from self.ai.analyze_stream(
+            FULL_REPORT_PROMPT,
+            user_data,
+            MAX_TOKENS_FULL,
+            hedge=True,
+        )
+
+    def _build_user_data(
+        self,
+        product_data: dict | None,
+        story_result: str,
+        review_result: str,
+        qna_result: str,
+    ) -> str:
         parts = []
 
         if product_data:
@@ -37,13 +82,4 @@ class FullReportAnalyzer:
         if qna_result:
             parts.append(f"\n## Q&A 분석 결과\n{qna_result}")
 
-        if not parts:
-            return "통합 분석할 데이터가 없습니다."
-
-        user_data = "\n".join(parts)
-
-        return self.ai.analyze(
-            FULL_REPORT_PROMPT,
-            user_data,
-            MAX_TOKENS_FULL,
-        )
+        return "\n".join(parts)
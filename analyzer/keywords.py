@@ -0,0 +1,171 @@
+"""로컬 키워드 추출 (LLM 호출 전 사전 집계)
+
+어절에서 조사·어미를 떼어 명사에 가까운 토큰을 만들고, 인접 토큰 쌍(구)을 함께 센다.
+- 리뷰: 별점 구간(긍정/중립/부정)별로 나머지 구간 대비 로그우도비(G²)가 높은 용어
+- Q&A: 질문 전체에서 언급 문서 수가 많은 용어
+
+빈도는 "해당 용어를 언급한 리뷰/질문 수"이며 전체 수집분을 대상으로 계산하므로,
+AI에는 원문 일부만 보내도 전체 코퍼스의 키워드 분포가 전달된다.
+리뷰가 층화 표본(ReviewSet.weights)이면 리뷰마다 가중치만큼 세어 전체 분포를 추정한다.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Iterable
+
+from models.records import ReviewSet, QnASet
+
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[A-Za-z][A-Za-z0-9]+|\d+[A-Za-z가-힣]+")
+
+# 길이가 긴 것부터 매칭 (예: "으로" 가 "로" 보다 먼저)
+_SUFFIXES = sorted(
+    [
+        "은", "는", "이", "가", "을", "를", "에", "의", "도", "로", "와", "과", "만", "랑",
+        "으로", "에서", "에게", "까지", "부터", "처럼", "보다", "하고", "이랑", "이나",
+        "에서는", "으로는", "에서도", "이라서", "이라도", "인데", "이고", "라서",
+        "요", "네요", "어요", "아요", "해요", "했어요", "습니다", "합니다", "입니다",
+        "지만", "는데", "니다", "하게", "해서", "하고요", "이에요", "예요", "이요",
+    ],
+    key=len,
+    reverse=True,
+)
+
+_STOPWORDS = frozenset([
+    # 리뷰 공통
+    "너무", "정말", "진짜", "그냥", "조금", "많이", "아주", "완전", "약간", "다시", "계속",
+    "제품", "상품", "구매", "구입", "사용", "주문", "생각", "이번", "하나", "그리고", "근데",
+    "그런데", "있어요", "없어요", "같아요", "좋아요", "입니다", "합니다", "있습니다", "했는데",
+    "이거", "저는", "제가", "우리", "정도", "부분", "느낌", "때문",
+    # Q&A 공통
+    "안녕하세요", "고객님", "감사합니다", "문의", "답변", "판매자", "확인", "부탁드립니다",
+    "문의드립니다", "궁금합니다", "가능한가요", "있나요", "되나요", "인가요", "비밀글",
+])
+
+BUCKETS = (
+    ("긍정 (4~5점)", lambda r: r >= 3.5),
+    ("중립 (3점)", lambda r: 2.5 <= r < 3.5),
+    ("부정 (1~2점)", lambda r: r < 2.5),
+)
+
+
+def _strip_suffix(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+            return word[: -len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """텍스트 → 조사·어미를 제거한 토큰 목록 (불용어·1글자 제외)"""
+    tokens = []
+    for word in _TOKEN_PATTERN.findall(text or ""):
+        word = _strip_suffix(word.lower())
+        if len(word) >= 2 and word not in _STOPWORDS:
+            tokens.append(word)
+    return tokens
+
+
+def terms(text: str) -> set[str]:
+    """문서에 등장한 용어 집합: 단일 토큰 + 인접 토큰 쌍"""
+    tokens = tokenize(text)
+    found = set(tokens)
+    found.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]) if a != b)
+    return found
+
+
+def document_frequency(docs: Iterable[str]) -> tuple[Counter, int]:
+    """용어별 언급 문서 수, 문서 수"""
+    df = Counter()
+    n = 0
+    for doc in docs:
+        df.update(terms(doc))
+        n += 1
+    return df, n
+
+
+def _g2(a: int, b: int, n1: int, n2: int) -> float:
+    """Dunning 로그우도비 (a/n1: 대상 그룹 비율, b/n2: 나머지 비율)"""
+    e1 = n1 * (a + b) / (n1 + n2)
+    e2 = n2 * (a + b) / (n1 + n2)
+    g = 0.0
+    if a:
+        g += a * math.log(a / e1)
+    if b:
+        g += b * math.log(b / e2)
+    return 2 * g
+
+
+def top_terms(df: Counter, top_n: int = 15, min_count: int = 2) -> list[tuple[str, int]]:
+    """언급 문서 수 상위 용어. 구가 단일어와 같은 수로 겹치면 구를 우선."""
+    ranked = sorted(
+        ((t, c) for t, c in df.items() if c >= min_count),
+        key=lambda x: (-x[1], -len(x[0].split())),
+    )
+    return ranked[:top_n]
+
+
+def contrast_terms(
+    groups: dict[str, Counter], sizes: dict[str, int], top_n: int = 15, min_count: int = 2
+) -> dict[str, list[tuple[str, int, float]]]:
+    """그룹별로 나머지 그룹 대비 과대 출현한 용어 (용어, 언급 수, G²)"""
+    total = Counter()
+    for df in groups.values():
+        total.update(df)
+    n_total = sum(sizes.values())
+
+    result = {}
+    for name, df in groups.items():
+        n1 = sizes[name]
+        n2 = n_total - n1
+        scored = []
+        for term, a in df.items():
+            if a < min_count:
+                continue
+            b = total[term] - a
+            # 나머지 그룹이 없으면 빈도 순
+            if n2 == 0:
+                scored.append((term, a, float(a)))
+            elif a / n1 > b / n2:
+                scored.append((term, a, round(_g2(a, b, n1, n2), 1)))
+        scored.sort(key=lambda x: -x[2])
+        result[name] = scored[:top_n]
+    return result
+
+
+def review_keyword_table(reviews: ReviewSet, top_n: int = 15) -> str:
+    """별점 구간별 특징 키워드 마크다운 표 (리뷰 전체 대상, 표본이면 가중 추정 건수)"""
+    groups = {name: Counter() for name, _ in BUCKETS}
+    sizes = dict.fromkeys(groups, 0)
+    weights = reviews.weights if reviews.is_sample else [1] * len(reviews)
+    for rating, headline, content, w in zip(
+        reviews.column("rating"), reviews.column("headline"), reviews.column("content"), weights
+    ):
+        if math.isnan(rating):
+            continue
+        for name, match in BUCKETS:
+            if match(rating):
+                for t in terms(f"{headline} {content}"):
+                    groups[name][t] += w
+                sizes[name] += w
+                break
+
+    sections = []
+    for name, rows in contrast_terms(groups, sizes, top_n).items():
+        if not rows:
+            continue
+        lines = [f"#### {name} — 리뷰 {round(sizes[name])}건", "| 키워드 | 언급 리뷰 수 | G² |", "|---|---|---|"]
+        lines += [f"| {t} | {round(c)} | {g} |" for t, c, g in rows]
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+def qna_keyword_table(qna_pairs: QnASet, top_n: int = 20) -> str:
+    """질문 키워드 마크다운 표 (Q&A 전체 대상)"""
+    df, n = document_frequency(qna_pairs.column("question"))
+    rows = top_terms(df, top_n)
+    if not rows:
+        return ""
+    lines = [f"질문 {n}건 기준", "| 키워드 | 언급 질문 수 |", "|---|---|"]
+    lines += [f"| {t} | {c} |" for t, c in rows]
+    return "\n".join(lines)
@@ -0,0 +1,231 @@
+"""크롤링-분석 데이터플로 파이프라인
+
+크롤링 전체가 끝나기를 기다리지 않고, 각 분석기를 입력 데이터셋이 준비되는 즉시 시작한다.
+- 상품 정보 → 스토리 분석
+- 리뷰 → 리뷰 분석
+- Q&A → Q&A 분석
+- 크롤링 종료 + 모델별 위 분석 완료 → 종합 리포트
+
+크롤링은 별도 스레드(자체 이벤트 루프)에서, 분석은 워커 스레드 풀에서 실행된다.
+Streamlit 요소는 스크립트 스레드에서만 갱신해야 하므로 진행 상황과 UI 호출은
+모두 이벤트 큐를 거쳐 run()을 소비하는 쪽(스크립트 스레드)으로 전달된다.
+
+run()이 yield하는 이벤트 (run_all()은 (key, 이벤트)를 yield):
+    ("ui", method, args, kwargs)          크롤러의 UI 호출 (proxy 경유)
+    ("crawl_end", ok)                     크롤링 종료 (ok=False면 접속 실패)
+    ("crawl_error", exc)                  크롤링 중 예외 (이미 수집된 데이터로 분석 계속)
+    ("section_start", label, section)
+    ("chunk", label, section, text)
+    ("section_error", label, section, exc)
+    ("section_done", label, section)
+    ("model_done", label)                 해당 모델의 모든 분석 종료
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+
+from analyzer.ai_client import create_ai_client
+from analyzer.story_analyzer import StoryAnalyzer
+from analyzer.review_analyzer import ReviewAnalyzer
+from analyzer.qna_analyzer import QnAAnalyzer
+from analyzer.full_report import FullReportAnalyzer
+from models.records import ReviewSet, QnASet
+
+SECTIONS = ("story", "review", "qna", "full")
+
+
+class _QueuedProxy:
+    """백그라운드 스레드의 메서드 호출을 이벤트 큐로 넘기는 프록시"""
+
+    def __init__(self, target, put: Callable):
+        self._target = target
+        self._put = put
+
+    def __getattr__(self, name):
+        method = getattr(self._target, name)
+
+        def call(*args, **kwargs):
+            self._put(("ui", method, args, kwargs))
+
+        return call
+
+
+class AnalysisPipeline:
+    def __init__(
+        self,
+        ai_configs: list[tuple[str, str, str]],
+        do_story: bool,
+        do_review: bool,
+        do_qna: bool,
+        do_full: bool,
+        max_workers: int = 6,
+        events: queue.Queue | None = None,
+        crawl_slots: threading.Semaphore | None = None,
+    ):
+        """events: 여러 파이프라인을 run_all()로 함께 돌릴 때 공유하는 큐.
+        crawl_slots: 동시에 실행할 크롤링(브라우저) 수 제한."""
+        self.do_story = do_story
+        self.do_review = do_review
+        self.do_qna = do_qna
+        self.do_full = do_full
+        # 큐 항목은 (발생 파이프라인, 이벤트)
+        self.events: queue.Queue = events or queue.Queue()
+        self._crawl_slots = crawl_slots
+
+        self.clients = {
+            label: create_ai_client(provider, api_key)
+            for provider, api_key, label in ai_configs
+        }
+        self.product_data = None
+        self.reviews = ReviewSet()
+        self.qna_pairs = QnASet()
+        self.results = {label: dict.fromkeys(SECTIONS, "") for label in self.clients}
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        # 아래 상태는 run()을 소비하는 스레드에서만 변경
+        self._running = {label: set() for label in self.clients}
+        self._finished: set[str] = set()
+        self._full_started: set[str] = set()
+        self._crawl_done = False
+        self.done = False
+
+    def proxy(self, target):
+        """크롤링 스레드에서 안전하게 호출할 수 있는 UI 요소 프록시 반환."""
+        return _QueuedProxy(target, self._put)
+
+    def on_ready(self, kind: str, data):
+        """크롤러 콜백: 'product' | 'reviews' | 'qna' 데이터셋 완성 알림 (스레드 안전)."""
+        self._put(("ready", kind, data))
+
+    def run(self, crawl_fn: Callable) -> Iterator[tuple]:
+        """crawl_fn 코루틴을 백그라운드에서 실행하며 파이프라인 이벤트를 yield."""
+        self.start(crawl_fn)
+        try:
+            while not self.done:
+                _, event = self.events.get()
+                yield from self.handle(event)
+        finally:
+            self.close()
+
+    def start(self, crawl_fn: Callable):
+        threading.Thread(target=self._crawl, args=(crawl_fn,), daemon=True).start()
+
+    def close(self):
+        self._pool.shutdown(wait=False)
+
+    def handle(self, event: tuple) -> Iterator[tuple]:
+        """큐에서 꺼낸 이벤트 하나를 처리하고 소비자에게 전달할 이벤트를 yield."""
+        kind = event[0]
+
+        if kind == "ready":
+            self._dispatch(event[1], event[2])
+            return
+
+        if kind == "crawl_end":
+            self._crawl_done = True
+        elif kind == "chunk":
+            _, label, section, text = event
+            self.results[label][section] += text
+        elif kind == "section_done":
+            _, label, section = event
+            self._running[label].discard(section)
+
+        yield event
+
+        if self._crawl_done:
+            for label in self.clients:
+                if label in self._finished:
+                    continue
+                self._maybe_start_full(label)
+                if not self._running[label]:
+                    self._finished.add(label)
+                    yield ("model_done", label)
+            if len(self._finished) == len(self.clients):
+                self.done = True
+
+    def _put(self, event: tuple):
+        self.events.put((self, event))
+
+    def _crawl(self, crawl_fn: Callable):
+        if self._crawl_slots:
+            self._crawl_slots.acquire()
+        try:
+            result = asyncio.run(crawl_fn())
+            self._put(("crawl_end", result is not None))
+        except Exception as e:
+            self._put(("crawl_error", e))
+            self._put(("crawl_end", True))
+        finally:
+            if self._crawl_slots:
+                self._crawl_slots.release()
+
+    def _dispatch(self, kind: str, data):
+        """데이터셋이 준비되면 그것을 입력으로 하는 분석을 모든 모델에 대해 시작."""
+        if kind == "product":
+            self.product_data = data
+            if self.do_story and data:
+                for label, client in self.clients.items():
+                    self._start(label, "story", StoryAnalyzer(client).analyze_stream(data))
+        elif kind == "reviews":
+            self.reviews = data or ReviewSet()
+            if self.do_review and self.reviews:
+                for label, client in self.clients.items():
+                    self._start(label, "review", ReviewAnalyzer(client).analyze_stream(self.reviews))
+        elif kind == "qna":
+            self.qna_pairs = data or QnASet()
+            if self.do_qna and self.qna_pairs:
+                for label, client in self.clients.items():
+                    self._start(label, "qna", QnAAnalyzer(client).analyze_stream(self.qna_pairs))
+
+    def _maybe_start_full(self, label: str):
+        """크롤링 종료 후 해당 모델의 개별 분석이 모두 끝났으면 종합 리포트 시작."""
+        if not self.do_full or label in self._full_started or self._running[label]:
+            return
+        res = self.results[label]
+        if not (res["story"] or res["review"] or res["qna"]):
+            return
+        self._full_started.add(label)
+        chunks = FullReportAnalyzer(self.clients[label]).analyze_stream(
+            self.product_data, res["story"], res["review"], res["qna"]
+        )
+        self._start(label, "full", chunks)
+
+    def _start(self, label: str, section: str, chunks: Iterator[str]):
+        self._running[label].add(section)
+        # section_start가 첫 chunk보다 먼저 큐에 들어가도록 제출 전에 넣음
+        self._put(("section_start", label, section))
+        self._pool.submit(self._work, label, section, chunks)
+
+    def _work(self, label: str, section: str, chunks: Iterator[str]):
+        try:
+            for chunk in chunks:
+                self._put(("chunk", label, section, chunk))
+        except Exception as e:
+            self._put(("section_error", label, section, e))
+        self._put(("section_done", label, section))
+
+
+def run_all(jobs: dict[str, tuple[AnalysisPipeline, Callable]]) -> Iterator[tuple[str, tuple]]:
+    """이벤트 큐를 공유하는 여러 파이프라인을 동시에 실행하며 (key, 이벤트)를 yield.
+
+    jobs: {key: (pipeline, crawl_fn)}. 전체 소요 시간은 가장 느린 상품에 가깝다.
+    """
+    pipelines = [p for p, _ in jobs.values()]
+    events = pipelines[0].events
+    if any(p.events is not events for p in pipelines):
+        raise ValueError("run_all()의 파이프라인은 같은 events 큐를 공유해야 합니다")
+
+    keys = {id(p): key for key, (p, _) in jobs.items()}
+    for pipeline, crawl_fn in jobs.values():
+        pipeline.start(crawl_fn)
+    try:
+        while not all(p.done for p in pipelines):
+            owner, event = events.get()
+            for out in owner.handle(event):
+                yield keys[id(owner)], out
+    finally:
+        for p in pipelines:
+            p.close()
@@ -37,10 +37,10 @@ REVIEW_SENTIMENT_PROMPT = """당신은 고객 리뷰 분석 전문가입니다.
 다음 항목을 분석하세요:
 
 ### 1. 긍정 리뷰 핵심 키워드
-상위 10개 키워드와 빈도수를 표로 정리
+상위 10개 키워드와 빈도수를 표로 정리 (빈도수는 '키워드 통계'의 언급 리뷰 수 사용)
 
 ### 2. 부정 리뷰 핵심 키워드
-상위 10개 키워드와 빈도수를 표로 정리
+상위 10개 키워드와 빈도수를 표로 정리 (빈도수는 '키워드 통계'의 언급 리뷰 수 사용)
 
 ### 3. 자주 언급되는 장점 TOP 5
 구체적인 리뷰 인용 포함
@@ -59,6 +59,12 @@ REVIEW_SENTIMENT_PROMPT = """당신은 고객 리뷰 분석 전문가입니다.
 
 리뷰 데이터는 JSON 형식이며, 각 리뷰에는 rating, author, date, content 필드가 있습니다.
 content가 비어있는 리뷰는 별점만 참고하세요.
+'별점 분포'와 '키워드 통계'는 수집한 리뷰 전체로 집계한 값이고, 리뷰 데이터는 그중 일부 표본입니다.
+리뷰가 많아 층화 표본만 수집한 경우 통계에 '표본'으로 표시되며, 낮은 별점을 일부러 더 받은 표본을
+별점별 가중치로 보정한 추정치입니다. 이때 건수는 실제 리뷰 수가 아니므로 비율 위주로 해석하세요.
+리뷰가 많으면 내용이 비슷한 리뷰끼리 묶은 군집별 대표 리뷰가 주어지며,
+size는 그 군집의 리뷰 수, avg_rating은 평균 별점입니다. 군집 크기를 언급 비중으로 해석하세요.
+빈도와 비율은 통계를, 인용과 맥락은 표본을 근거로 하세요.
 마크다운 형식으로 작성하세요."""
 
 
@@ -88,6 +94,9 @@ QNA_ANALYSIS_PROMPT = """당신은 이커머스 고객 문의 분석 전문가
 ### 7. 개선 제안
 상품 설명에서 보완이 필요한 부분
 
+'카테고리 집계'와 '질문 키워드 통계'는 전체 문의를 로컬에서 분류·집계한 값이고,
+Q&A 표본은 카테고리별로 고른 일부입니다. 비율·답변률·응답 지연은 집계를,
+질문 내용과 답변 패턴은 표본을 근거로 하세요.
 마크다운 형식으로 작성하세요."""
 
 
@@ -199,3 +208,53 @@ Q&A 분석 결과 기반. 응답률, 응답 품질(맞춤형 vs 복사붙여넣
 한 문단 최종 결론
 
 마크다운 형식으로 작성하세요."""
+
+
+COMPARISON_PROMPT = """당신은 이커머스 경쟁 상품 분석 전문가입니다.
+아래는 여러 상품의 비교 지표 표와 상품별 분석 결과입니다.
+첫 번째 상품이 기준 상품(자사 상품)이고 나머지는 경쟁 상품입니다.
+
+다음 항목을 분석하세요:
+
+### 1. 한눈에 보는 비교
+가격, 별점, 리뷰 수, 답변률 등 핵심 지표를 상품별로 나란히 정리한 표
+
+### 2. 상품별 강점과 약점
+각 상품의 차별화 포인트와 반복되는 불만을 한두 줄로 요약
+
+### 3. 고객이 선택하는 이유 / 떠나는 이유
+리뷰·Q&A에서 드러나는 구매 결정 요인을 상품 간 비교
+
+### 4. 기준 상품의 포지셔닝
+경쟁 상품 대비 현재 위치와 열세 영역
+
+### 5. 우선 개선 과제 TOP 3
+경쟁 상품과의 격차를 줄이기 위한 구체적 실행 과제
+
+지표 표의 수치는 수집 데이터로 계산한 값이므로 그대로 인용하고, 근거 없는 추정은 하지 마세요.
+마크다운 형식으로 작성하세요."""
+
+
+DELTA_PROMPT = """당신은 이커머스 상품 모니터링 분석가입니다.
+아래는 정기 수집에서 이전 회차 이후 새로 들어온 리뷰·문의와 회차별 추이입니다.
+이미 분석된 기존 리뷰는 별점 분포로만 주어집니다.
+
+다음 항목을 분석하세요:
+
+### 1. 변화 요약
+이번 기간에 무엇이 달라졌는지 3줄 이내로
+
+### 2. 별점 추이
+회차별 표시 별점·리뷰 수 흐름과 신규 리뷰 별점 분포를 기존과 비교
+
+### 3. 새로 등장한 칭찬 / 불만
+'신규 리뷰에서 늘어난 키워드'와 신규 리뷰 인용을 근거로
+
+### 4. 신규 문의 동향
+새로 늘어난 문의 유형과 판매자 응답 상황 (새로 답변된 문의 포함)
+
+### 5. 주의가 필요한 신호
+품질 이슈 재발, 별점 하락, 가격 변동 등 바로 확인해야 할 항목 (없으면 "없음")
+
+추이 표와 분포의 수치는 그대로 인용하고, 신규 데이터에 없는 내용은 추정하지 마세요.
+마크다운 형식으로 작성하세요."""
@@ -1,45 +1,62 @@
 """Q&A 카테고리 분석기"""
 
 import json
+from typing import Iterator
 
 from analyzer.ai_client import AIClient
 from analyzer.prompts import QNA_ANALYSIS_PROMPT
-from config.settings import MAX_TOKENS_QNA
+from analyzer.keywords import qna_keyword_table
+from analyzer.qna_categories import CATEGORY_RULES, category_stats, format_category_table
+from config.settings import MAX_TOKENS_QNA, KEYWORD_TOP_N, QNA_PROMPT_SAMPLE
+from models.records import QnASet
 
 
 class QnAAnalyzer:
     def __init__(self, ai_client: AIClient):
         self.ai = ai_client
 
-    def analyze(self, qna_pairs: list[dict]) -> str:
+    def analyze(self, qna_pairs: QnASet) -> str:
         """Q&A 데이터를 AI로 카테고리 분석"""
         if not qna_pairs:
             return "분석할 Q&A가 없습니다."
 
-        qna_data = self._prepare_data(qna_pairs)
-        user_data = (
-            f"## Q&A 데이터 ({len(qna_pairs)}건)\n"
-            f"```json\n{qna_data}\n```"
+        return self.ai.analyze(
+            QNA_ANALYSIS_PROMPT,
+            self._build_user_data(qna_pairs),
+            MAX_TOKENS_QNA,
         )
 
-        return self.ai.analyze(
+    def analyze_stream(self, qna_pairs: QnASet) -> Iterator[str]:
+        """analyze()의 스트리밍 버전"""
+        if not qna_pairs:
+            yield "분석할 Q&A가 없습니다."
+            return
+
+        yield from self.ai.analyze_stream(
             QNA_ANALYSIS_PROMPT,
-            user_data,
+            self._build_user_data(qna_pairs),
             MAX_TOKENS_QNA,
         )
 
-    def _prepare_data(self, qna_pairs: list[dict]) -> str:
-        clean = []
-        for q in qna_pairs:
-            clean.append({
-                "question": q.get("question", ""),
-                "answer": q.get("answer", ""),
-                "q_date": q.get("q_date", ""),
-                "seller": q.get("seller", ""),
-            })
-
-        # 토큰 제한
-        if len(clean) > 50:
-            clean = clean[:50]
-
-        return json.dumps(clean, ensure_ascii=False, indent=1)
+    def _build_user_data(self, qna_pairs: QnASet) -> str:
+        # 전체 문의를 로컬에서 분류해 집계 + 카테고리별 표본만 전달
+        per_category = max(2, QNA_PROMPT_SAMPLE // (len(CATEGORY_RULES) + 1))
+        stats = category_stats(qna_pairs, per_category)
+        qna_data = self._prepare_data(qna_pairs, stats)
+        keywords = qna_keyword_table(qna_pairs, KEYWORD_TOP_N)
+        return (
+            f"## 카테고리 집계\n{format_category_table(stats, len(qna_pairs))}\n\n"
+            f"## 질문 키워드 통계\n{keywords or '추출된 키워드 없음'}\n\n"
+            f"## 카테고리별 Q&A 표본 (전체 {len(qna_pairs)}건 중 일부)\n"
+            f"```json\n{qna_data}\n```"
+        )
+
+    def _prepare_data(self, qna_pairs: QnASet, stats) -> str:
+        grouped = {}
+        for s in stats:
+            grouped[s.name] = [
+                {"question": q.question, "answer": q.answer, "q_date": q.q_date, "seller": q.seller}
+                for q in (qna_pairs[i] for i in s.samples)
+            ]
+
+        return json.dumps(grouped, ensure_ascii=False, indent=1)
@@ -0,0 +1,146 @@
+"""Q&A 로컬 분류기 (규칙 + 나이브 베이즈)
+
+모든 질문에 카테고리를 붙이고 카테고리별 답변률·판매자 응답 지연을 계산한다.
+1. 정규식 규칙으로 분류 (여러 카테고리 가능)
+2. 규칙에 걸리지 않은 질문은 규칙으로 분류된 질문을 학습 데이터로 한
+   다항 나이브 베이즈가 확신할 때만 분류, 아니면 "기타"
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+
+from analyzer.keywords import tokenize
+from models.records import QnASet, QnAPair
+
+OTHER = "기타"
+
+CATEGORY_RULES = {
+    "배송": r"배송|배달|택배|도착|출고|발송|언제\s*(오|받|와)|당일|새벽|로켓",
+    "사이즈": r"사이즈|치수|크기|길이|둘레|인치|\d+\s*(cm|mm|센치|미리)|호수|(오버|슬림|레귤러|루즈|와이드|정)\s*핏|핏\s*(이|은|감|어때)|작나요|크나요|정사이즈",
+    "성분/소재": r"성분|소재|재질|원료|함량|알레르기|알러지|원산지|유통기한|첨가|면\s*\d+|폴리|스테인리스|BPA",
+    "AS/고장": r"A/?S|수리|고장|불량|작동|(전원|충전)\S{0,2}\s*안\s*(돼|되|켜)|안\s*켜져|보증|파손|깨[져졌]|충전이",
+    "재입고/품절": r"재입고|입고\s*(예정|일정|일자|날짜|언제|되|될|돼)|품절|재고|언제\s*다시|판매\s*재개|리오더",
+    "교환/환불": r"교환|환불|반품|취소|회수",
+    "사용법/호환": r"사용\s*(법|방법)|호환|설치|연결|세탁|세척|사용\s*가능|쓸\s*수",
+    "가격/구성": r"가격|할인|쿠폰|구성|수량|몇\s*개|세트|개입|증정|사은품",
+}
+_COMPILED = {name: re.compile(pattern, re.IGNORECASE) for name, pattern in CATEGORY_RULES.items()}
+
+NB_MIN_TRAINING = 20    # 이보다 규칙 분류 질문이 적으면 베이즈 단계 생략
+NB_MIN_MARGIN = 2.0     # 1·2위 로그확률 차이가 이 이상일 때만 채택
+
+
+@dataclass(slots=True)
+class CategoryStat:
+    name: str
+    count: int = 0
+    answered: int = 0
+    delays: list[int] = field(default_factory=list)   # 답변까지 걸린 일수
+    samples: list[int] = field(default_factory=list)  # QnASet 인덱스
+
+    @property
+    def answer_rate(self) -> float:
+        return self.answered / self.count * 100 if self.count else 0.0
+
+    @property
+    def median_delay(self) -> float | None:
+        if not self.delays:
+            return None
+        d = sorted(self.delays)
+        mid = len(d) // 2
+        return float(d[mid]) if len(d) % 2 else (d[mid - 1] + d[mid]) / 2
+
+
+def rule_categories(question: str) -> list[str]:
+    return [name for name, pattern in _COMPILED.items() if pattern.search(question)]
+
+
+class _NaiveBayes:
+    """규칙으로 라벨링된 질문으로 학습하는 다항 나이브 베이즈"""
+
+    def __init__(self, docs: list[list[str]], labels: list[str]):
+        self.priors = Counter(labels)
+        self.counts = {label: Counter() for label in self.priors}
+        for tokens, label in zip(docs, labels):
+            self.counts[label].update(tokens)
+        self.totals = {label: sum(c.values()) for label, c in self.counts.items()}
+        self.vocab = len({t for c in self.counts.values() for t in c})
+        self.n = len(labels)
+
+    def predict(self, tokens: list[str]) -> str | None:
+        if not tokens:
+            return None
+        scores = []
+        for label, prior in self.priors.items():
+            counts, total = self.counts[label], self.totals[label]
+            score = math.log(prior / self.n) + sum(
+                math.log((counts[t] + 1) / (total + self.vocab)) for t in tokens
+            )
+            scores.append((score, label))
+        scores.sort(reverse=True)
+        if len(scores) > 1 and scores[0][0] - scores[1][0] < NB_MIN_MARGIN:
+            return None
+        return scores[0][1]
+
+
+def _delay_days(pair: QnAPair) -> int | None:
+    try:
+        delay = (date.fromisoformat(pair.a_date) - date.fromisoformat(pair.q_date)).days
+    except ValueError:
+        return None
+    return delay if delay >= 0 else None
+
+
+def categorize(qna_pairs: QnASet) -> list[list[str]]:
+    """질문별 카테고리 목록 (QnASet 순서)"""
+    questions = qna_pairs.column("question")
+    labels = [rule_categories(q) for q in questions]
+
+    # 단일 카테고리로 분류된 질문만 학습에 사용 (다중 라벨은 노이즈)
+    train = [(tokenize(q), cats[0]) for q, cats in zip(questions, labels) if len(cats) == 1]
+    model = None
+    if len(train) >= NB_MIN_TRAINING and len({label for _, label in train}) > 1:
+        model = _NaiveBayes([t for t, _ in train], [label for _, label in train])
+
+    for i, cats in enumerate(labels):
+        if cats:
+            continue
+        guess = model.predict(tokenize(questions[i])) if model else None
+        cats.append(guess or OTHER)
+    return labels
+
+
+def category_stats(qna_pairs: QnASet, samples_per_category: int = 3) -> list[CategoryStat]:
+    """카테고리별 건수·답변률·응답 지연·표본 (건수 내림차순)"""
+    stats: dict[str, CategoryStat] = {}
+    for i, (pair, cats) in enumerate(zip(qna_pairs, categorize(qna_pairs))):
+        answered = pair.is_answered
+        delay = _delay_days(pair) if answered else None
+        for name in cats:
+            stat = stats.setdefault(name, CategoryStat(name))
+            stat.count += 1
+            if answered:
+                stat.answered += 1
+            if delay is not None:
+                stat.delays.append(delay)
+            # 비밀글은 내용이 없으므로 표본에서 제외
+            if len(stat.samples) < samples_per_category and not pair.is_secret:
+                stat.samples.append(i)
+    return sorted(stats.values(), key=lambda s: -s.count)
+
+
+def format_category_table(stats: list[CategoryStat], total: int) -> str:
+    """카테고리 집계 마크다운 표"""
+    lines = [
+        f"전체 문의 {total}건 기준 (한 문의가 여러 카테고리에 속할 수 있음)",
+        "| 카테고리 | 문의 수 | 비율 | 답변률 | 답변까지 중앙값(일) |",
+        "|---|---|---|---|---|",
+    ]
+    for s in stats:
+        delay = f"{s.median_delay:g}" if s.median_delay is not None else "-"
+        pct = s.count / total * 100 if total else 0
+        lines.append(f"| {s.name} | {s.count} | {pct:.1f}% | {s.answer_rate:.1f}% | {delay} |")
+    return "\n".join(lines)
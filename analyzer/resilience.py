@@ -0,0 +1,265 @@
+"""AI API 호출 안정화 계층 (타임아웃 + 지수 백오프 재시도 + 헤지 요청)
+
+- 재시도: 429/5xx/연결 오류만 대상. Retry-After 헤더가 있으면 그만큼 이상 대기.
+- 데드라인: 재시도를 포함한 호출 전체가 AI_CALL_DEADLINE을 넘지 않도록 제한.
+  각 시도의 요청 타임아웃도 남은 시간으로 줄여서 전달 (fn(timeout) / make_stream(timeout)).
+- 헤지: 첫 텍스트 조각 도착 시점(TTFT)이 p95를 넘기면 동일 스트림을 하나 더 열고
+  먼저 응답한 쪽 사용. 진 스트림은 register_stream_closer()로 등록된 연결을 소비 측에서
+  바로 끊는다 (단건 호출도 헤지할 때는 스트림으로 받아 합침 — AIClient._run).
+"""
+
+import queue
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, TypeVar
+
+from config.settings import (
+    AI_MAX_RETRIES,
+    AI_CALL_DEADLINE,
+    AI_REQUEST_TIMEOUT,
+    AI_RETRY_BASE_DELAY,
+    AI_RETRY_MAX_DELAY,
+    AI_HEDGE_MIN_SAMPLES,
+)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+def is_retryable(exc: Exception) -> bool:
+    """일시적 오류(레이트 리밋, 서버 오류, 연결/타임아웃)인지 판별."""
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    # openai/anthropic SDK 공통: APIConnectionError, APITimeoutError
+    name = type(exc).__name__
+    return name in ("APIConnectionError", "APITimeoutError") or isinstance(
+        exc, (ConnectionError, TimeoutError)
+    )
+
+
+def retry_after_seconds(exc: Exception) -> float | None:
+    """응답의 Retry-After(-ms) 헤더를 초 단위로 변환. 없으면 None."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    ms = headers.get("retry-after-ms")
+    if ms:
+        try:
+            return float(ms) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """지수 백오프 + full jitter. Retry-After가 있으면 그 값이 하한."""
+    cap = min(AI_RETRY_MAX_DELAY, AI_RETRY_BASE_DELAY * (2 ** attempt))
+    delay = random.uniform(0, cap)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class LatencyTracker:
+    """최근 호출 지연 기록 (p95 기반 헤지 시점 계산용)"""
+
+    def __init__(self, window: int = 50):
+        self._window = window
+        self._samples: list[float] = []
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+            if len(self._samples) > self._window:
+                self._samples = self._samples[-self._window:]
+
+    def percentile(self, q: float = 0.95) -> float | None:
+        with self._lock:
+            if len(self._samples) < AI_HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        idx = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[idx]
+
+
+class _StreamSlot:
+    """헤지 스트림 하나의 취소 상태와 열린 연결을 닫는 함수 목록 (다른 스레드에서 취소 가능)"""
+
+    def __init__(self):
+        self.cancelled = False
+        self._closers: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def register(self, close: Callable[[], None]):
+        with self._lock:
+            if not self.cancelled:
+                self._closers.append(close)
+                return
+        _close_quietly(close)  # 이미 취소됨 — 열자마자 닫음
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            closers, self._closers = self._closers, []
+        for close in closers:
+            _close_quietly(close)
+
+
+def _close_quietly(close: Callable[[], None]):
+    try:
+        close()
+    except Exception:
+        pass
+
+
+# 헤지 스트림 스레드별 슬롯 (헤지 밖에서는 없음)
+_local = threading.local()
+
+
+def register_stream_closer(close: Callable[[], None]):
+    """SDK 스트림을 연 직후 호출. 헤지에서 진 쪽이면 소비 측이 이 함수로 연결을 바로 끊는다."""
+    slot = getattr(_local, "slot", None)
+    if slot is not None:
+        slot.register(close)
+
+
+def _stream_cancelled() -> bool:
+    slot = getattr(_local, "slot", None)
+    return slot is not None and slot.cancelled
+
+
+def _attempt_timeout(deadline: float) -> float:
+    """이번 시도의 요청 타임아웃: AI_REQUEST_TIMEOUT과 데드라인까지 남은 시간 중 작은 값"""
+    return max(min(AI_REQUEST_TIMEOUT, deadline - time.monotonic()), 1.0)
+
+
+def _sleep_before_retry(exc: Exception, attempt: int, deadline: float):
+    """재시도 가능하면 대기 후 반환, 불가능하면 예외 재발생."""
+    if not is_retryable(exc) or attempt >= AI_MAX_RETRIES:
+        raise exc
+    delay = backoff_delay(attempt, retry_after_seconds(exc))
+    if time.monotonic() + delay > deadline:
+        raise exc
+    print(f"[AI] 일시 오류 ({exc.__class__.__name__}) — {delay:.1f}초 후 재시도 ({attempt + 1}/{AI_MAX_RETRIES})")
+    time.sleep(delay)
+
+
+def call_with_retry(fn: Callable[[float], T]) -> T:
+    """fn(timeout)을 일시 오류에 한해 재시도하며 실행."""
+    deadline = time.monotonic() + AI_CALL_DEADLINE
+    attempt = 0
+    while True:
+        try:
+            return fn(_attempt_timeout(deadline))
+        except Exception as e:
+            _sleep_before_retry(e, attempt, deadline)
+            attempt += 1
+
+
+def stream_with_retry(make_stream: Callable[[float], Iterator[str]]) -> Iterator[str]:
+    """make_stream(timeout)을 재시도하며 yield. 이미 화면에 나간 조각은 되돌릴 수 없으므로
+    첫 조각 이전의 실패만 재시도한다 (헤지에서 져서 끊긴 스트림은 재시도하지 않음)."""
+    deadline = time.monotonic() + AI_CALL_DEADLINE
+    attempt = 0
+    while True:
+        started = False
+        try:
+            for chunk in make_stream(_attempt_timeout(deadline)):
+                started = True
+                yield chunk
+            return
+        except Exception as e:
+            if started or _stream_cancelled():
+                raise
+            _sleep_before_retry(e, attempt, deadline)
+            if _stream_cancelled():
+                raise  # 대기 중에 헤지에서 짐
+            attempt += 1
+
+
+def hedged_stream(
+    make_stream: Callable[[], Iterator[str]], hedge_after: float
+) -> Iterator[str]:
+    """첫 조각이 hedge_after초 안에 오지 않으면 백업 스트림을 열고,
+    먼저 첫 조각을 보낸 스트림만 끝까지 사용. 진 스트림은 그 즉시 연결을 끊는다."""
+    events: queue.Queue = queue.Queue()
+    slots = [_StreamSlot(), _StreamSlot()]
+
+    def pump(idx: int):
+        _local.slot = slots[idx]
+        stream = make_stream()
+        try:
+            for chunk in stream:
+                if slots[idx].cancelled:
+                    return
+                events.put((idx, "chunk", chunk))
+            events.put((idx, "done", None))
+        except Exception as e:
+            events.put((idx, "error", e))
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+    def start(idx: int):
+        threading.Thread(target=pump, args=(idx,), daemon=True).start()
+
+    start(0)
+    running = 1
+    hedged = False
+    winner = None
+
+    try:
+        while True:
+            try:
+                timeout = hedge_after if (winner is None and not hedged) else None
+                idx, kind, payload = events.get(timeout=timeout)
+            except queue.Empty:
+                print(f"[AI] 첫 응답 {hedge_after:.1f}초 초과 — 헤지 스트림 시작")
+                hedged = True
+                running += 1
+                start(1)
+                continue
+
+            if winner is not None and idx != winner:
+                continue
+
+            if kind == "chunk":
+                if winner is None:
+                    winner = idx
+                    # 진 쪽은 첫 토큰을 기다리지 않고 연결을 끊어 생성(과금)을 멈춤
+                    slots[1 - idx].cancel()
+                yield payload
+            elif kind == "done":
+                return
+            else:
+                if winner is not None:
+                    raise payload
+                # 첫 조각 전 실패 (재시도 소진): 다른 스트림이 살아 있으면 계속 대기
+                running -= 1
+                if running == 0:
+                    raise payload
+                # 실패한 쪽 때문에 헤지가 다시 시작되지 않도록 표시
+                hedged = True
+    finally:
+        # 소비 측이 중간에 그만둔 경우 등 — 아직 열린 스트림 정리
+        for slot in slots:
+            slot.cancel()
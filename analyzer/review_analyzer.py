@@ -1,73 +1,83 @@
 """리뷰 감성 분석기"""
 
 import json
+from typing import Iterator
 
 from analyzer.ai_client import AIClient
 from analyzer.prompts import REVIEW_SENTIMENT_PROMPT
-from config.settings import MAX_TOKENS_REVIEW
+from analyzer.review_stats import compute_review_stats, format_stats_for_prompt
+from analyzer.keywords import review_keyword_table
+from analyzer.review_clusters import cluster_reviews
+from config.settings import (
+    MAX_TOKENS_REVIEW,
+    KEYWORD_TOP_N,
+    REVIEW_PROMPT_SAMPLE,
+    REVIEW_CLUSTERS,
+)
+from models.records import ReviewSet
 
 
 class ReviewAnalyzer:
     def __init__(self, ai_client: AIClient):
         self.ai = ai_client
 
-    def analyze(self, reviews: list[dict]) -> str:
+    def analyze(self, reviews: ReviewSet) -> str:
         """리뷰 데이터를 AI로 감성 분석"""
         if not reviews:
             return "분석할 리뷰가 없습니다."
 
-        # 리뷰 데이터를 JSON으로 정리 (토큰 절약 위해 핵심 필드만)
-        review_data = self._prepare_data(reviews)
-
-        # 별점 분포 통계 추가
-        stats = self._calc_stats(reviews)
-        user_data = (
-            f"## 별점 분포\n{stats}\n\n"
-            f"## 리뷰 데이터 ({len(reviews)}건)\n"
-            f"```json\n{review_data}\n```"
+        return self.ai.analyze(
+            REVIEW_SENTIMENT_PROMPT,
+            self._build_user_data(reviews),
+            MAX_TOKENS_REVIEW,
         )
 
-        return self.ai.analyze(
+    def analyze_stream(self, reviews: ReviewSet) -> Iterator[str]:
+        """analyze()의 스트리밍 버전"""
+        if not reviews:
+            yield "분석할 리뷰가 없습니다."
+            return
+
+        yield from self.ai.analyze_stream(
             REVIEW_SENTIMENT_PROMPT,
-            user_data,
+            self._build_user_data(reviews),
             MAX_TOKENS_REVIEW,
         )
 
-    def _prepare_data(self, reviews: list[dict]) -> str:
-        """AI에 전달할 리뷰 데이터 정리 (토큰 절약)"""
-        clean = []
-        for r in reviews:
-            entry = {
-                "rating": r.get("rating"),
-                "date": r.get("date", ""),
-                "content": r.get("content", ""),
-            }
-            # headline이 있으면 content에 합치기
-            if r.get("headline"):
-                entry["content"] = f"{r['headline']} {entry['content']}".strip()
-            clean.append(entry)
+    def _build_user_data(self, reviews: ReviewSet) -> str:
+        # 리뷰 데이터를 JSON으로 정리 (토큰 절약 위해 핵심 필드만)
+        review_data = self._prepare_data(reviews)
 
-        # 토큰 제한: 리뷰가 너무 많으면 앞뒤 50개씩만
-        if len(clean) > 100:
-            clean = clean[:50] + clean[-50:]
+        # 별점 분포·추이 통계 추가
+        stats = format_stats_for_prompt(compute_review_stats(reviews))
+        keywords = review_keyword_table(reviews, KEYWORD_TOP_N)
+        sample = min(len(reviews), REVIEW_PROMPT_SAMPLE)
+        scope = f"표본 {len(reviews)}건, 별점 가중 보정" if reviews.is_sample else f"전체 {len(reviews)}건"
+        return (
+            f"## 별점 분포\n{stats}\n\n"
+            f"## 키워드 통계 ({scope})\n{keywords or '추출된 키워드 없음'}\n\n"
+            f"## 리뷰 데이터 (수집 {len(reviews)}건 중 {sample}건)\n"
+            f"```json\n{review_data}\n```"
+        )
 
-        return json.dumps(clean, ensure_ascii=False, indent=1)
+    def _prepare_data(self, reviews: ReviewSet) -> str:
+        """AI에 전달할 리뷰 데이터 정리 (토큰 절약)"""
+        def entry(r):
+            # headline은 content에 합쳐서 전달
+            return {"rating": r.rating, "date": r.date, "content": r.text}
 
-    def _calc_stats(self, reviews: list[dict]) -> str:
-        """별점 분포 통계"""
-        dist = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
-        for r in reviews:
-            rating = r.get("rating")
-            if rating is not None:
-                key = int(round(rating))
-                if key in dist:
-                    dist[key] += 1
+        if len(reviews) <= REVIEW_PROMPT_SAMPLE:
+            return json.dumps([entry(r) for r in reviews], ensure_ascii=False, indent=1)
 
-        total = sum(dist.values())
-        lines = []
-        for star in [5, 4, 3, 2, 1]:
-            count = dist[star]
-            pct = (count / total * 100) if total > 0 else 0
-            lines.append(f"- {star}점: {count}건 ({pct:.1f}%)")
-        lines.append(f"- 합계: {total}건")
-        return "\n".join(lines)
+        # 토큰 제한: 비슷한 리뷰끼리 묶어 군집별 대표 리뷰만 전달
+        clusters = cluster_reviews(reviews, REVIEW_PROMPT_SAMPLE, REVIEW_CLUSTERS)
+        grouped = [
+            {
+                "cluster": n,
+                "size": c.size,
+                "avg_rating": c.mean_rating,
+                "reviews": [entry(reviews[i]) for i in c.exemplars],
+            }
+            for n, c in enumerate(clusters, 1)
+        ]
+        return json.dumps(grouped, ensure_ascii=False, indent=1)
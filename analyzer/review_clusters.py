@@ -0,0 +1,123 @@
+"""리뷰 군집화로 대표 리뷰 선정 (해시 TF-IDF + 미니배치 k-means)
+
+앞뒤 N건을 자르는 대신, 내용이 비슷한 리뷰끼리 묶고 군집마다 중심에 가장 가까운
+리뷰 1~2건을 골라 군집 크기와 함께 AI에 보낸다. 외부 모델 없이 CPU에서 동작하며
+1만 건 기준 수 초 이내.
+"""
+
+import zlib
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from analyzer.keywords import terms
+from models.records import ReviewSet
+
+HASH_DIM = 1024
+
+
+@dataclass(slots=True)
+class ReviewCluster:
+    size: int
+    mean_rating: float | None
+    exemplars: list[int] = field(default_factory=list)  # ReviewSet 인덱스 (중심에 가까운 순)
+
+
+def _hash_term(term: str) -> tuple[int, float]:
+    h = zlib.crc32(term.encode("utf-8"))
+    return h % HASH_DIM, (1.0 if (h >> 31) & 1 else -1.0)
+
+
+def embed(texts: list[str]) -> np.ndarray:
+    """텍스트 → L2 정규화된 해시 TF-IDF 벡터 (n × HASH_DIM, float32)"""
+    rows, cols, signs = [], [], []
+    cache: dict[str, tuple[int, float]] = {}
+    for i, text in enumerate(texts):
+        for term in terms(text):
+            col, sign = cache.get(term) or cache.setdefault(term, _hash_term(term))
+            rows.append(i)
+            cols.append(col)
+            signs.append(sign)
+
+    X = np.zeros((len(texts), HASH_DIM), dtype=np.float32)
+    np.add.at(X, (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)), signs)
+
+    df = np.count_nonzero(X, axis=0)
+    X *= (np.log((1 + len(texts)) / (1 + df)) + 1).astype(np.float32)
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    X /= np.where(norms == 0, 1, norms)
+    return X
+
+
+def _init_centers(X: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """k-means++ 초기화 (코사인 거리, 표본 최대 2000건)"""
+    sample = X[rng.choice(len(X), size=min(len(X), 2000), replace=False)]
+    centers = [sample[rng.integers(len(sample))]]
+    best = 1 - sample @ centers[0]
+    for _ in range(1, k):
+        weights = np.maximum(best, 0).astype(np.float64) ** 2
+        total = weights.sum()
+        idx = rng.choice(len(sample), p=weights / total) if total > 0 else rng.integers(len(sample))
+        centers.append(sample[idx])
+        best = np.minimum(best, 1 - sample @ sample[idx])
+    return np.array(centers)
+
+
+def minibatch_kmeans(
+    X: np.ndarray, k: int, batch_size: int = 256, iterations: int = 60, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """구면 미니배치 k-means (Sculley 2010). (중심 k × d, 전체 라벨) 반환"""
+    rng = np.random.default_rng(seed)
+    centers = _init_centers(X, k, rng)
+    counts = np.zeros(k)
+    for _ in range(iterations):
+        batch = X[rng.choice(len(X), size=min(batch_size, len(X)), replace=False)]
+        labels = np.argmax(batch @ centers.T, axis=1)
+        for c in np.unique(labels):
+            members = batch[labels == c]
+            counts[c] += len(members)
+            eta = len(members) / counts[c]
+            centers[c] = (1 - eta) * centers[c] + eta * members.mean(axis=0)
+        norms = np.linalg.norm(centers, axis=1, keepdims=True)
+        centers /= np.where(norms == 0, 1, norms)
+    return centers, np.argmax(X @ centers.T, axis=1)
+
+
+def cluster_reviews(reviews: ReviewSet, budget: int, n_clusters: int) -> list[ReviewCluster]:
+    """본문이 있는 리뷰를 군집화하고 총 budget건 이내로 군집별 대표 리뷰 선정.
+
+    군집은 크기 내림차순. 모든 군집에 1건, 남는 예산은 큰 군집부터 1건씩 추가.
+    """
+    texts = [f"{h} {c}".strip() for h, c in zip(reviews.column("headline"), reviews.column("content"))]
+    indices = np.array([i for i, t in enumerate(texts) if t], dtype=np.int64)
+    if len(indices) == 0:
+        return []
+
+    k = max(1, min(n_clusters, budget, len(indices) // 3))
+    X = embed([texts[i] for i in indices])
+    centers, labels = minibatch_kmeans(X, k)
+    similarity = np.einsum("ij,ij->i", X, centers[labels])
+
+    ratings = np.frombuffer(reviews.column("rating"), dtype=np.float64)[indices]
+    clusters, seconds = [], []
+    for c in np.argsort(-np.bincount(labels, minlength=k), kind="stable"):
+        members = np.flatnonzero(labels == c)
+        if len(members) == 0:
+            continue
+        order = members[np.argsort(-similarity[members])]
+        rated = ratings[members][~np.isnan(ratings[members])]
+        clusters.append(ReviewCluster(
+            size=len(members),
+            mean_rating=round(float(rated.mean()), 2) if len(rated) else None,
+            exemplars=[int(indices[order[0]])],
+        ))
+        seconds.append(int(indices[order[1]]) if len(order) > 1 else None)
+
+    remaining = budget - len(clusters)
+    for cluster, second in zip(clusters, seconds):
+        if remaining <= 0:
+            break
+        if second is not None:
+            cluster.exemplars.append(second)
+            remaining -= 1
+    return clusters
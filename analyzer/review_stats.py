@@ -0,0 +1,218 @@
+"""리뷰 통계 (NumPy 벡터 연산)
+
+ReviewSet의 열(array)을 복사 없이 NumPy 배열로 보고 한 번에 계산한다.
+프롬프트(ReviewAnalyzer), 수집 요약(app), Excel 통계 시트가 같은 결과를 공유한다.
+층화 표본(reviews.weights)이면 별점 분포·평균·기간별/옵션별 건수와 평균을 가중 추정치로 낸다
+(건수는 표본 크기에 맞춘 추정 건수, total/rated는 실제 표본 건수).
+"""
+
+import re
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from models.records import ReviewSet
+
+STARS = (5, 4, 3, 2, 1)
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@dataclass(slots=True)
+class PeriodStat:
+    period: str             # 월: YYYY-MM, 주: 해당 주 월요일 YYYY-MM-DD
+    count: int
+    mean: float | None      # 별점 없는 리뷰만 있으면 None
+
+
+@dataclass(slots=True)
+class OptionStat:
+    option: str
+    count: int
+    mean: float | None
+
+
+@dataclass(slots=True)
+class ReviewStats:
+    total: int = 0
+    rated: int = 0
+    histogram: dict[int, int] = field(default_factory=lambda: dict.fromkeys(STARS, 0))
+    mean: float | None = None
+    median: float | None = None
+    helpful_weighted_mean: float | None = None
+    length: dict[str, float] = field(default_factory=dict)  # 본문 글자 수 min/p25/median/p75/max/mean
+    monthly: list[PeriodStat] = field(default_factory=list)
+    weekly: list[PeriodStat] = field(default_factory=list)
+    options: list[OptionStat] = field(default_factory=list)
+    weighted: bool = False  # 층화 표본 가중 추정치 여부
+
+    def pct(self, star: int) -> float:
+        return self.histogram[star] / self.rated * 100 if self.rated else 0.0
+
+
+def _as_array(column, dtype) -> np.ndarray:
+    """array 열을 복사 없이 ndarray로 변환 (빈 열 포함)"""
+    if len(column) == 0:
+        return np.empty(0, dtype=dtype)
+    return np.frombuffer(column, dtype=dtype)
+
+
+def _group_means(keys: np.ndarray, ratings: np.ndarray, weights: np.ndarray | None = None):
+    """keys별 (고유키, 건수, 별점 평균). 평균 계산 시 NaN 별점은 제외.
+
+    weights가 있으면 건수는 반올림한 가중 건수, 평균은 가중 평균.
+    """
+    uniq, inverse = np.unique(keys, return_inverse=True)
+    valid = ~np.isnan(ratings)
+    if weights is None:
+        counts = np.bincount(inverse, minlength=len(uniq))
+        rated = np.bincount(inverse[valid], minlength=len(uniq))
+        sums = np.bincount(inverse[valid], weights=ratings[valid], minlength=len(uniq))
+    else:
+        counts = np.rint(np.bincount(inverse, weights=weights, minlength=len(uniq))).astype(np.int64)
+        rated = np.bincount(inverse[valid], weights=weights[valid], minlength=len(uniq))
+        sums = np.bincount(inverse[valid], weights=ratings[valid] * weights[valid], minlength=len(uniq))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / rated
+    return uniq, counts, means
+
+
+def _mean_or_none(value) -> float | None:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def _weighted_median(values: np.ndarray, weights: np.ndarray) -> float:
+    """누적 가중치가 절반을 넘는 첫 값 (별점은 이산값이라 보간하지 않음)"""
+    order = np.argsort(values, kind="stable")
+    cum = np.cumsum(weights[order])
+    return float(values[order][np.searchsorted(cum, cum[-1] / 2)])
+
+
+def _period_stats(
+    dates: np.ndarray, ratings: np.ndarray, unit: str, weights: np.ndarray | None = None,
+) -> list[PeriodStat]:
+    has_date = ~np.isnat(dates)
+    if not has_date.any():
+        return []
+    d = dates[has_date]
+    if unit == "M":
+        keys = d.astype("datetime64[M]")
+    else:
+        # 1970-01-01은 목요일 → +3 후 7로 나눈 나머지만큼 빼면 그 주 월요일
+        days = d.astype(np.int64)
+        keys = (days - (days + 3) % 7).astype("datetime64[D]")
+    w = weights[has_date] if weights is not None else None
+    uniq, counts, means = _group_means(keys, ratings[has_date], w)
+    return [
+        PeriodStat(str(k), int(c), _mean_or_none(m))
+        for k, c, m in zip(uniq, counts, means)
+    ]
+
+
+def compute_review_stats(reviews: ReviewSet, top_options: int = 10) -> ReviewStats:
+    """별점 분포·평균/중앙값·도움수 가중 평균·기간별 추이·본문 길이·옵션별 통계를 계산."""
+    stats = ReviewStats(total=len(reviews), weighted=reviews.is_sample)
+    if not reviews:
+        return stats
+
+    ratings = _as_array(reviews.column("rating"), np.float64)
+    helpful = _as_array(reviews.column("helpful"), np.int64)
+    sample_w = _as_array(reviews.weights, np.float64) if reviews.is_sample else None
+
+    valid = ~np.isnan(ratings)
+    rated = ratings[valid]
+    stats.rated = int(rated.size)
+    if rated.size:
+        stars = np.clip(np.rint(rated).astype(np.int64), 0, 6)
+        if sample_w is None:
+            counts = np.bincount(stars, minlength=7)
+            stats.mean = round(float(rated.mean()), 2)
+            stats.median = float(np.median(rated))
+            w = np.ones_like(rated)
+        else:
+            # 가중 건수를 표본 별점 건수에 맞춰 반올림 (합계가 rated와 거의 같게)
+            w = sample_w[valid]
+            counts = np.rint(np.bincount(stars, weights=w, minlength=7) * rated.size / w.sum())
+            stats.mean = round(float(np.average(rated, weights=w)), 2)
+            stats.median = _weighted_median(rated, w)
+        stats.histogram = {s: int(counts[s]) for s in STARS}
+        # 도움 0인 리뷰도 반영되도록 가중치는 helpful + 1
+        weights = (np.maximum(helpful[valid], 0) + 1) * w
+        stats.helpful_weighted_mean = round(float(np.average(rated, weights=weights)), 2)
+
+    content = reviews.column("content")
+    lengths = np.fromiter((len(c) for c in content), dtype=np.int64, count=len(content))
+    q = np.percentile(lengths, [0, 25, 50, 75, 100])
+    stats.length = {
+        "min": int(q[0]), "p25": float(q[1]), "median": float(q[2]),
+        "p75": float(q[3]), "max": int(q[4]), "mean": round(float(lengths.mean()), 1),
+    }
+
+    dates = _to_dates(reviews.column("date"))
+    stats.monthly = _period_stats(dates, ratings, "M", sample_w)
+    stats.weekly = _period_stats(dates, ratings, "W", sample_w)
+
+    options = np.array(reviews.column("option"), dtype=object)
+    has_option = options != ""
+    if has_option.any():
+        w = sample_w[has_option] if sample_w is not None else None
+        uniq, counts, means = _group_means(options[has_option], ratings[has_option], w)
+        order = np.argsort(-counts, kind="stable")[:top_options]
+        stats.options = [
+            OptionStat(str(uniq[i]), int(counts[i]), _mean_or_none(means[i]))
+            for i in order
+        ]
+
+    return stats
+
+
+def _to_dates(values: list[str]) -> np.ndarray:
+    """YYYY-MM-DD 문자열 열 → datetime64[D]. 형식이 다르거나 없는 날짜만 NaT (나머지는 유지)."""
+    try:
+        return np.array(values, dtype="datetime64[D]")
+    except ValueError:
+        pass
+    out = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[D]")
+    for i, value in enumerate(values):
+        if _ISO_DATE.fullmatch(value):
+            try:
+                out[i] = np.datetime64(value, "D")
+            except ValueError:
+                pass
+    return out
+
+
+def format_stats_for_prompt(stats: ReviewStats, max_periods: int = 12) -> str:
+    """AI 프롬프트용 통계 요약 (마크다운 목록)"""
+    lines = []
+    for star in STARS:
+        lines.append(f"- {star}점: {stats.histogram[star]}건 ({stats.pct(star):.1f}%)")
+    lines.append(f"- 합계: {stats.rated}건")
+    if stats.weighted:
+        lines.append(
+            f"- 표본 {stats.total}건 기준 추정치 (층화 표본을 별점별 가중치로 보정, "
+            "건수는 표본 크기에 맞춘 추정 건수)"
+        )
+
+    if stats.mean is not None:
+        lines.append(
+            f"- 평균 {stats.mean} / 중앙값 {stats.median} / "
+            f"도움수 가중 평균 {stats.helpful_weighted_mean}"
+        )
+    if stats.length:
+        lines.append(
+            f"- 본문 길이: 중앙값 {stats.length['median']:.0f}자, "
+            f"평균 {stats.length['mean']}자, 최대 {stats.length['max']}자"
+        )
+    if stats.monthly:
+        trend = ", ".join(
+            f"{p.period} {p.count}건" + (f"/{p.mean}점" if p.mean is not None else "")
+            for p in stats.monthly[-max_periods:]
+        )
+        lines.append(f"- 월별 추이: {trend}")
+    if stats.options:
+        by_option = ", ".join(
+            f"{o.option} {o.count}건" + (f"/{o.mean}점" if o.mean is not None else "")
+            for o in stats.options
+        )
+        lines.append(f"- 옵션별: {by_option}")
+    return "\n".join(lines)
@@ -1,6 +1,7 @@
 """상세페이지 스토리 플로우 분석기"""
 
 import json
+from typing import Iterator
 
 from analyzer.ai_client import AIClient
 from analyzer.prompts import STORY_FLOW_PROMPT
@@ -36,6 +37,28 @@ class StoryAnalyzer:
             MAX_TOKENS_STORY,
         )
 
+    def analyze_stream(self, product_data: dict) -> Iterator[str]:
+        """analyze()의 스트리밍 버전"""
+        image_urls = product_data.get("detail_image_urls", [])
+        text_info = self._build_text_info(product_data)
+
+        if image_urls:
+            prompt = (
+                f"{STORY_FLOW_PROMPT}\n\n"
+                f"## 상품 기본 정보\n{text_info}\n\n"
+                f"아래 상세페이지 이미지들을 분석하여 스토리 플로우를 파악해주세요."
+            )
+            yield from self.ai.analyze_with_images_stream(
+                prompt, image_urls, MAX_TOKENS_STORY
+            )
+            return
+
+        yield from self.ai.analyze_stream(
+            STORY_FLOW_PROMPT,
+            f"## 상품 정보\n{text_info}",
+            MAX_TOKENS_STORY,
+        )
+
     def _build_text_info(self, data: dict) -> str:
         parts = []
         if data.get("title"):
@@ -1,7 +1,8 @@
 """E-Commerce Insight Analyzer - Streamlit 메인 앱 (쿠팡 + 네이버 스마트스토어)"""
 
-import asyncio
 import json
+import threading
+import queue
 import streamlit as st
 
 from utils.validators import validate_product_url, detect_platform, validate_api_key
@@ -13,13 +14,18 @@ from crawler.qna_scraper import QnAScraper
 from crawler.naver_product_page import NaverProductPageScraper
 from crawler.naver_review_scraper import NaverReviewScraper
 from crawler.naver_qna_scraper import NaverQnAScraper
-from analyzer.ai_client import create_ai_client
-from analyzer.story_analyzer import StoryAnalyzer
-from analyzer.review_analyzer import ReviewAnalyzer
-from analyzer.qna_analyzer import QnAAnalyzer
-from analyzer.full_report import FullReportAnalyzer
+from crawler.fast_path import (
+    fetch_coupang_reviews, fetch_coupang_qna,
+    fetch_naver_reviews, fetch_naver_qna, remember_naver_ids, start_in_thread, fast_results,
+)
+from analyzer.pipeline import AnalysisPipeline, run_all
+from analyzer.comparison import ComparedProduct, ComparisonAnalyzer, format_comparison_table
+from analyzer.review_stats import compute_review_stats
 from exporter.excel_exporter import ExcelExporter
 from exporter.word_exporter import WordExporter
+from exporter.arrow_exporter import ArrowExporter
+from models.records import ReviewSet, QnASet
+from config.settings import COMPARE_MAX_PRODUCTS, COMPARE_MAX_BROWSERS
 
 st.set_page_config(
     page_title="E-Commerce Insight Analyzer",
@@ -52,10 +58,18 @@ def main():
     st.markdown('<div class="sub-title">쿠팡 또는 네이버 스마트스토어 상품 링크를 입력하면 상세페이지, 리뷰, Q&A를 자동 분석합니다</div>', unsafe_allow_html=True)
 
     # --- 입력 섹션 ---
-    url = st.text_input(
-        "상품 URL",
-        placeholder="쿠팡 또는 네이버 스마트스토어 URL을 입력하세요",
-    )
+    mode = st.radio("분석 모드", ["단일 상품", "상품 비교"], horizontal=True)
+    if mode == "상품 비교":
+        urls_text = st.text_area(
+            f"상품 URL (한 줄에 하나, 최대 {COMPARE_MAX_PRODUCTS}개 — 첫 줄이 기준 상품)",
+            placeholder="자사 상품 URL\n경쟁 상품 URL\n...",
+        )
+        url = ""
+    else:
+        url = st.text_input(
+            "상품 URL",
+            placeholder="쿠팡 또는 네이버 스마트스토어 URL을 입력하세요",
+        )
 
     # 플랫폼 자동 감지 배지
     if url and url.strip():
@@ -94,10 +108,15 @@ def main():
     # --- 분석 시작 ---
     if st.button("분석 시작", type="primary"):
         # 입력 검증
-        url_valid, url_msg, platform = validate_product_url(url)
-        if not url_valid:
-            st.error(url_msg)
-            return
+        if mode == "상품 비교":
+            targets = _validate_compare_urls(urls_text)
+            if targets is None:
+                return
+        else:
+            url_valid, url_msg, platform = validate_product_url(url)
+            if not url_valid:
+                st.error(url_msg)
+                return
 
         if not use_openai and not use_claude:
             st.error("최소 하나의 AI 모델을 선택해주세요.")
@@ -126,7 +145,10 @@ def main():
         if use_openai:
             ai_configs.append(("openai", openai_key, "OpenAI o4-mini"))
 
-        run_analysis(url, platform, ai_configs, do_story, do_review, do_qna, do_full)
+        if mode == "상품 비교":
+            run_comparison(targets, ai_configs, do_story, do_review, do_qna, do_full)
+        else:
+            run_analysis(url, platform, ai_configs, do_story, do_review, do_qna, do_full)
 
     # --- 하단 고지문 ---
     st.divider()
@@ -138,7 +160,7 @@ def main():
 
 
 def run_analysis(url, platform, ai_configs, do_story, do_review, do_qna, do_full):
-    """전체 분석 파이프라인 실행 (다중 AI 모델 + 멀티 플랫폼 지원)"""
+    """전체 분석 파이프라인 실행 (다중 AI 모델 + 멀티 플랫폼 지원, 크롤링과 분석 병행)"""
     try:
         product_info = parse_url(url, platform)
     except ValueError as e:
@@ -148,111 +170,285 @@ def run_analysis(url, platform, ai_configs, do_story, do_review, do_qna, do_full
     progress = st.progress(0, text="준비 중...")
     status = st.empty()
 
-    # 결과 저장
-    product_data = None
-    reviews = []
-    qna_pairs = []
+    pipeline = AnalysisPipeline(ai_configs, do_story, do_review, do_qna, do_full)
 
     try:
         # --- 1단계: 크롤링 (플랫폼별 분기) ---
         status.info("크롤링을 시작합니다...")
         progress.progress(5, text="브라우저 시작 중...")
 
+        # 크롤링은 백그라운드 스레드에서 실행되므로 UI 요소는 프록시로 전달
+        ui_progress = pipeline.proxy(progress)
+        ui_status = pipeline.proxy(status)
         if platform == "coupang":
             crawl_fn = _make_coupang_crawl(
-                product_info, do_story, do_review, do_qna, do_full, progress, status
+                product_info, do_story, do_review, do_qna, do_full,
+                ui_progress, ui_status, pipeline.on_ready,
             )
         else:
             crawl_fn = _make_naver_crawl(
-                product_info, do_story, do_review, do_qna, do_full, progress, status
+                product_info, do_story, do_review, do_qna, do_full,
+                ui_progress, ui_status, pipeline.on_ready,
             )
 
-        # Streamlit 호환 async 실행
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    result = pool.submit(asyncio.run, crawl_fn()).result()
-            else:
-                result = loop.run_until_complete(crawl_fn())
-        except RuntimeError:
-            result = asyncio.run(crawl_fn())
+        # --- 2단계: 데이터셋이 준비되는 대로 AI 분석 시작 (각 모델별) ---
+        # 모델별 결과 영역을 미리 배치 — 분석이 병렬로 끝나도 표시 순서 유지
+        views = {label: _ResultView(label) for _, _, label in ai_configs}
+        started = 0
+        finished = 0
+        crawl_done = False
+
+        for event in pipeline.run(crawl_fn):
+            kind = event[0]
+
+            if kind == "ui":
+                _, method, args, kwargs = event
+                method(*args, **kwargs)
+
+            elif kind == "crawl_error":
+                st.error(f"수집 중 오류가 발생했습니다 (수집된 데이터로 분석을 계속합니다): {event[1]}")
+
+            elif kind == "crawl_end":
+                if not event[1]:
+                    progress.empty()
+                    return
+                crawl_done = True
+                progress.progress(50, text="수집 완료 — AI 분석 진행 중...")
+
+            elif kind == "section_start":
+                _, label, section = event
+                started += 1
+                views[label].start(section)
+                status.info(f"[{label}] {SECTION_TITLES[section]} 중...")
+
+            elif kind == "chunk":
+                _, label, section, _ = event
+                views[label].update(section, pipeline.results[label][section])
+
+            elif kind == "section_error":
+                _, label, section, err = event
+                views[label].error(section, err)
+
+            elif kind == "section_done":
+                _, label, section = event
+                finished += 1
+                caption = ""
+                if section == "review":
+                    caption = _review_summary(pipeline.reviews)
+                elif section == "qna":
+                    caption = _qna_summary(pipeline.qna_pairs)
+                views[label].finish(section, pipeline.results[label][section], caption)
+                if crawl_done:
+                    pct = 50 + int(49 * finished / max(started, 1))
+                    progress.progress(pct, text=f"AI 분석 진행 중... ({finished}/{started})")
+
+            elif kind == "model_done":
+                label = event[1]
+                with views[label].downloads:
+                    create_downloads(
+                        label, platform, pipeline.product_data,
+                        pipeline.reviews, pipeline.qna_pairs, pipeline.results[label],
+                    )
 
-        if result is None:
-            return
+        progress.progress(100, text="분석 완료!")
+        status.success("모든 분석이 완료되었습니다!")
 
-        product_data, reviews, qna_pairs = result
+    except Exception as e:
+        st.error(f"분석 중 오류가 발생했습니다: {e}")
+        progress.empty()
 
-        # --- 2단계: AI 분석 (각 모델별로 실행) ---
-        all_results = {}
 
-        for idx, (provider, api_key, label) in enumerate(ai_configs):
-            progress.progress(50, text=f"{label} 분석 시작...")
-            ai_client = create_ai_client(provider, api_key)
+def _validate_compare_urls(urls_text: str) -> list[tuple[str, str]] | None:
+    """비교 모드 URL 목록 검증. 오류가 있으면 표시하고 None 반환."""
+    urls = [u.strip() for u in (urls_text or "").splitlines() if u.strip()]
+    if len(urls) < 2:
+        st.error("비교할 상품 URL을 2개 이상 입력해주세요.")
+        return None
+    if len(urls) > COMPARE_MAX_PRODUCTS:
+        st.error(f"상품은 최대 {COMPARE_MAX_PRODUCTS}개까지 비교할 수 있습니다.")
+        return None
 
-            story_result = ""
-            review_result = ""
-            qna_result = ""
-            full_result = ""
+    targets = []
+    for i, u in enumerate(urls, 1):
+        url_valid, url_msg, platform = validate_product_url(u)
+        if not url_valid:
+            st.error(f"{i}번째 URL: {url_msg}")
+            return None
+        targets.append((u, platform))
+    return targets
 
-            if do_story and product_data:
-                progress.progress(55, text=f"[{label}] 상세페이지 스토리 분석 중...")
-                analyzer = StoryAnalyzer(ai_client)
-                story_result = analyzer.analyze(product_data)
 
-            if do_review and reviews:
-                progress.progress(65, text=f"[{label}] 리뷰 분석 중...")
-                analyzer = ReviewAnalyzer(ai_client)
-                review_result = analyzer.analyze(reviews)
+def run_comparison(targets, ai_configs, do_story, do_review, do_qna, do_full):
+    """여러 상품을 동시에 수집·분석한 뒤 비교 리포트 생성 (상품별 브라우저, 공유 이벤트 큐)"""
+    progress = st.progress(0, text="준비 중...")
+    events = queue.Queue()
+    # 동시 브라우저 수 제한 — 상품 수가 이 이하면 전체 소요 시간은 가장 느린 상품 수준
+    crawl_slots = threading.Semaphore(COMPARE_MAX_BROWSERS)
+
+    tabs = st.tabs([f"{i}. {PLATFORM_NAMES[platform]}" for i, (_, platform) in enumerate(targets, 1)])
+    jobs, products, views, statuses = {}, {}, {}, {}
+    for i, ((url, platform), tab) in enumerate(zip(targets, tabs), 1):
+        key = str(i)
+        try:
+            product_info = parse_url(url, platform)
+        except ValueError as e:
+            tab.error(str(e))
+            continue
+
+        with tab:
+            statuses[key] = st.empty()
+            tab_progress = st.progress(0, text="대기 중...")
+            views[key] = {label: _ResultView(label) for _, _, label in ai_configs}
+
+        pipeline = AnalysisPipeline(
+            ai_configs, do_story, do_review, do_qna, do_full,
+            events=events, crawl_slots=crawl_slots,
+        )
+        make_crawl = _make_coupang_crawl if platform == "coupang" else _make_naver_crawl
+        crawl_fn = make_crawl(
+            product_info, do_story, do_review, do_qna, do_full,
+            pipeline.proxy(tab_progress), pipeline.proxy(statuses[key]), pipeline.on_ready,
+        )
+        jobs[key] = (pipeline, crawl_fn)
+        products[key] = (platform, product_info)
 
-            if do_qna and qna_pairs:
-                progress.progress(75, text=f"[{label}] Q&A 분석 중...")
-                analyzer = QnAAnalyzer(ai_client)
-                qna_result = analyzer.analyze(qna_pairs)
+    if len(jobs) < 2:
+        st.error("비교할 수 있는 상품이 2개 미만입니다.")
+        progress.empty()
+        return
 
-            if do_full and (story_result or review_result or qna_result):
-                progress.progress(85, text=f"[{label}] 종합 리포트 생성 중...")
-                analyzer = FullReportAnalyzer(ai_client)
-                full_result = analyzer.analyze(
-                    product_data, story_result, review_result, qna_result
+    try:
+        done = set()
+        for key, event in run_all(jobs):
+            kind = event[0]
+            pipeline = jobs[key][0]
+
+            if kind == "ui":
+                _, method, args, kwargs = event
+                method(*args, **kwargs)
+            elif kind == "crawl_error":
+                statuses[key].error(f"수집 중 오류 (수집된 데이터로 계속): {event[1]}")
+            elif kind == "crawl_end" and not event[1]:
+                statuses[key].error("접속 실패 — 이 상품은 비교에서 제외됩니다.")
+            elif kind == "section_start":
+                _, label, section = event
+                views[key][label].start(section)
+            elif kind == "chunk":
+                _, label, section, _ = event
+                views[key][label].update(section, pipeline.results[label][section])
+            elif kind == "section_error":
+                _, label, section, err = event
+                views[key][label].error(section, err)
+            elif kind == "section_done":
+                _, label, section = event
+                views[key][label].finish(section, pipeline.results[label][section])
+            elif kind == "model_done":
+                done.add((key, event[1]))
+                pct = int(90 * len(done) / (len(jobs) * len(ai_configs)))
+                progress.progress(pct, text=f"상품별 분석 진행 중... ({len(done)}/{len(jobs) * len(ai_configs)})")
+
+        # --- 비교 리포트 (모델별) ---
+        st.divider()
+        st.subheader("상품 비교")
+        for _, _, label in ai_configs:
+            compared = [
+                ComparedProduct(
+                    name=_product_name(key, pipeline),
+                    platform=products[key][0],
+                    product_data=pipeline.product_data,
+                    reviews=pipeline.reviews,
+                    qna_pairs=pipeline.qna_pairs,
+                    results=pipeline.results[label],
                 )
+                for key, (pipeline, _) in jobs.items()
+                if pipeline.product_data or pipeline.reviews or pipeline.qna_pairs
+            ]
+            if len(compared) < 2:
+                st.warning("수집에 성공한 상품이 2개 미만이라 비교할 수 없습니다.")
+                break
+
+            st.markdown(f"#### 비교 지표 - {label}")
+            st.markdown(format_comparison_table(compared))
+
+            comparison_result = ""
+            if do_full:
+                progress.progress(95, text=f"[{label}] 비교 리포트 생성 중...")
+                client = next(iter(jobs.values()))[0].clients[label]
+                with st.expander(f"AI 비교 리포트 - {label}", expanded=True):
+                    placeholder = st.empty()
+                    try:
+                        for chunk in ComparisonAnalyzer(client).analyze_stream(compared):
+                            comparison_result += chunk
+                            placeholder.markdown(comparison_result + "▌")
+                        placeholder.markdown(comparison_result)
+                    except Exception as e:
+                        st.error(f"비교 리포트 생성 중 오류가 발생했습니다: {e}")
+
+            create_comparison_downloads(label, compared, comparison_result)
+
+        progress.progress(100, text="비교 분석 완료!")
 
-            all_results[label] = {
-                "story": story_result,
-                "review": review_result,
-                "qna": qna_result,
-                "full": full_result,
-            }
+    except Exception as e:
+        st.error(f"비교 분석 중 오류가 발생했습니다: {e}")
+        progress.empty()
 
-        progress.progress(95, text="리포트 생성 중...")
 
-        # --- 3단계: 결과 표시 ---
-        progress.progress(100, text="분석 완료!")
-        status.success("모든 분석이 완료되었습니다!")
+def _product_name(key: str, pipeline: AnalysisPipeline) -> str:
+    """비교 표 열 이름: 번호 + 상품명 앞부분"""
+    title = (pipeline.product_data or {}).get("title") or ""
+    return f"{key}. {title[:20]}" if title else f"상품 {key}"
 
-        # 모델별 결과 표시
-        for label, res in all_results.items():
-            display_results(
-                label, product_data, reviews, qna_pairs, res,
-                do_story, do_review, do_qna, do_full,
-            )
-            create_downloads(
-                label, platform, product_data, reviews, qna_pairs, res,
-            )
 
+async def _notify_fast(fetch, kind: str, summary, status, on_ready):
+    """빠른 수집(fast_path) 코루틴 실행 후 성공하면 바로 알림. 실패·오류는 None (브라우저로 전환)."""
+    try:
+        found = await fetch
     except Exception as e:
-        st.error(f"분석 중 오류가 발생했습니다: {e}")
-        progress.empty()
-
-
-def _make_coupang_crawl(product_info, do_story, do_review, do_qna, do_full, progress, status):
-    """쿠팡 크롤링 코루틴 생성"""
+        print(f"[FastPath] 브라우저 없는 수집 실패: {e}")
+        return None
+    if found is not None:
+        status.success(summary(found) + " (브라우저 없이 수집)")
+        on_ready(kind, found)
+    return found
+
+
+def _make_coupang_crawl(
+    product_info, do_story, do_review, do_qna, do_full, progress, status, on_ready
+):
+    """쿠팡 크롤링 코루틴 생성. 데이터셋이 완성될 때마다 on_ready(kind, data) 호출"""
     async def crawl():
         product_data = None
         reviews = []
         qna_pairs = []
 
+        # 저장된 쿠키가 유효하면 리뷰/Q&A는 브라우저 없이 별도 스레드에서 수집
+        # 그동안 브라우저는 상품 페이지를 열고, 결과는 브라우저 대체 수집이 필요한 시점에만 기다린다
+        fast_review_job = fast_qna_job = None
+        if do_review or do_full:
+            progress.progress(5, text="저장된 쿠키로 리뷰 API 확인 중...")
+            fast_review_job = await start_in_thread(_notify_fast(
+                fetch_coupang_reviews(
+                    product_info,
+                    lambda msg, pct: progress.progress(5 + int(pct * 0.4), text=msg),
+                ),
+                "reviews", _review_summary, status, on_ready,
+            ))
+        if do_qna or do_full:
+            fast_qna_job = await start_in_thread(_notify_fast(
+                fetch_coupang_qna(product_info, lambda msg: status.info(msg)),
+                "qna", _qna_summary, status, on_ready,
+            ))
+        if not (do_story or do_full):
+            # 상품 정보가 필요 없으면 빠른 수집 결과로 브라우저가 필요한지 판단
+            fast_reviews = await fast_review_job if fast_review_job is not None else None
+            fast_qna = await fast_qna_job if fast_qna_job is not None else None
+            if fast_reviews is not None:
+                reviews = fast_reviews
+            if fast_qna is not None:
+                qna_pairs = fast_qna
+            if (fast_reviews is not None or not do_review) and (fast_qna is not None or not do_qna):
+                return (product_data, reviews, qna_pairs)
+
         browser = CoupangBrowser()
         try:
             await browser.launch()
@@ -260,37 +456,67 @@ def _make_coupang_crawl(product_info, do_story, do_review, do_qna, do_full, prog
 
             success = await browser.navigate(product_info["full_url"])
             if not success:
-                st.error("쿠팡 페이지 접속에 실패했습니다. (봇 차단 가능)")
-                return None
-
-            # 상품 정보 수집
-            if do_story or do_full:
-                progress.progress(15, text="상품 정보 수집 중...")
-                scraper = ProductPageScraper()
-                product_data = await scraper.scrape(browser.page, product_info)
-
-            # 리뷰 수집
-            if do_review or do_full:
-                progress.progress(20, text="리뷰 수집 중...")
-                review_scraper = ReviewScraper()
-                reviews = await review_scraper.scrape_all(
+                status.error("쿠팡 페이지 접속에 실패했습니다. (봇 차단 가능)")
+                # 이미 돌고 있는 빠른 수집 결과가 있으면 그것으로 분석 (이미 알린 데이터를 버리지 않음)
+                return await fast_results(fast_review_job, fast_qna_job)
+
+            # 리뷰 API 수집 시작 — 쿠키 세션으로 별도 스레드에서 진행되는 동안
+            # 브라우저는 상품 정보·Q&A를 수집 (가장 느린 쪽 시간만큼만 소요)
+            review_scraper = ReviewScraper()
+            review_job = None
+
+            def reviews_ready(collected):
+                status.success(_review_summary(collected))
+                on_ready("reviews", collected)
+
+            async def start_reviews():
+                progress.progress(15, text="리뷰 수집 시작...")
+                return await review_scraper.start_api(
                     browser,
                     product_info,
                     lambda msg, pct: progress.progress(
                         20 + int(pct * 0.25), text=msg
                     ),
+                    on_done=reviews_ready,
                 )
-                status.success(_review_summary(reviews))
+
+            # 빠른 수집이 이미 실패로 끝났으면 (저장된 쿠키 없음 등) 상품 정보·Q&A와 동시에 진행
+            if fast_review_job is not None and fast_review_job.done() and fast_review_job.result() is None:
+                review_job = await start_reviews()
+
+            # 상품 정보 수집
+            if do_story or do_full:
+                status.info("상품 정보 수집 중...")
+                scraper = ProductPageScraper()
+                product_data = await scraper.scrape(browser.page, product_info)
+                on_ready("product", product_data)
 
             # Q&A 수집
-            if do_qna or do_full:
-                progress.progress(45, text="Q&A 수집 중...")
+            fast_qna = await fast_qna_job if fast_qna_job is not None else None
+            if fast_qna is not None:
+                qna_pairs = fast_qna
+            elif fast_qna_job is not None:
+                status.info("Q&A 수집 중...")
                 qna_scraper = QnAScraper()
-                qna_pairs = await qna_scraper.scrape(
-                    browser.page,
+                qna_pairs = await qna_scraper.scrape_all(
+                    browser,
+                    product_info,
                     lambda msg: status.info(msg),
                 )
                 status.success(_qna_summary(qna_pairs))
+                on_ready("qna", qna_pairs)
+
+            # 빠른 수집 결과는 여기서 기다리고, 실패했으면 이제 브라우저로 수집
+            if fast_review_job is not None and review_job is None:
+                fast_reviews = await fast_review_job
+                if fast_reviews is not None:
+                    reviews = fast_reviews
+                else:
+                    review_job = await start_reviews()
+
+            # 리뷰 수집 완료 대기 (API 실패 시 여기서 UI로 수집)
+            if review_job is not None:
+                reviews = await review_scraper.finish(browser, review_job)
 
             return (product_data, reviews, qna_pairs)
         finally:
@@ -299,13 +525,43 @@ def _make_coupang_crawl(product_info, do_story, do_review, do_qna, do_full, prog
     return crawl
 
 
-def _make_naver_crawl(product_info, do_story, do_review, do_qna, do_full, progress, status):
-    """네이버 스마트스토어 크롤링 코루틴 생성"""
+def _make_naver_crawl(
+    product_info, do_story, do_review, do_qna, do_full, progress, status, on_ready
+):
+    """네이버 스마트스토어 크롤링 코루틴 생성. 데이터셋이 완성될 때마다 on_ready(kind, data) 호출"""
     async def crawl():
         product_data = None
         reviews = []
         qna_pairs = []
 
+        # 저장된 쿠키·상품 식별자가 있으면 리뷰/Q&A는 브라우저 없이 API로 별도 스레드에서 수집
+        # 그동안 브라우저는 상품 페이지를 열고, 결과는 브라우저 대체 수집이 필요한 시점에만 기다린다
+        fast_review_job = fast_qna_job = None
+        if do_review or do_full:
+            progress.progress(5, text="저장된 쿠키로 리뷰 API 확인 중...")
+            fast_review_job = await start_in_thread(_notify_fast(
+                fetch_naver_reviews(
+                    product_info,
+                    lambda msg, pct: progress.progress(5 + int(pct * 0.4), text=msg),
+                ),
+                "reviews", _review_summary, status, on_ready,
+            ))
+        if do_qna or do_full:
+            fast_qna_job = await start_in_thread(_notify_fast(
+                fetch_naver_qna(product_info, lambda msg: status.info(msg)),
+                "qna", _qna_summary, status, on_ready,
+            ))
+        if not (do_story or do_full):
+            # 상품 정보가 필요 없으면 빠른 수집 결과로 브라우저가 필요한지 판단
+            fast_reviews = await fast_review_job if fast_review_job is not None else None
+            fast_qna = await fast_qna_job if fast_qna_job is not None else None
+            if fast_reviews is not None:
+                reviews = fast_reviews
+            if fast_qna is not None:
+                qna_pairs = fast_qna
+            if (fast_reviews is not None or not do_review) and (fast_qna is not None or not do_qna):
+                return (product_data, reviews, qna_pairs)
+
         browser = NaverBrowser()
         try:
             await browser.launch()
@@ -319,15 +575,17 @@ def _make_naver_crawl(product_info, do_story, do_review, do_qna, do_full, progre
                 product_info["mobile_url"],
             )
             if not success:
-                st.error(
+                status.error(
                     "네이버 스마트스토어 접속에 실패했습니다. "
                     "잠시 후 다시 시도하거나, 다른 상품 URL을 사용해보세요."
                 )
-                return None
+                # 이미 돌고 있는 빠른 수집 결과가 있으면 그것으로 분석 (이미 알린 데이터를 버리지 않음)
+                return await fast_results(fast_review_job, fast_qna_job)
 
             # __NEXT_DATA__ JSON 추출 시도
             progress.progress(12, text="페이지 데이터 추출 중...")
             next_data = await browser.extract_page_data_json()
+            remember_naver_ids(browser, product_info, next_data)
             if next_data:
                 status.info("페이지 JSON 데이터 추출 성공!")
             else:
@@ -338,9 +596,13 @@ def _make_naver_crawl(product_info, do_story, do_review, do_qna, do_full, progre
                 progress.progress(15, text="상품 정보 수집 중...")
                 scraper = NaverProductPageScraper()
                 product_data = await scraper.scrape(browser.page, product_info, next_data)
+                on_ready("product", product_data)
 
             # 리뷰 수집
-            if do_review or do_full:
+            fast_reviews = await fast_review_job if fast_review_job is not None else None
+            if fast_reviews is not None:
+                reviews = fast_reviews
+            elif fast_review_job is not None:
                 progress.progress(20, text="리뷰 수집 중...")
                 review_scraper = NaverReviewScraper()
                 reviews = await review_scraper.scrape_all(
@@ -352,9 +614,13 @@ def _make_naver_crawl(product_info, do_story, do_review, do_qna, do_full, progre
                     ),
                 )
                 status.success(_review_summary(reviews))
+                on_ready("reviews", reviews)
 
             # Q&A 수집
-            if do_qna or do_full:
+            fast_qna = await fast_qna_job if fast_qna_job is not None else None
+            if fast_qna is not None:
+                qna_pairs = fast_qna
+            elif fast_qna_job is not None:
                 progress.progress(45, text="Q&A 수집 중...")
                 qna_scraper = NaverQnAScraper()
                 qna_pairs = await qna_scraper.scrape(
@@ -364,6 +630,7 @@ def _make_naver_crawl(product_info, do_story, do_review, do_qna, do_full, progre
                     lambda msg: status.info(msg),
                 )
                 status.success(_qna_summary(qna_pairs))
+                on_ready("qna", qna_pairs)
 
             return (product_data, reviews, qna_pairs)
         finally:
@@ -372,41 +639,27 @@ def _make_naver_crawl(product_info, do_story, do_review, do_qna, do_full, progre
     return crawl
 
 
-def _review_summary(reviews: list) -> str:
+def _review_summary(reviews: ReviewSet) -> str:
     """리뷰 수집 결과 요약 문자열 생성."""
     if not reviews:
         return "리뷰 0건 수집"
-    total = len(reviews)
-    rating_counts = {}
-    for r in reviews:
-        score = r.get("rating")
-        if score is not None:
-            key = int(round(float(score)))
-            rating_counts[key] = rating_counts.get(key, 0) + 1
-    parts = [f"리뷰 {total}건 수집"]
-    rating_strs = []
-    for star in (5, 4, 3, 2, 1):
-        cnt = rating_counts.get(star, 0)
-        if cnt > 0:
-            rating_strs.append(f"{star}점: {cnt}건")
+    stats = compute_review_stats(reviews)
+    parts = [f"리뷰 {stats.total}건 수집" + (" (층화 표본, 분포는 별점 가중 추정)" if stats.weighted else "")]
+    rating_strs = [
+        f"{star}점: {cnt}건" for star, cnt in stats.histogram.items() if cnt > 0
+    ]
     if rating_strs:
         parts.append(f"({' / '.join(rating_strs)})")
     return " ".join(parts)
 
 
-def _qna_summary(qna_pairs: list) -> str:
+def _qna_summary(qna_pairs: QnASet) -> str:
     """Q&A 수집 결과 요약 문자열 생성."""
     if not qna_pairs:
         return "상품 문의 0건 수집"
     total = len(qna_pairs)
-    secret = sum(
-        1 for p in qna_pairs
-        if "(비공개" in p.get("question", "") or "비밀글" in p.get("question", "")
-    )
-    answered = sum(
-        1 for p in qna_pairs
-        if p.get("answer", "") and p.get("answer", "") not in ("", "(답변완료)")
-    )
+    secret = sum(1 for p in qna_pairs if p.is_secret)
+    answered = sum(1 for p in qna_pairs if p.is_answered)
     parts = [f"전체 상품 문의 {total}건"]
     if secret > 0:
         parts.append(f"비밀글 {secret}건")
@@ -414,41 +667,60 @@ def _qna_summary(qna_pairs: list) -> str:
     return ", ".join(parts)
 
 
-def display_results(label, product_data, reviews, qna_pairs, res, do_story, do_review, do_qna, do_full):
-    """분석 결과를 Streamlit에 표시"""
-    st.divider()
-    st.subheader(f"분석 결과 - {label}")
+PLATFORM_NAMES = {"coupang": "쿠팡", "naver": "네이버"}
 
-    if do_story and res["story"]:
-        with st.expander("상세페이지 스토리 분석", expanded=True):
-            st.markdown(res["story"])
+SECTION_TITLES = {
+    "story": "상세페이지 스토리 분석",
+    "review": "리뷰 분석",
+    "qna": "상품문의(Q&A) 분석",
+    "full": "종합 리포트",
+}
 
-    if do_review and res["review"]:
-        with st.expander("리뷰 분석", expanded=True):
-            st.markdown(res["review"])
-            if reviews:
-                st.caption(_review_summary(reviews))
 
-    if do_qna and res["qna"]:
-        with st.expander("상품문의(Q&A) 분석", expanded=True):
-            st.markdown(res["qna"])
-            if qna_pairs:
-                st.caption(_qna_summary(qna_pairs))
+class _ResultView:
+    """모델 하나의 결과 영역. 섹션별 자리를 미리 잡아두고 스트리밍으로 채움"""
 
-    if do_full and res["full"]:
-        with st.expander("종합 리포트", expanded=True):
-            st.markdown(res["full"])
+    def __init__(self, label: str):
+        self.label = label
+        box = st.container()
+        self._header = box.empty()
+        self._slots = {section: box.empty() for section in SECTION_TITLES}
+        self.downloads = box.container()
+        self._parts = {}
+
+    def start(self, section: str):
+        if not self._parts:
+            with self._header.container():
+                st.divider()
+                st.subheader(f"분석 결과 - {self.label}")
+        expander = self._slots[section].container().expander(
+            SECTION_TITLES[section], expanded=True
+        )
+        self._parts[section] = (expander, expander.empty())
+
+    def update(self, section: str, text: str):
+        self._parts[section][1].markdown(text + "▌")
+
+    def error(self, section: str, err: Exception):
+        # 재시도 후에도 실패한 섹션만 오류 표시 — 수집 데이터와 다른 분석은 유지
+        self._parts[section][0].error(f"{SECTION_TITLES[section]} 중 오류가 발생했습니다: {err}")
+
+    def finish(self, section: str, text: str, caption: str = ""):
+        expander, placeholder = self._parts[section]
+        placeholder.markdown(text)
+        if caption:
+            expander.caption(caption)
 
 
 def create_downloads(label, platform, product_data, reviews, qna_pairs, res):
-    """Excel / Word / JSON 다운로드 버튼 생성"""
+    """Excel / Word / JSON / Parquet 다운로드 버튼 생성"""
     st.divider()
     st.subheader(f"다운로드 - {label}")
 
     # 파일명에 플랫폼 + 모델명 포함
     safe_label = label.replace(" ", "_").lower()
     prefix = f"{platform}_analysis"
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         try:
@@ -486,8 +758,8 @@ def create_downloads(label, platform, product_data, reviews, qna_pairs, res):
     with col3:
         raw_data = {
             "platform": platform,
-            "reviews": reviews,
-            "qna": qna_pairs,
+            "reviews": reviews.to_dicts(),
+            "qna": qna_pairs.to_dicts(),
             "product": product_data,
             "analysis": res,
         }
@@ -499,6 +771,63 @@ def create_downloads(label, platform, product_data, reviews, qna_pairs, res):
             key=f"json_{safe_label}",
         )
 
+    with col4:
+        # 분석용 열 기반 원본 데이터 (reviews / qna / product 테이블 zip)
+        try:
+            exporter = ArrowExporter()
+            for fmt, fmt_label in (("parquet", "Parquet"), ("arrow", "Arrow IPC")):
+                st.download_button(
+                    label=f"원본 데이터 ({fmt_label})",
+                    data=exporter.generate(platform, product_data, reviews, qna_pairs, fmt),
+                    file_name=f"{prefix}_raw_{safe_label}_{fmt}.zip",
+                    mime="application/zip",
+                    key=f"{fmt}_{safe_label}",
+                )
+        except Exception as e:
+            st.error(f"Parquet/Arrow 생성 실패: {e}")
+
+
+def create_comparison_downloads(label, products, comparison_result):
+    """비교 Excel / JSON 다운로드 버튼 생성"""
+    safe_label = label.replace(" ", "_").lower()
+    col1, col2 = st.columns(2)
+
+    with col1:
+        try:
+            excel_bytes = ExcelExporter().generate_comparison(products, comparison_result)
+            st.download_button(
+                label="비교 Excel (.xlsx)",
+                data=excel_bytes,
+                file_name=f"comparison_{safe_label}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                key=f"compare_excel_{safe_label}",
+            )
+        except Exception as e:
+            st.error(f"Excel 생성 실패: {e}")
+
+    with col2:
+        raw_data = {
+            "products": [
+                {
+                    "name": p.name,
+                    "platform": p.platform,
+                    "product": p.product_data,
+                    "reviews": p.reviews.to_dicts(),
+                    "qna": p.qna_pairs.to_dicts(),
+                    "analysis": p.results,
+                }
+                for p in products
+            ],
+            "comparison": comparison_result,
+        }
+        st.download_button(
+            label="비교 원본 데이터 (.json)",
+            data=json.dumps(raw_data, ensure_ascii=False, indent=2),
+            file_name=f"comparison_raw_{safe_label}.json",
+            mime="application/json",
+            key=f"compare_json_{safe_label}",
+        )
+
 
 if __name__ == "__main__":
     main()
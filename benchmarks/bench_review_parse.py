@@ -0,0 +1,114 @@
+"""리뷰 API 페이지 파싱 처리량 벤치마크 (워커 1개 vs N개)
+
+기록해 둔 쿠팡 리뷰 API 응답(HTML 조각)을 parse_reviews_html로 파싱한다.
+- 1 worker: 호출 스레드에서 바로 파싱 (기존 방식)
+- N workers: crawler.parse_pool 프로세스 풀에 한꺼번에 제출 (워커 시작 시간은 제외)
+
+--pages 디렉터리가 없으면 sdp-review 구조를 흉내 낸 합성 페이지를 만든다.
+기록 페이지: /vp/product/reviews 응답 본문을 그대로 *.html로 저장한 디렉터리.
+
+사용법: python benchmarks/bench_review_parse.py [--pages DIR] [--workers 4] [--synthetic 200]
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.parse_pool import ParsePool, default_workers  # noqa: E402
+from crawler.review_scraper import parse_reviews_html  # noqa: E402
+
+_PHRASES = [
+    "배송이 정말 빨라요", "가격 대비 품질이 좋습니다", "사이즈가 조금 작아요",
+    "냄새가 심해서 반품했어요", "재구매 의사 있습니다", "포장이 꼼꼼해요",
+    "색상이 사진이랑 달라요", "아이가 너무 좋아해요", "마감이 아쉽네요",
+]
+
+_ARTICLE = """
+<article class="sdp-review__article__list js_reviewArticle">
+  <div class="sdp-review__article__list__info">
+    <span class="sdp-review__article__list__info__user__name">{author}</span>
+    <div class="sdp-review__article__list__info__product-info__star-orange" style="width: {width}%;"></div>
+    <div class="sdp-review__article__list__info__product-info__reg-date">{date}</div>
+  </div>
+  <div class="sdp-review__article__list__headline">{headline}</div>
+  <div class="sdp-review__article__list__review__content">{content}</div>
+  <div class="sdp-review__article__list__help"><span class="sdp-review__article__list__help__count">{helpful}</span></div>
+</article>"""
+
+_SUMMARY = """
+<div class="sdp-review__average__total-star">
+  <div class="sdp-review__average__total-star__info-orange" style="width: 92%;"></div>
+  <div class="sdp-review__average__total-star__info-count">12,345</div>
+</div>"""
+
+
+def make_pages(n: int, per_page: int = 50, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    pages = []
+    for p in range(n):
+        articles = [
+            _ARTICLE.format(
+                author=f"구매자{p * per_page + i}",
+                width=rng.choice((20, 40, 60, 80, 100)),
+                date=f"20{rng.randint(20, 24)}.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}",
+                headline=rng.choice(_PHRASES),
+                content="<br>".join(rng.choice(_PHRASES) for _ in range(rng.randint(3, 20))),
+                helpful=rng.randint(0, 50),
+            )
+            for i in range(per_page)
+        ]
+        pages.append(_SUMMARY + "".join(articles))
+    return pages
+
+
+def load_pages(directory: str) -> list[str]:
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", help="기록된 리뷰 API 응답(*.html) 디렉터리")
+    parser.add_argument("--synthetic", type=int, default=200, help="합성 페이지 수 (--pages 없을 때)")
+    parser.add_argument("--workers", type=int, default=max(default_workers(), os.cpu_count() or 1))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages) if args.pages else make_pages(args.synthetic)
+    if not pages:
+        sys.exit(f"{args.pages}에 *.html 페이지가 없습니다")
+    size_mb = sum(len(p.encode()) for p in pages) / 1e6
+    print(f"페이지 {len(pages):,}개, {size_mb:.1f}MB, {args.repeat}회 중 최소값")
+
+    baseline, expected = None, None
+    for workers in sorted({1, args.workers}):
+        pool = ParsePool(workers)
+        pool.map(parse_reviews_html, pages[:workers])  # 워커 시작·import 시간 제외
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = pool.map(parse_reviews_html, pages)
+            best = min(best, time.perf_counter() - start)
+        pool.shutdown()
+
+        rows = [row for page_rows, _, _ in results for row in page_rows]
+        records = len(rows)
+        if expected is None:
+            expected = rows
+        elif rows != expected:
+            print(f"  경고: {workers} workers 결과가 1 worker와 다릅니다")
+        baseline = baseline or best
+        print(f"{workers:>3} workers: {best:7.3f}초  {len(pages) / best:>8,.1f}페이지/초  "
+              f"{records / best:>10,.0f}건/초  x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""텍스트 정규화 처리량 벤치마크
+
+합성 리뷰 코퍼스에 대해 세 가지 방식을 비교한다.
+- legacy: 기존 방식 (호출마다 re.sub 2회 + 인라인 날짜 정규식)
+- per-record: normalize_text() / normalize_date()를 레코드마다 호출
+- batch: normalize_records()로 전체를 한 번에 처리
+
+사용법: python benchmarks/bench_text_cleaner.py [--reviews 200000]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.text_cleaner import normalize_text, normalize_date, normalize_records  # noqa: E402
+
+_PHRASES = [
+    "배송이 정말 빨라요", "가격 대비 품질이 좋습니다", "사이즈가 조금 작아요",
+    "냄새가 심해서 반품했어요", "재구매 의사 있습니다", "포장이 꼼꼼해요",
+    "색상이 사진이랑 달라요", "아이가 너무 좋아해요", "마감이 아쉽네요",
+]
+_NOISE = ["<br>", "<b>", "</b>", "  ", "\n", "\u200b", "😀", "👍", "\u2728", ""]
+
+
+def make_corpus(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        words = []
+        for _ in range(rng.randint(3, 12)):
+            words.append(rng.choice(_PHRASES))
+            words.append(rng.choice(_NOISE))
+        corpus.append({
+            "rating": rng.randint(1, 5),
+            "headline": rng.choice(_PHRASES) + rng.choice(_NOISE),
+            "content": " ".join(words),
+            "date": f"{rng.randint(20, 24)}.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}.",
+        })
+    return corpus
+
+
+def legacy(records: list[dict]) -> list[dict]:
+    out = []
+    for r in records:
+        d = dict(r)
+        for name in ("headline", "content"):
+            text = re.sub(r"<[^>]+>", "", d[name])
+            d[name] = re.sub(r"\s+", " ", text).strip()
+        m = re.search(r"(\d{2,4})\s*[./-]\s*(\d{1,2})\s*[./-]\s*(\d{1,2})", d["date"])
+        if m:
+            year, month, day = m.groups()
+            if len(year) == 2:
+                year = "20" + year
+            d["date"] = f"{year}-{int(month):02d}-{int(day):02d}"
+        out.append(d)
+    return out
+
+
+def per_record(records: list[dict]) -> list[dict]:
+    out = []
+    for r in records:
+        d = dict(r)
+        d["headline"] = normalize_text(d["headline"])
+        d["content"] = normalize_text(d["content"])
+        d["date"] = normalize_date(d["date"])
+        out.append(d)
+    return out
+
+
+def batch(records: list[dict]) -> list[dict]:
+    return normalize_records(records, text_fields=("headline", "content"), date_fields=("date",))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reviews", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.reviews)
+    chars = sum(len(r["content"]) + len(r["headline"]) for r in corpus)
+    print(f"리뷰 {len(corpus):,}건, 텍스트 {chars / 1e6:.1f}M자, {args.repeat}회 중 최소값")
+
+    baseline = None
+    for name, fn in (("legacy", legacy), ("per-record", per_record), ("batch", batch)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fn(corpus)
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        rate = len(corpus) / best
+        print(f"{name:>11}: {best:7.3f}초  {rate:>10,.0f}건/초  x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
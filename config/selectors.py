@@ -25,17 +25,29 @@ DATE_API = ".sdp-review__article__list__info__product-info__reg-date"
 HEADLINE_API = ".sdp-review__article__list__headline"
 CONTENT_API = ".sdp-review__article__list__review__content"
 HELPFUL_API = ".sdp-review__article__list__help__count"
+REVIEW_TOTAL_COUNT_API = ".sdp-review__average__total-star__info-count"   # ratingSummary=true
+REVIEW_AVERAGE_STAR_API = ".sdp-review__average__total-star__info-orange"  # style width % → 5점 만점
 
 # === Q&A 셀렉터 ===
 QNA_ENTRY = "div.qna"
 QNA_CONTENT = "span[translate='no']"
+QNA_SELLER = ".twc-font-bold"
+# 문의가 하나도 없는 상품의 안내 문구 (HTTP 응답에 항목이 없을 때 정상 빈 결과인지 판별)
+QNA_EMPTY_MARKERS = ("등록된 문의가 없습니다", "문의가 없습니다", "문의 내역이 없습니다")
 
 # === 상품 상세 셀렉터 ===
 PRODUCT_DETAIL_CONTENT = ".product-detail-content"
 DETAIL_IMAGE = ".subType-IMAGE img, .vendor-item img"
 PRODUCT_TITLE = "h1.prod-buy-header__title, h2.prod-buy-header__title"
 PRODUCT_PRICE = ".total-price strong"
+PRODUCT_SPEC_ROW = ".prod-attr-item"
 
 # === 탭 XPath ===
 TAB_REVIEW_XPATH = "//a[contains(text(), '상품평')]"
 TAB_QNA_XPATH = "//a[contains(text(), '상품문의')]"
+
+# === 네이버 CAPTCHA 화면 (준비 대기 중 문서 전체 대신 이 요소로 판별) ===
+NAVER_CAPTCHA_SELECTOR = (
+    "#rcpt_form, #rcpt_answer, #captcha, .captcha, "
+    "img[src*='captcha'], iframe[src*='captcha'], input[name*='captcha']"
+)
@@ -3,6 +3,7 @@
 # === 쿠팡 ===
 COUPANG_BASE_URL = "https://www.coupang.com"
 COUPANG_REVIEW_API = "https://www.coupang.com/vp/product/reviews"
+COUPANG_QNA_API = "https://www.coupang.com/vp/products/{product_id}/inquiries"
 COUPANG_PAGE_DELAY_MIN = 1.8
 COUPANG_PAGE_DELAY_MAX = 2.5
 COUPANG_INITIAL_LOAD_WAIT = 5.0
@@ -11,6 +12,17 @@ COUPANG_MAX_REVIEWS = 500
 COUPANG_MAX_QNA_PAGES = 20
 COUPANG_REVIEWS_PER_PAGE = 10
 COUPANG_UI_PAGE_LIMIT = 10
+COUPANG_REVIEW_PAGE_SIZES = (50, 30, 20)  # 큰 것부터 시도 — 응답 건수로 실제 허용 크기 판단
+# 리뷰가 COUPANG_MAX_REVIEWS보다 많을 때 층화 표본: (sortBy, ratings 필터, 비중)
+# 저평점 층은 개선점 파악용으로 실제 분포보다 비중이 크다 — 전체 평점은 상품 정보 값을 사용
+COUPANG_REVIEW_SAMPLE_STRATA = (
+    ("ORDER_SCORE_ASC", "", 0.5),   # 랭킹순
+    ("DATE_DESC", "", 0.3),         # 최신순
+    ("DATE_DESC", "1", 0.1),        # 1점 최신순
+    ("DATE_DESC", "2", 0.1),        # 2점 최신순
+)  # 별점 필터 층은 통계에서 가중 보정 (crawler.sampling.post_stratify)
+COUPANG_QNA_API_CONCURRENCY = 4     # Q&A 페이지 동시 요청 수
+COUPANG_QNA_API_MIN_INTERVAL = 0.25 # Q&A 요청 시작 간 최소 간격 (초) — 초당 4회 이하
 
 # === 네이버 스마트스토어 ===
 NAVER_SMARTSTORE_BASE = "https://smartstore.naver.com"
@@ -34,12 +46,27 @@ NAVER_MAX_REVIEW_PAGES = 50
 NAVER_MAX_REVIEWS = 500
 NAVER_MAX_QNA_PAGES = 30
 NAVER_REVIEWS_PER_PAGE = 20
+NAVER_REVIEW_PAGE_SIZES = (100, 50, 30)
+# 리뷰가 NAVER_MAX_REVIEWS보다 많을 때 층화 표본: (sortType, 비중)
+NAVER_REVIEW_SAMPLE_STRATA = (
+    ("REVIEW_RANKING", 0.5, False),           # 랭킹순
+    ("REVIEW_CREATE_DATE_DESC", 0.3, False),  # 최신순
+    ("REVIEW_SCORE_ASC", 0.2, True),          # 평점 낮은순 (별점이 치우친 층 — 통계는 가중 보정)
+)
 
 # === 공통 (하위 호환) ===
 PAGE_DELAY_MIN = 1.8
 PAGE_DELAY_MAX = 2.5
 INITIAL_LOAD_WAIT = 5.0
-TAB_CLICK_WAIT = 3.0
+TAB_CLICK_WAIT = 3.0            # 탭 클릭 후 내용 변화 대기 상한
+
+# === 준비 상태 대기 (crawler.waits) — 조건 만족 즉시 진행, 아래 값은 상한 ===
+PAGE_READY_TIMEOUT = 15.0       # 쿠팡 상품 페이지 렌더링
+NAVER_PAGE_READY_TIMEOUT = 15.0 # 네이버 페이지 데이터 / CAPTCHA 판별
+NAVER_WARMUP_TIMEOUT = 3.0      # 네이버 메인 방문 (쿠키 워밍업)
+WAIT_POLL_INTERVAL = 0.1        # 조건 확인 간격 (초)
+DOM_SETTLE_TIME = 0.3           # DOM 변화 후 이만큼 더 바뀌지 않으면 완료로 판단
+CAPTCHA_SCAN_MAX_ELEMENTS = 1500 # 요소 수가 이 이하인 페이지만 본문 텍스트에서 CAPTCHA·에러 문구 확인
 MAX_REVIEW_PAGES = 50
 MAX_REVIEWS = 500
 MAX_QNA_PAGES = 20
@@ -55,8 +82,78 @@ MAX_TOKENS_STORY = 2000
 MAX_TOKENS_REVIEW = 3000
 MAX_TOKENS_QNA = 2000
 MAX_TOKENS_FULL = 5500
+MAX_TOKENS_COMPARE = 4000
+MAX_TOKENS_DELTA = 3000
+
+# AI 입력 구성 (키워드 표는 전체 수집분으로 로컬 계산, 원문은 표본만 전송)
+KEYWORD_TOP_N = 15
+REVIEW_PROMPT_SAMPLE = 60
+REVIEW_CLUSTERS = 30            # 표본 초과 시 리뷰 군집 수 (군집별 대표 1~2건)
+QNA_PROMPT_SAMPLE = 40
+
+# AI 호출 안정화 (재시도 / 데드라인 / 헤지)
+AI_REQUEST_TIMEOUT = 120.0      # HTTP 요청 1회 타임아웃 (초)
+AI_CALL_DEADLINE = 300.0        # 재시도 포함 호출 전체 데드라인 (초)
+AI_MAX_RETRIES = 4
+AI_RETRY_BASE_DELAY = 1.0       # 지수 백오프 기준 (초)
+AI_RETRY_MAX_DELAY = 30.0
+AI_HEDGE_ENABLED = True         # 종합 리포트 헤지 요청 사용 여부
+AI_HEDGE_REASONING = False      # reasoning 모델(o4-mini)도 헤지할지 — 첫 조각 전 추론 시간이 길고 들쭉날쭉해 기본 끔
+AI_HEDGE_MIN_SAMPLES = 5        # p95 계산에 필요한 최소 표본 수
+AI_HEDGE_DEFAULT_TTFT = 45.0    # 표본 부족 시 스트리밍 헤지 기준 (첫 조각까지, 초)
+
+# 상품 비교 모드
+COMPARE_MAX_PRODUCTS = 5
+COMPARE_MAX_BROWSERS = 5        # 동시에 띄울 브라우저 수 (로컬)
+CLOUD_COMPARE_MAX_BROWSERS = 2  # 클라우드는 메모리 제한으로 더 적게
+COMPARE_REPORT_CHARS = 3000     # 비교 리포트 입력에 넣을 상품별 분석 결과 길이
+
+# 감시 모드 (python -m monitor)
+WATCH_DATA_DIR = "watch_data"       # 상품별 스냅샷·변화 리포트 저장 위치
+WATCH_INTERVAL_HOURS = 168          # 상품별 재수집 주기 (기본 1주)
+WATCH_POLL_MINUTES = 30             # --loop 실행 시 다음 예정 확인 간격
+WATCH_HISTORY_LIMIT = 104           # 상품별로 보관할 회차 추이 수
+
+# HTTP 세션 (수집 API·이미지 다운로드 공용 연결 풀)
+HTTP_POOL_CONNECTIONS = 10      # 호스트별 풀 개수
+HTTP_POOL_MAXSIZE = 20          # 호스트당 유지할 연결 수 (동시 요청 수 이상)
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 Chrome/145.0.0.0 Safari/537.36"
+)
+
+# 쿠키 저장소 (브라우저 없는 빠른 수집 경로)
+COOKIE_JAR_PATH = "~/.ecommerce_insight/cookies.enc"
+COOKIE_JAR_KEY_PATH = "~/.ecommerce_insight/cookies.key"   # 환경변수 COOKIE_JAR_KEY가 없을 때 사용
+COOKIE_JAR_MAX_AGE_HOURS = 12   # 개별 만료와 별개로 저장 후 이 시간이 지나면 브라우저로 다시 받음
+
+# 브라우저 리소스 차단 (crawler.resource_blocker) — DOM 텍스트·이미지 URL만 읽으므로 다운로드 생략
+BLOCK_RESOURCES = True
+BLOCKED_RESOURCE_PATTERNS = (
+    # 이미지 (쿼리스트링이 붙는 CDN URL 포함)
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*", "*.bmp*",
+    # 폰트
+    "*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*",
+    # 미디어
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+)
+BLOCKED_TRACKER_DOMAINS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+    "facebook.net", "connect.facebook.com", "criteo.com", "criteo.net",
+    "analytics.tiktok.com", "ads.linkedin.com", "bat.bing.com", "hotjar.com",
+    "wcs.naver.net", "lcs.naver.com", "tivan.naver.com", "nelo2-col.navercorp.com",
+    "ljc.coupang.com",
+)
 
 # 브라우저
 VIEWPORT_WIDTH = 1920
 VIEWPORT_HEIGHT = 1080
 LOCALE = "ko-KR"
+
+# 수집 체크포인트 (긴 리뷰·Q&A 수집이 중단되면 다음 시도에서 이어받기)
+CHECKPOINT_DIR = "~/.ecommerce_insight/checkpoints"
+CHECKPOINT_MAX_AGE_HOURS = 6    # 이보다 오래된 중간 저장은 버리고 처음부터 수집
+
+# 리뷰 API 페이지 HTML 파싱 프로세스 수 (0: CPU 수 - 1, 최대 PARSE_WORKERS_MAX / 1: 수집 스레드에서 바로 파싱)
+PARSE_WORKERS = 0
+PARSE_WORKERS_MAX = 4
@@ -7,14 +7,30 @@ G200 SMABAT에서 검증된 undetected-chromedriver 사용.
 
 import asyncio
 import json
+import threading
 import requests
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 
+from config.selectors import PRODUCT_TITLE
 from config.settings import (
     VIEWPORT_WIDTH, VIEWPORT_HEIGHT,
-    INITIAL_LOAD_WAIT, NAVER_INITIAL_LOAD_WAIT,
+    PAGE_READY_TIMEOUT, NAVER_PAGE_READY_TIMEOUT, NAVER_WARMUP_TIMEOUT, TAB_CLICK_WAIT,
 )
+from crawler.naver_state import (
+    PRELOADED_STATE_JS, is_preloaded, preloaded_merchant_no, preloaded_origin_product_no,
+)
+from crawler.waits import (
+    COUPANG_READY_JS, NAVER_READY_JS, DOCUMENT_COMPLETE_JS,
+    wait_for_script, wait_for_dom_change, dom_signature, page_state,
+)
+from crawler.resource_blocker import block_resources, unblock_resources
+from utils.cookie_jar import save_driver_cookies
+from utils.http_session import create_session, sync_browser_cookies
+
+# undetected-chromedriver는 시작 시 드라이버 바이너리를 패치하므로
+# 여러 상품을 동시에 수집할 때 브라우저 생성만 직렬화
+_LAUNCH_LOCK = threading.Lock()
 
 
 class CoupangBrowser:
@@ -23,20 +39,25 @@ class CoupangBrowser:
     def __init__(self):
         self.driver = None
         self.page = None  # Selenium wrapper for compatibility
+        self._session = None
 
     async def launch(self):
         """Chrome 브라우저 시작 (비headless + bot 탐지 우회)"""
         options = uc.ChromeOptions()
+        # DOMContentLoaded에서 get() 반환 — 이후 준비 상태는 crawler.waits로 확인
+        options.page_load_strategy = "eager"
         options.add_argument(f"--window-size={VIEWPORT_WIDTH},{VIEWPORT_HEIGHT}")
         options.add_argument("--lang=ko-KR")
 
-        self.driver = uc.Chrome(options=options, headless=False, version_main=145)
+        with _LAUNCH_LOCK:
+            self.driver = uc.Chrome(options=options, headless=False, version_main=145)
+        block_resources(self.driver)
         self.page = SeleniumPageWrapper(self.driver)
 
     async def navigate(self, url: str) -> bool:
         """페이지 이동. Access Denied이면 False 반환."""
         self.driver.get(url)
-        await asyncio.sleep(INITIAL_LOAD_WAIT)
+        await wait_for_script(self.driver, COUPANG_READY_JS, PAGE_READY_TIMEOUT, PRODUCT_TITLE)
 
         title = self.driver.title
         if "Access Denied" in title:
@@ -44,24 +65,21 @@ class CoupangBrowser:
         return True
 
     async def extract_cookies_session(self, referer: str) -> requests.Session:
-        """브라우저 쿠키 → requests.Session으로 전달 (API 호출용)"""
-        session = requests.Session()
-        for cookie in self.driver.get_cookies():
-            session.cookies.set(cookie["name"], cookie["value"])
-
-        ua = self.driver.execute_script("return navigator.userAgent;")
-        session.headers.update({
-            "User-Agent": ua,
+        """브라우저 쿠키 → API 호출용 세션 (브라우저당 하나를 재사용해 연결 유지)"""
+        if self._session is None:
+            self._session = create_session()
+        return sync_browser_cookies(self._session, self.driver, referer, {
             "Accept": "text/html,*/*",
-            "Accept-Language": "ko-KR,ko;q=0.9",
-            "Referer": referer,
             "X-Requested-With": "XMLHttpRequest",
         })
-        return session
 
     async def close(self):
         """브라우저 종료"""
+        if self._session is not None:
+            self._session.close()
         if self.driver:
+            # 다음 실행의 브라우저 없는 수집용 (crawler.fast_path)
+            save_driver_cookies(self.driver)
             try:
                 self.driver.quit()
             except Exception:
@@ -119,8 +137,9 @@ class SeleniumPageWrapper:
         except Exception:
             return []
 
-    async def evaluate(self, script: str):
-        return self.driver.execute_script(f"return {script}")
+    async def evaluate(self, script: str, *args):
+        """JS 식 평가 (args는 식 안에서 arguments[i]로 참조)"""
+        return self.driver.execute_script(f"return {script}", *args)
 
 
 class SeleniumElementWrapper:
@@ -180,15 +199,20 @@ class NaverBrowser:
         self.driver = None
         self.page = None
         self._next_data = None
+        self._session = None
         self._status_cb = None  # Streamlit 상태 콜백
 
     async def launch(self):
         """브라우저 시작."""
         options = uc.ChromeOptions()
+        # DOMContentLoaded에서 get() 반환 — 이후 준비 상태는 crawler.waits로 확인
+        options.page_load_strategy = "eager"
         options.add_argument(f"--window-size={VIEWPORT_WIDTH},{VIEWPORT_HEIGHT}")
         options.add_argument("--lang=ko-KR")
 
-        self.driver = uc.Chrome(options=options, headless=False, version_main=145)
+        with _LAUNCH_LOCK:
+            self.driver = uc.Chrome(options=options, headless=False, version_main=145)
+        block_resources(self.driver)
         self.page = SeleniumPageWrapper(self.driver)
 
     def set_status_callback(self, cb):
@@ -210,7 +234,7 @@ class NaverBrowser:
         # 1단계: 네이버 메인 방문 (쿠키 워밍업)
         self._update_status("네이버 메인 페이지 방문 중 (쿠키 워밍업)...")
         self.driver.get("https://www.naver.com")
-        await asyncio.sleep(3.0)
+        await wait_for_script(self.driver, DOCUMENT_COMPLETE_JS, NAVER_WARMUP_TIMEOUT)
 
         # 2단계: 데스크톱 URL 접속
         self._update_status("상품 페이지 접속 중...")
@@ -223,7 +247,7 @@ class NaverBrowser:
             self._update_status("에러 감지 — 5초 후 새로고침...")
             await asyncio.sleep(5.0)
             self.driver.refresh()
-            await asyncio.sleep(NAVER_INITIAL_LOAD_WAIT)
+            await wait_for_script(self.driver, NAVER_READY_JS, NAVER_PAGE_READY_TIMEOUT)
             result = await self._check_page()
             if result == "success":
                 return True
@@ -239,7 +263,7 @@ class NaverBrowser:
             self._update_status("모바일에서도 에러 — 5초 후 새로고침...")
             await asyncio.sleep(5.0)
             self.driver.refresh()
-            await asyncio.sleep(NAVER_INITIAL_LOAD_WAIT)
+            await wait_for_script(self.driver, NAVER_READY_JS, NAVER_PAGE_READY_TIMEOUT)
             result = await self._check_page()
             if result == "success":
                 return True
@@ -251,7 +275,7 @@ class NaverBrowser:
     async def _try_navigate(self, url: str) -> str:
         """URL 접속 후 페이지 상태 확인. 'success'|'captcha'|'error' 반환."""
         self.driver.get(url)
-        await asyncio.sleep(NAVER_INITIAL_LOAD_WAIT)
+        await wait_for_script(self.driver, NAVER_READY_JS, NAVER_PAGE_READY_TIMEOUT)
         return await self._check_page()
 
     async def _check_page(self) -> str:
@@ -260,62 +284,29 @@ class NaverBrowser:
         판단 기준 (우선순위):
         1. CAPTCHA 감지 → 사용자 대기
         2. 명백한 에러 페이지 (429, 시스템 에러, 빈 페이지)
-        3. __NEXT_DATA__ 존재 → 확실한 성공
+        3. __NEXT_DATA__ / __PRELOADED_STATE__ 존재 → 확실한 성공
         4. URL에 /products/ 포함 + 에러 아님 → 성공 (JSON 없이도 DOM 수집 가능)
         """
-        try:
-            source = self.driver.page_source or ""
-        except Exception:
+        state = page_state(self.driver)
+        if state is None:
             return "error"
 
         # CAPTCHA 감지 (최우선)
-        captcha_signs = ["보안 확인", "captcha", "보안확인", "정답을 입력"]
-        if any(s in source for s in captcha_signs):
+        if state["captcha"]:
             self._update_status("CAPTCHA 감지 — 브라우저에서 직접 풀어주세요!")
             return await self._wait_for_captcha_solve()
 
-        # 명백한 에러 페이지 판별
-        title = ""
-        try:
-            title = self.driver.title or ""
-        except Exception:
-            pass
-
-        error_signs = ["429", "시스템 에러", "Error", "에러가 발생", "찾을 수 없", "존재하지 않"]
-        if any(s in title for s in error_signs) or any(s in source[:2000] for s in error_signs):
-            # 페이지 내용이 거의 없으면 에러
-            if len(source) < 500:
-                return "error"
-
-        # __NEXT_DATA__ 확인 (page_source + JS 두 가지 방법)
-        has_next_data = "__NEXT_DATA__" in source
-        if not has_next_data:
-            try:
-                # JS로 직접 DOM에서 확인 (page_source보다 정확)
-                result = self.driver.execute_script(
-                    'var el = document.querySelector("script#__NEXT_DATA__");'
-                    'return el ? true : false;'
-                )
-                has_next_data = bool(result)
-            except Exception:
-                pass
+        # 명백한 에러 페이지 (페이지 내용이 거의 없으면 에러)
+        if state["error"] and state["length"] < 500:
+            return "error"
 
-        if has_next_data:
-            self._update_status("상품 페이지 로드 성공! (__NEXT_DATA__ 확인)")
+        if state["next_data"] or state["preloaded"]:
+            self._update_status("상품 페이지 로드 성공! (페이지 데이터 확인)")
             return "success"
 
-        # __NEXT_DATA__가 없어도 상품 페이지로 보이면 성공
+        # 페이지 데이터가 없어도 상품 페이지로 보이면 성공
         # (brand.naver.com 등 일부 페이지는 __NEXT_DATA__ 없이도 동작)
-        current_url = ""
-        try:
-            current_url = self.driver.current_url or ""
-        except Exception:
-            pass
-
-        is_product_page = "/products/" in current_url
-        has_content = len(source) > 2000  # 최소한의 콘텐츠 존재
-
-        if is_product_page and has_content:
+        if state["product_page"] and state["length"] > 2000:
             self._update_status("상품 페이지 로드 성공! (콘텐츠 확인)")
             return "success"
 
@@ -324,6 +315,12 @@ class NaverBrowser:
     async def _wait_for_captcha_solve(self) -> str:
         """CAPTCHA를 사용자가 풀 때까지 대기."""
         import time
+        # CAPTCHA 이미지가 보이도록 차단 해제 후 다시 로드, 통과하면 다시 차단
+        unblock_resources(self.driver)
+        try:
+            self.driver.refresh()
+        except Exception:
+            pass
         start = time.time()
 
         while time.time() - start < self._CAPTCHA_WAIT_MAX:
@@ -334,18 +331,14 @@ class NaverBrowser:
             )
             await asyncio.sleep(3.0)
 
-            try:
-                source = self.driver.page_source or ""
-                # CAPTCHA 키워드가 사라졌으면 통과
-                captcha_signs = ["보안 확인", "captcha", "보안확인", "정답을 입력"]
-                if not any(s in source for s in captcha_signs):
-                    # 페이지에 콘텐츠가 있으면 성공
-                    if len(source) > 2000 or "__NEXT_DATA__" in source:
-                        self._update_status("CAPTCHA 통과! 페이지 로드 성공")
-                        return "success"
-            except Exception:
-                pass
+            state = page_state(self.driver)
+            # CAPTCHA 표시가 사라지고 페이지에 콘텐츠가 있으면 통과
+            if state and not state["captcha"] and (state["length"] > 2000 or state["next_data"]):
+                self._update_status("CAPTCHA 통과! 페이지 로드 성공")
+                block_resources(self.driver)
+                return "success"
 
+        block_resources(self.driver)
         return "error"
 
     async def extract_page_data_json(self) -> dict | None:
@@ -354,13 +347,11 @@ class NaverBrowser:
             return self._next_data
 
         # 1) __PRELOADED_STATE__ (Redux) — 현재 네이버 스마트스토어 방식
+        #    상품/채널/리뷰 요약/상세/속성을 한 번에 직렬화해 모든 소비자가 재사용
         try:
-            preloaded = self.driver.execute_script(
-                'try { return typeof __PRELOADED_STATE__ !== "undefined" '
-                '? {_source: "preloaded", state: true} : null; } catch(e) { return null; }'
-            )
+            preloaded = self.driver.execute_script(PRELOADED_STATE_JS)
             if preloaded:
-                self._next_data = {"_source": "preloaded"}
+                self._next_data = preloaded
                 return self._next_data
         except Exception:
             pass
@@ -381,30 +372,14 @@ class NaverBrowser:
 
     async def extract_page_ids(self) -> dict:
         """__PRELOADED_STATE__에서 channelNo, productId 추출."""
-        try:
-            ids = self.driver.execute_script("""
-                try {
-                    var s = __PRELOADED_STATE__;
-                    var sp = s.simpleProductForDetailPage && s.simpleProductForDetailPage.A;
-                    if (sp) return {
-                        channelNo: sp.channel ? String(sp.channel.channelNo) : null,
-                        productId: sp.id ? String(sp.id) : null
-                    };
-                    var bs = s.brandStore && s.brandStore.A;
-                    if (bs && bs.channelNo) return {
-                        channelNo: String(bs.channelNo), productId: null
-                    };
-                } catch(e) {}
-                return null;
-            """)
-            if ids and ids.get("channelNo"):
-                return ids
-        except Exception:
-            pass
+        data = await self.extract_page_data_json()
+        if is_preloaded(data) and preloaded_merchant_no(data):
+            return {"channelNo": preloaded_merchant_no(data), "productId": preloaded_origin_product_no(data)}
         return {"channelNo": None, "productId": None}
 
     async def click_tab(self, keyword: str) -> bool:
         """'리뷰', 'Q&A' 등 탭을 텍스트로 찾아 클릭."""
+        before = dom_signature(self.driver)
         try:
             clicked = self.driver.execute_script("""
                 var keyword = arguments[0];
@@ -424,7 +399,8 @@ class NaverBrowser:
                 return null;
             """, keyword)
             if clicked:
-                await asyncio.sleep(3)
+                # 탭 내용이 바뀌고 안정될 때까지 (최대 TAB_CLICK_WAIT)
+                await wait_for_dom_change(self.driver, before, TAB_CLICK_WAIT)
                 return True
         except Exception:
             pass
@@ -432,24 +408,8 @@ class NaverBrowser:
 
     def get_merchant_no(self, next_data: dict) -> str | None:
         """merchantNo(channelNo) 추출. __PRELOADED_STATE__ 우선."""
-        # __PRELOADED_STATE__ 방식
-        if next_data and next_data.get("_source") == "preloaded":
-            try:
-                ids = self.driver.execute_script("""
-                    try {
-                        var s = __PRELOADED_STATE__;
-                        var sp = s.simpleProductForDetailPage && s.simpleProductForDetailPage.A;
-                        if (sp && sp.channel) return String(sp.channel.channelNo);
-                        var bs = s.brandStore && s.brandStore.A;
-                        if (bs) return String(bs.channelNo);
-                    } catch(e) {}
-                    return null;
-                """)
-                if ids:
-                    return ids
-            except Exception:
-                pass
-            return None
+        if is_preloaded(next_data):
+            return preloaded_merchant_no(next_data)
 
         # __NEXT_DATA__ fallback
         if not next_data:
@@ -476,22 +436,8 @@ class NaverBrowser:
 
     def get_origin_product_no(self, next_data: dict) -> str | None:
         """originProductNo(productId) 추출. __PRELOADED_STATE__ 우선."""
-        # __PRELOADED_STATE__ 방식
-        if next_data and next_data.get("_source") == "preloaded":
-            try:
-                pid = self.driver.execute_script("""
-                    try {
-                        var sp = __PRELOADED_STATE__.simpleProductForDetailPage
-                                 && __PRELOADED_STATE__.simpleProductForDetailPage.A;
-                        if (sp && sp.id) return String(sp.id);
-                    } catch(e) {}
-                    return null;
-                """)
-                if pid:
-                    return pid
-            except Exception:
-                pass
-            return None
+        if is_preloaded(next_data):
+            return preloaded_origin_product_no(next_data)
 
         # __NEXT_DATA__ fallback
         if not next_data:
@@ -518,23 +464,20 @@ class NaverBrowser:
         return None
 
     async def extract_cookies_session(self, referer: str) -> requests.Session:
-        """브라우저 쿠키 → requests.Session으로 전달 (API 호출용)"""
-        session = requests.Session()
-        for cookie in self.driver.get_cookies():
-            session.cookies.set(cookie["name"], cookie["value"])
-
-        ua = self.driver.execute_script("return navigator.userAgent;")
-        session.headers.update({
-            "User-Agent": ua,
+        """브라우저 쿠키 → API 호출용 세션 (브라우저당 하나를 재사용해 연결 유지)"""
+        if self._session is None:
+            self._session = create_session()
+        return sync_browser_cookies(self._session, self.driver, referer, {
             "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "ko-KR,ko;q=0.9",
-            "Referer": referer,
         })
-        return session
 
     async def close(self):
         """브라우저 종료"""
+        if self._session is not None:
+            self._session.close()
         if self.driver:
+            # 다음 실행의 브라우저 없는 수집용 (crawler.fast_path)
+            save_driver_cookies(self.driver)
             try:
                 self.driver.quit()
             except Exception:
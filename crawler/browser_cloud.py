@@ -14,10 +14,21 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 
+from config.selectors import PRODUCT_TITLE
 from config.settings import (
     VIEWPORT_WIDTH, VIEWPORT_HEIGHT,
-    INITIAL_LOAD_WAIT, NAVER_INITIAL_LOAD_WAIT,
+    PAGE_READY_TIMEOUT, NAVER_PAGE_READY_TIMEOUT, NAVER_WARMUP_TIMEOUT, TAB_CLICK_WAIT,
 )
+from crawler.naver_state import (
+    PRELOADED_STATE_JS, is_preloaded, preloaded_merchant_no, preloaded_origin_product_no,
+)
+from crawler.waits import (
+    COUPANG_READY_JS, NAVER_READY_JS, DOCUMENT_COMPLETE_JS,
+    wait_for_script, wait_for_dom_change, dom_signature, page_state,
+)
+from crawler.resource_blocker import block_resources
+from utils.cookie_jar import save_driver_cookies
+from utils.http_session import create_session, sync_browser_cookies
 
 
 class SeleniumPageWrapper:
@@ -66,8 +77,9 @@ class SeleniumPageWrapper:
         except Exception:
             return []
 
-    async def evaluate(self, script: str):
-        return self.driver.execute_script(f"return {script}")
+    async def evaluate(self, script: str, *args):
+        """JS 식 평가 (args는 식 안에서 arguments[i]로 참조)"""
+        return self.driver.execute_script(f"return {script}", *args)
 
 
 class SeleniumElementWrapper:
@@ -112,6 +124,8 @@ class SeleniumElementWrapper:
 def _create_chrome_options() -> Options:
     """클라우드 headless Chrome 옵션 생성."""
     options = Options()
+    # DOMContentLoaded에서 get() 반환 — 이후 준비 상태는 crawler.waits로 확인
+    options.page_load_strategy = "eager"
     options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
@@ -151,35 +165,36 @@ class CoupangBrowserCloud:
     def __init__(self):
         self.driver = None
         self.page = None
+        self._session = None
 
     async def launch(self):
         self.driver = _create_driver()
+        block_resources(self.driver)
         self.page = SeleniumPageWrapper(self.driver)
 
     async def navigate(self, url: str) -> bool:
         self.driver.get(url)
-        await asyncio.sleep(INITIAL_LOAD_WAIT)
+        await wait_for_script(self.driver, COUPANG_READY_JS, PAGE_READY_TIMEOUT, PRODUCT_TITLE)
         title = self.driver.title
         if "Access Denied" in title:
             return False
         return True
 
     async def extract_cookies_session(self, referer: str) -> requests.Session:
-        session = requests.Session()
-        for cookie in self.driver.get_cookies():
-            session.cookies.set(cookie["name"], cookie["value"])
-        ua = self.driver.execute_script("return navigator.userAgent;")
-        session.headers.update({
-            "User-Agent": ua,
+        """브라우저 쿠키 → API 호출용 세션 (브라우저당 하나를 재사용해 연결 유지)"""
+        if self._session is None:
+            self._session = create_session()
+        return sync_browser_cookies(self._session, self.driver, referer, {
             "Accept": "text/html,*/*",
-            "Accept-Language": "ko-KR,ko;q=0.9",
-            "Referer": referer,
             "X-Requested-With": "XMLHttpRequest",
         })
-        return session
 
     async def close(self):
+        if self._session is not None:
+            self._session.close()
         if self.driver:
+            # 다음 실행의 브라우저 없는 수집용 (crawler.fast_path)
+            save_driver_cookies(self.driver)
             try:
                 self.driver.quit()
             except Exception:
@@ -196,11 +211,13 @@ class NaverBrowserCloud:
         self.driver = None
         self.page = None
         self._next_data = None
+        self._session = None
         self._status_cb = None
         self.captcha_detected = False
 
     async def launch(self):
         self.driver = _create_driver()
+        block_resources(self.driver)
         self.page = SeleniumPageWrapper(self.driver)
 
     def set_status_callback(self, cb):
@@ -220,7 +237,7 @@ class NaverBrowserCloud:
         # 1단계: 쿠키 워밍업
         self._update_status("네이버 메인 페이지 방문 중 (쿠키 워밍업)...")
         self.driver.get("https://www.naver.com")
-        await asyncio.sleep(3.0)
+        await wait_for_script(self.driver, DOCUMENT_COMPLETE_JS, NAVER_WARMUP_TIMEOUT)
 
         # 2단계: 데스크톱
         self._update_status("상품 페이지 접속 중...")
@@ -236,7 +253,7 @@ class NaverBrowserCloud:
             self._update_status("에러 감지 — 5초 후 새로고침...")
             await asyncio.sleep(5.0)
             self.driver.refresh()
-            await asyncio.sleep(NAVER_INITIAL_LOAD_WAIT)
+            await wait_for_script(self.driver, NAVER_READY_JS, NAVER_PAGE_READY_TIMEOUT)
             result = await self._check_page()
             if result == "success":
                 return True
@@ -258,7 +275,7 @@ class NaverBrowserCloud:
             self._update_status("모바일에서도 에러 — 5초 후 새로고침...")
             await asyncio.sleep(5.0)
             self.driver.refresh()
-            await asyncio.sleep(NAVER_INITIAL_LOAD_WAIT)
+            await wait_for_script(self.driver, NAVER_READY_JS, NAVER_PAGE_READY_TIMEOUT)
             result = await self._check_page()
             if result == "success":
                 return True
@@ -271,58 +288,31 @@ class NaverBrowserCloud:
 
     async def _try_navigate(self, url: str) -> str:
         self.driver.get(url)
-        await asyncio.sleep(NAVER_INITIAL_LOAD_WAIT)
+        await wait_for_script(self.driver, NAVER_READY_JS, NAVER_PAGE_READY_TIMEOUT)
         return await self._check_page()
 
     async def _check_page(self) -> str:
         """페이지 상태: 'success' | 'captcha' | 'error'"""
-        try:
-            source = self.driver.page_source or ""
-        except Exception:
+        state = page_state(self.driver)
+        if state is None:
             return "error"
 
         # CAPTCHA → 즉시 반환 (headless에서 풀 수 없음)
-        captcha_signs = ["보안 확인", "captcha", "보안확인", "정답을 입력"]
-        if any(s in source for s in captcha_signs):
+        if state["captcha"]:
             self._update_status("CAPTCHA 감지됨")
             return "captcha"
 
         # 에러 페이지
-        title = ""
-        try:
-            title = self.driver.title or ""
-        except Exception:
-            pass
-
-        error_signs = ["429", "시스템 에러", "Error", "에러가 발생", "찾을 수 없", "존재하지 않"]
-        if any(s in title for s in error_signs) or any(s in source[:2000] for s in error_signs):
-            if len(source) < 500:
-                return "error"
-
-        # __NEXT_DATA__
-        has_next_data = "__NEXT_DATA__" in source
-        if not has_next_data:
-            try:
-                result = self.driver.execute_script(
-                    'var el = document.querySelector("script#__NEXT_DATA__");'
-                    'return el ? true : false;'
-                )
-                has_next_data = bool(result)
-            except Exception:
-                pass
+        if state["error"] and state["length"] < 500:
+            return "error"
 
-        if has_next_data:
+        # __NEXT_DATA__ / __PRELOADED_STATE__
+        if state["next_data"] or state["preloaded"]:
             self._update_status("상품 페이지 로드 성공!")
             return "success"
 
         # URL + 콘텐츠 기반 판단
-        current_url = ""
-        try:
-            current_url = self.driver.current_url or ""
-        except Exception:
-            pass
-
-        if "/products/" in current_url and len(source) > 2000:
+        if state["product_page"] and state["length"] > 2000:
             self._update_status("상품 페이지 로드 성공!")
             return "success"
 
@@ -334,13 +324,11 @@ class NaverBrowserCloud:
             return self._next_data
 
         # 1) __PRELOADED_STATE__ (Redux) — 현재 네이버 스마트스토어 방식
+        #    상품/채널/리뷰 요약/상세/속성을 한 번에 직렬화해 모든 소비자가 재사용
         try:
-            preloaded = self.driver.execute_script(
-                'try { return typeof __PRELOADED_STATE__ !== "undefined" '
-                '? {_source: "preloaded", state: true} : null; } catch(e) { return null; }'
-            )
+            preloaded = self.driver.execute_script(PRELOADED_STATE_JS)
             if preloaded:
-                self._next_data = {"_source": "preloaded"}
+                self._next_data = preloaded
                 return self._next_data
         except Exception:
             pass
@@ -361,30 +349,14 @@ class NaverBrowserCloud:
 
     async def extract_page_ids(self) -> dict:
         """__PRELOADED_STATE__에서 channelNo, productId 추출."""
-        try:
-            ids = self.driver.execute_script("""
-                try {
-                    var s = __PRELOADED_STATE__;
-                    var sp = s.simpleProductForDetailPage && s.simpleProductForDetailPage.A;
-                    if (sp) return {
-                        channelNo: sp.channel ? String(sp.channel.channelNo) : null,
-                        productId: sp.id ? String(sp.id) : null
-                    };
-                    var bs = s.brandStore && s.brandStore.A;
-                    if (bs && bs.channelNo) return {
-                        channelNo: String(bs.channelNo), productId: null
-                    };
-                } catch(e) {}
-                return null;
-            """)
-            if ids and ids.get("channelNo"):
-                return ids
-        except Exception:
-            pass
+        data = await self.extract_page_data_json()
+        if is_preloaded(data) and preloaded_merchant_no(data):
+            return {"channelNo": preloaded_merchant_no(data), "productId": preloaded_origin_product_no(data)}
         return {"channelNo": None, "productId": None}
 
     async def click_tab(self, keyword: str) -> bool:
         """'리뷰', 'Q&A' 등 탭을 텍스트로 찾아 클릭."""
+        before = dom_signature(self.driver)
         try:
             clicked = self.driver.execute_script("""
                 var keyword = arguments[0];
@@ -404,7 +376,8 @@ class NaverBrowserCloud:
                 return null;
             """, keyword)
             if clicked:
-                await asyncio.sleep(3)
+                # 탭 내용이 바뀌고 안정될 때까지 (최대 TAB_CLICK_WAIT)
+                await wait_for_dom_change(self.driver, before, TAB_CLICK_WAIT)
                 return True
         except Exception:
             pass
@@ -412,24 +385,8 @@ class NaverBrowserCloud:
 
     def get_merchant_no(self, next_data: dict) -> str | None:
         """merchantNo(channelNo) 추출. __PRELOADED_STATE__ 우선."""
-        # __PRELOADED_STATE__ 방식
-        if next_data and next_data.get("_source") == "preloaded":
-            try:
-                ids = self.driver.execute_script("""
-                    try {
-                        var s = __PRELOADED_STATE__;
-                        var sp = s.simpleProductForDetailPage && s.simpleProductForDetailPage.A;
-                        if (sp && sp.channel) return String(sp.channel.channelNo);
-                        var bs = s.brandStore && s.brandStore.A;
-                        if (bs) return String(bs.channelNo);
-                    } catch(e) {}
-                    return null;
-                """)
-                if ids:
-                    return ids
-            except Exception:
-                pass
-            return None
+        if is_preloaded(next_data):
+            return preloaded_merchant_no(next_data)
 
         # __NEXT_DATA__ fallback
         if not next_data:
@@ -456,22 +413,8 @@ class NaverBrowserCloud:
 
     def get_origin_product_no(self, next_data: dict) -> str | None:
         """originProductNo(productId) 추출. __PRELOADED_STATE__ 우선."""
-        # __PRELOADED_STATE__ 방식
-        if next_data and next_data.get("_source") == "preloaded":
-            try:
-                pid = self.driver.execute_script("""
-                    try {
-                        var sp = __PRELOADED_STATE__.simpleProductForDetailPage
-                                 && __PRELOADED_STATE__.simpleProductForDetailPage.A;
-                        if (sp && sp.id) return String(sp.id);
-                    } catch(e) {}
-                    return null;
-                """)
-                if pid:
-                    return pid
-            except Exception:
-                pass
-            return None
+        if is_preloaded(next_data):
+            return preloaded_origin_product_no(next_data)
 
         # __NEXT_DATA__ fallback
         if not next_data:
@@ -498,20 +441,20 @@ class NaverBrowserCloud:
         return None
 
     async def extract_cookies_session(self, referer: str) -> requests.Session:
-        session = requests.Session()
-        for cookie in self.driver.get_cookies():
-            session.cookies.set(cookie["name"], cookie["value"])
-        ua = self.driver.execute_script("return navigator.userAgent;")
-        session.headers.update({
-            "User-Agent": ua,
+        """브라우저 쿠키 → API 호출용 세션 (브라우저당 하나를 재사용해 연결 유지)"""
+        if self._session is None:
+            self._session = create_session()
+        return sync_browser_cookies(self._session, self.driver, referer, {
             "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "ko-KR,ko;q=0.9",
-            "Referer": referer,
         })
-        return session
 
     async def close(self):
+        if self._session is not None:
+            self._session.close()
         if self.driver:
+            # 다음 실행의 브라우저 없는 수집용 (crawler.fast_path)
+            if not self.captcha_detected:
+                save_driver_cookies(self.driver)
             try:
                 self.driver.quit()
             except Exception:
@@ -0,0 +1,103 @@
+"""수집 체크포인트 (페이지 단위 중간 저장 → 재시도 시 이어서 수집)
+
+상품·데이터셋별 JSON Lines 파일 하나에 페이지를 받을 때마다 {"page", "records"} 한 줄을 덧붙인다.
+끝까지 수집하면 삭제하고, CAPTCHA·429·브라우저 종료 등으로 중단되면 파일이 남아
+다음 시도가 마지막으로 받은 페이지 다음부터 이어받는다.
+"""
+
+import json
+import os
+import re
+import time
+from typing import Awaitable, Callable
+
+from config.settings import CHECKPOINT_DIR, CHECKPOINT_MAX_AGE_HOURS
+
+_UNSAFE = re.compile(r"[^\w.-]+")
+
+
+class CrawlCheckpoint:
+    def __init__(self, name: str, product_id: str, record_cls, root: str = CHECKPOINT_DIR):
+        """name: 데이터셋·정렬 구분 (예: 'coupang-reviews-DATE_DESC'), record_cls: Review / QnAPair"""
+        self.path = os.path.join(
+            os.path.expanduser(root), _UNSAFE.sub("_", f"{name}_{product_id}") + ".jsonl"
+        )
+        self.record_cls = record_cls
+        self.last_page = 0
+        self.meta: dict = {}   # 재개 시 그대로 써야 하는 수집 조건 (페이지 크기 등)
+
+    def load(self) -> list:
+        """이전 시도에서 저장한 레코드 (없거나 오래됐으면 빈 목록). last_page / meta도 갱신."""
+        self.last_page = 0
+        self.meta = {}
+        try:
+            if time.time() - os.path.getmtime(self.path) > CHECKPOINT_MAX_AGE_HOURS * 3600:
+                self.clear()
+                return []
+            records, good = [], []
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.readlines()
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # 기록 도중 중단된 마지막 줄
+                records.extend(self.record_cls.from_dict(d, clean=False) for d in entry["records"])
+                self.last_page = entry["page"]
+                self.meta = entry.get("meta", {})
+                good.append(line)
+            if len(good) < len(lines):
+                # 잘린 줄 뒤에 이어 쓰지 않도록 온전한 줄만 남김
+                with open(self.path, "w", encoding="utf-8") as f:
+                    f.writelines(good)
+            return records
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"[Checkpoint] 읽기 실패, 처음부터 수집합니다: {e}")
+            self.clear()
+            return []
+
+    def add_page(self, page: int, records, **meta):
+        """페이지 하나 분량 덧붙이기"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            line = json.dumps(
+                {"page": page, "meta": meta, "records": [r.to_dict() for r in records]}, ensure_ascii=False
+            )
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.last_page = page
+            self.meta = meta
+        except Exception as e:
+            print(f"[Checkpoint] 저장 실패: {e}")
+
+    def clear(self):
+        """수집 완료 — 중간 저장 삭제"""
+        self.last_page = 0
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[Checkpoint] 삭제 실패: {e}")
+
+
+async def skip_to_page(
+    click_page: Callable[[int], str],
+    target: int,
+    delay: Callable[[], Awaitable],
+) -> bool:
+    """번호 페이지네이션에서 target 페이지로 이동 (재개용).
+
+    click_page(n)은 n이 보이면 클릭하고 'page', 없으면 '다음' 블록으로 넘기고 'next',
+    마지막 블록이면 'end', 실패 시 ''.
+    """
+    for _ in range(target // 10 + 2):
+        kind = click_page(target)
+        if kind not in ("page", "next"):
+            return False
+        await delay()
+        if kind == "page":
+            return True
+    return False
@@ -0,0 +1,137 @@
+"""브라우저 없는 빠른 수집 경로
+
+이전 실행에서 저장한 쿠키(utils.cookie_jar)가 유효하면 브라우저를 띄우지 않고
+쿠팡 리뷰 API·문의 페이지 / 네이버 리뷰·문의 API를 바로 호출한다.
+API가 거부하면 저장된 쿠키를 폐기하고 None을 반환 — 호출 측은 기존 브라우저 수집으로 전환한다.
+네이버 API에 필요한 merchantNo / originProductNo는 브라우저 수집 때 remember_naver_ids()로 저장해 둔다.
+start_in_thread()로 별도 스레드에서 시작하면 그동안 브라우저로 상품 정보를 함께 수집할 수 있다.
+"""
+
+import asyncio
+from typing import Awaitable, Callable
+
+import requests
+
+from crawler.review_scraper import ReviewScraper
+from crawler.qna_scraper import QnAScraper
+from crawler.naver_review_scraper import NaverReviewScraper
+from crawler.naver_qna_scraper import NaverQnAScraper
+from models.records import ReviewSet, QnASet
+from utils.cookie_jar import cookie_jar
+from utils.http_session import create_session, apply_cookies
+
+
+async def start_in_thread(coro: Awaitable) -> asyncio.Future:
+    """코루틴을 별도 스레드(자체 이벤트 루프)에서 시작하고 바로 반환.
+
+    브라우저 호출은 이벤트 루프를 막으므로 스레드를 먼저 띄운 뒤 돌아온다.
+    """
+    job = asyncio.ensure_future(asyncio.to_thread(asyncio.run, coro))
+    await asyncio.sleep(0)  # 워커 스레드 시작
+    return job
+
+
+async def fast_results(review_job: asyncio.Future | None, qna_job: asyncio.Future | None) -> tuple | None:
+    """브라우저 접속이 실패했을 때 빠른 수집 결과 회수: (None, reviews, qna_pairs). 둘 다 없으면 None."""
+    reviews = await review_job if review_job is not None else None
+    qna_pairs = await qna_job if qna_job is not None else None
+    if reviews is None and qna_pairs is None:
+        return None
+    return (None, reviews if reviews is not None else [], qna_pairs if qna_pairs is not None else [])
+
+
+def cached_session(url: str, headers: dict | None = None) -> requests.Session | None:
+    """저장된 쿠키로 만든 세션. 유효한 쿠키가 없으면 None."""
+    saved = cookie_jar().load(url)
+    if not saved:
+        return None
+    session = create_session({"Referer": url, **(headers or {})})
+    # 쿠키를 받은 브라우저와 같은 User-Agent로 요청 (다르면 봇 차단 쿠키가 무효화됨)
+    if saved["user_agent"]:
+        session.headers["User-Agent"] = saved["user_agent"]
+    apply_cookies(session, saved["cookies"])
+    return session
+
+
+async def fetch_coupang_reviews(
+    product_info: dict,
+    progress_cb: Callable[[str, float], None] | None = None,
+    known: set[str] | None = None,
+) -> ReviewSet | None:
+    url = product_info["full_url"]
+    session = cached_session(url, {"Accept": "text/html,*/*", "X-Requested-With": "XMLHttpRequest"})
+    if session is None:
+        return None
+    with session:
+        reviews, ok = await ReviewScraper().scrape_api(session, product_info, None, progress_cb, known)
+    if not ok:
+        cookie_jar().invalidate(url)
+        return None
+    return reviews
+
+
+async def fetch_coupang_qna(
+    product_info: dict,
+    progress_cb: Callable[[str], None] | None = None,
+) -> QnASet | None:
+    url = product_info["full_url"]
+    session = cached_session(url, {"Accept": "text/html,*/*", "X-Requested-With": "XMLHttpRequest"})
+    if session is None:
+        return None
+    with session:
+        pairs = await QnAScraper().scrape_api(session, product_info, progress_cb)
+    if pairs is None:
+        cookie_jar().invalidate(url)
+    return pairs
+
+
+def _naver_ids(product_info: dict) -> dict | None:
+    return cookie_jar().recall(f"naver:{product_info['product_id']}")
+
+
+def remember_naver_ids(browser, product_info: dict, next_data: dict | None):
+    """브라우저로 얻은 네이버 API 식별자를 다음 실행용으로 저장"""
+    try:
+        merchant_no = browser.get_merchant_no(next_data)
+        origin_product_no = browser.get_origin_product_no(next_data)
+        if merchant_no and origin_product_no:
+            cookie_jar().remember(
+                f"naver:{product_info['product_id']}",
+                {"merchant_no": merchant_no, "origin_product_no": origin_product_no},
+            )
+    except Exception as e:
+        print(f"[FastPath] 네이버 식별자 저장 실패: {e}")
+
+
+async def fetch_naver_reviews(
+    product_info: dict,
+    progress_cb: Callable[[str, float], None] | None = None,
+) -> ReviewSet | None:
+    ids = _naver_ids(product_info)
+    session = cached_session(product_info["full_url"], {"Accept": "application/json, text/plain, */*"}) if ids else None
+    if session is None:
+        return None
+    with session:
+        reviews = await NaverReviewScraper().scrape_api(
+            session, product_info, ids["merchant_no"], ids["origin_product_no"], progress_cb
+        )
+    if reviews is None:
+        cookie_jar().invalidate(product_info["full_url"])
+    return reviews
+
+
+async def fetch_naver_qna(
+    product_info: dict,
+    progress_cb: Callable[[str], None] | None = None,
+) -> QnASet | None:
+    ids = _naver_ids(product_info)
+    session = cached_session(product_info["full_url"], {"Accept": "application/json, text/plain, */*"}) if ids else None
+    if session is None:
+        return None
+    with session:
+        pairs = await NaverQnAScraper().scrape_api(
+            session, product_info, ids["merchant_no"], ids["origin_product_no"], progress_cb
+        )
+    if pairs is None:
+        cookie_jar().invalidate(product_info["full_url"])
+    return pairs
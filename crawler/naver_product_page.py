@@ -1,6 +1,7 @@
 """네이버 스마트스토어 상품 페이지 정보 스크래핑
 
-__NEXT_DATA__ JSON 추출 최우선, DOM 파싱은 fallback.
+페이지 데이터(__PRELOADED_STATE__ 직렬화본 또는 __NEXT_DATA__ JSON) 최우선, DOM 파싱은 fallback.
+__PRELOADED_STATE__에서 상품명을 얻으면 DOM은 상세 이미지가 상태에 없을 때만 조회한다.
 출력 형식은 기존 쿠팡 ProductPageScraper와 동일.
 """
 
@@ -11,6 +12,8 @@ from config.naver_selectors import (
     PRODUCT_REVIEW_COUNT_SELECTORS,
     DETAIL_IMAGE_SELECTORS,
 )
+from crawler.naver_state import is_preloaded
+from utils.text_cleaner import find_image_urls
 
 
 class NaverProductPageScraper:
@@ -20,7 +23,7 @@ class NaverProductPageScraper:
         Args:
             page: SeleniumPageWrapper
             product_info: parse_naver_url() 결과
-            next_data: __NEXT_DATA__ JSON (있으면 우선 사용)
+            next_data: browser.extract_page_data_json() 결과 (있으면 우선 사용)
 
         Returns:
             기존 쿠팡과 동일한 구조의 dict
@@ -36,9 +39,21 @@ class NaverProductPageScraper:
             "specifications": [],
         }
 
-        # 1단계: __NEXT_DATA__ JSON에서 추출
+        # 1단계: 페이지 데이터에서 추출
+        detail_from_state = False
         if next_data:
-            self._extract_from_json(next_data, data)
+            detail_from_state = self._extract_from_json(next_data, data)
+
+        # Redux 상태가 상품을 담고 있으면 빈 필드(리뷰 없음 등)도 그대로 확정.
+        # 단, 상세 HTML에서 이미지를 얻지 못했으면 (에디터 렌더링 상세 등) DOM 상세 이미지를 우선한다.
+        if is_preloaded(next_data) and data["title"]:
+            if not detail_from_state and page is not None:
+                dom_images = await self._extract_images_dom(page)
+                if dom_images:
+                    data["detail_image_urls"] = dom_images
+                elif data["detail_image_urls"]:
+                    print("[NaverProductPage] 상세 이미지를 찾지 못해 대표 이미지로 대체합니다")
+            return data
 
         # 2단계: JSON에서 못 가져온 필드는 DOM fallback (page가 있을 때만)
         if page is not None:
@@ -71,13 +86,20 @@ class NaverProductPageScraper:
 
         return data
 
-    def _extract_from_json(self, next_data: dict, data: dict):
-        """__NEXT_DATA__ JSON에서 상품 정보 추출."""
-        try:
-            props = next_data.get("props", {}).get("pageProps", {})
+    def _extract_from_json(self, next_data: dict, data: dict) -> bool:
+        """페이지 데이터에서 상품 정보 추출 (__PRELOADED_STATE__ 직렬화본 / __NEXT_DATA__).
 
+        상세 HTML(detailContents)에서 상세 이미지를 얻었으면 True (대표 이미지 대체분은 False).
+        """
+        detail_found = False
+        try:
             # product 객체 탐색
-            product = props.get("product", {})
+            if is_preloaded(next_data):
+                props = {}
+                product = next_data.get("product", {})
+            else:
+                props = next_data.get("props", {}).get("pageProps", {})
+                product = props.get("product", {})
             if not isinstance(product, dict):
                 product = {}
 
@@ -112,9 +134,9 @@ class NaverProductPageScraper:
             # 상세 이미지
             detail_content = product.get("detailContents", "")
             if isinstance(detail_content, str) and detail_content:
-                import re
-                img_urls = re.findall(r'https?://[^\s"\'<>]+\.(?:jpg|jpeg|png|gif|webp)', detail_content)
+                img_urls = find_image_urls(detail_content)
                 data["detail_image_urls"] = list(dict.fromkeys(img_urls))[:50]
+                detail_found = bool(data["detail_image_urls"])
 
             # 상품 이미지 (detail이 없을 경우)
             if not data["detail_image_urls"]:
@@ -151,6 +173,7 @@ class NaverProductPageScraper:
 
         except Exception:
             pass
+        return detail_found
 
     async def _extract_text_dom(self, page, selectors: list[str]) -> str:
         """복수 셀렉터를 순서대로 시도하여 텍스트 추출."""
@@ -12,7 +12,12 @@ from typing import Callable
 
 from config.settings import (
     NAVER_MAX_QNA_PAGES,
+    NAVER_PAGE_DELAY_MIN,
+    NAVER_PAGE_DELAY_MAX,
 )
+from crawler.checkpoint import CrawlCheckpoint, skip_to_page
+from crawler.waits import page_blocked
+from models.records import QnAPair, QnASet
 
 
 class NaverQnAScraper:
@@ -24,16 +29,18 @@ class NaverQnAScraper:
         product_info: dict,
         next_data: dict | None,
         progress_cb: Callable[[str], None] | None = None,
-    ) -> list[dict]:
+    ) -> QnASet:
         """전체 Q&A 수집.
 
+        CAPTCHA·오류 화면으로 멈추면 받은 데까지 반환하고 체크포인트를 남긴다.
+
         Args:
             browser: NaverBrowser / NaverBrowserCloud
             product_info: parse_naver_url() 결과
             next_data: 페이지 데이터 (호환용, 실제로는 미사용)
             progress_cb: 진행 상황 콜백
         """
-        all_pairs = []
+        all_pairs = QnASet()
         seen = set()
 
         # 1단계: 스크롤 후 Q&A 탭 클릭
@@ -73,26 +80,59 @@ class NaverQnAScraper:
             pass
         await asyncio.sleep(1)
 
+        # 이전 시도가 중단됐으면 저장분을 복원하고 마지막 페이지 다음으로 이동
+        checkpoint = CrawlCheckpoint("naver-qna", product_info["product_id"], QnAPair)
+        for p in checkpoint.load():
+            key = p.question[:50]
+            if key and key not in seen:
+                seen.add(key)
+                all_pairs.append(p)
+        start = checkpoint.last_page + 1
+        if start > 1:
+            if progress_cb:
+                progress_cb(f"이전 수집분 {len(all_pairs)}건에서 이어서 수집 (페이지 {start}부터)")
+            jumped = await skip_to_page(
+                lambda n: self._click_page_number(browser.driver, n), start,
+                lambda: asyncio.sleep(random.uniform(2.0, 3.5)),
+            )
+            if not jumped:
+                # 이동 실패 — 저장분은 유지하고 현재 페이지부터 번호를 다시 매김
+                checkpoint.clear()
+                checkpoint.add_page(0, all_pairs)
+                start = 1
+
+        interrupted = None  # 차단·오류로 멈춘 페이지 (None: 목록 끝이나 한도까지 수집)
+
         # 2단계: DOM에서 페이지별 Q&A 수집 (각 항목 클릭하여 답변 추출)
-        for pg in range(1, NAVER_MAX_QNA_PAGES + 1):
+        for pg in range(start, NAVER_MAX_QNA_PAGES + 1):
             if progress_cb:
                 progress_cb(f"Q&A 수집 중... (페이지 {pg})")
 
             page_pairs = await self._extract_qna_from_dom(browser.driver)
 
             if not page_pairs:
+                # 빈 목록: CAPTCHA·에러 화면이면 중단(체크포인트 유지), 아니면 목록 끝
+                interrupted = pg if page_blocked(browser.driver) else None
                 break
 
+            fresh = []
             for p in page_pairs:
-                key = p.get("question", "")[:50]
+                key = p.question[:50]
                 if key and key not in seen:
                     seen.add(key)
-                    all_pairs.append(p)
+                    fresh.append(p)
+            all_pairs.extend(fresh)
+            checkpoint.add_page(pg, fresh)
 
             # 다음 페이지 클릭
             next_page = pg + 1
             clicked = self._click_page_number(browser.driver, next_page)
+            if clicked == "end":
+                break  # 마지막 페이지
             if not clicked:
+                # 페이지네이션 없음: 첫 페이지면 한 페이지짜리 목록, 그 뒤라면 화면이 바뀐 것 (차단·오류)
+                if pg > 1 or page_blocked(browser.driver):
+                    interrupted = next_page
                 break
             await asyncio.sleep(random.uniform(2.0, 3.5))
 
@@ -104,17 +144,24 @@ class NaverQnAScraper:
                 browser, product_info, next_data
             )
             for p in api_pairs:
-                key = p.get("question", "")[:50]
+                key = p.question[:50]
                 if key and key not in seen:
                     seen.add(key)
                     all_pairs.append(p)
 
-        if progress_cb:
-            progress_cb(f"Q&A {len(all_pairs)}건 수집 완료")
+        if interrupted is None:
+            checkpoint.clear()
+            if progress_cb:
+                progress_cb(f"Q&A {len(all_pairs)}건 수집 완료")
+        elif progress_cb:
+            progress_cb(
+                f"Q&A 수집 중단 (페이지 {interrupted}, CAPTCHA·오류) — {len(all_pairs)}건까지 저장, "
+                "다시 실행하면 이어서 수집합니다"
+            )
 
         return all_pairs
 
-    async def _extract_qna_from_dom(self, driver) -> list[dict]:
+    async def _extract_qna_from_dom(self, driver) -> list[QnAPair]:
         """현재 페이지 DOM에서 Q&A 추출. 각 항목을 클릭하여 답변도 수집.
 
         네이버 Q&A DOM 구조 (접힌 상태):
@@ -311,17 +358,19 @@ class NaverQnAScraper:
             except Exception:
                 continue
 
-        return results
+        return QnAPair.from_dicts(results)
 
-    def _click_page_number(self, driver, page_num: int) -> bool:
+    def _click_page_number(self, driver, page_num: int) -> str:
         """페이지 번호 링크 클릭. 화면에 보이는 링크만 클릭.
-        번호가 현재 블록에 없으면 '다음' 버튼을 클릭."""
+        번호가 현재 블록에 없으면 '다음' 버튼을 클릭.
+        반환: 'page'(번호 클릭) / 'next'(다음 블록) / 'end'(마지막 페이지) / ''(실패)"""
         try:
             clicked = driver.execute_script("""
                 var num = arguments[0].toString();
                 var links = document.querySelectorAll('a');
                 var candidates = [];
                 var nextBtns = [];
+                var hasPager = false;
 
                 for (var i = 0; i < links.length; i++) {
                     var text = links[i].textContent.trim();
@@ -329,6 +378,13 @@ class NaverQnAScraper:
                     if (rect.width === 0 && rect.height === 0) continue;
                     var style = window.getComputedStyle(links[i]);
                     if (style.display === 'none' || style.visibility === 'hidden') continue;
+                    if (!hasPager && /^\\d+$/.test(text) && links[i].parentElement) {
+                        var pagerNums = 0;
+                        links[i].parentElement.querySelectorAll('a').forEach(function(s) {
+                            if (/^\\d+$/.test(s.textContent.trim())) pagerNums++;
+                        });
+                        if (pagerNums >= 2) hasPager = true;
+                    }
 
                     // 정확한 페이지 번호 매칭
                     if (text === num) {
@@ -373,15 +429,63 @@ class NaverQnAScraper:
                     last.click();
                     return 'next';
                 }
+                // 번호 페이지네이션은 보이는데 목표 번호도 '다음'도 없음 → 마지막 페이지
+                if (hasPager) return 'end';
                 return '';
             """, page_num)
-            return bool(clicked)
+            return clicked or ""
         except Exception:
-            return False
+            return ""
+
+    async def scrape_api(
+        self,
+        session,
+        product_info: dict,
+        merchant_no: str,
+        origin_product_no: str,
+        progress_cb: Callable[[str], None] | None = None,
+    ) -> QnASet | None:
+        """문의 API 페이지를 차례로 수집 (브라우저 없이 저장된 쿠키 세션으로 호출).
+
+        첫 페이지가 거부(비정상 응답)되면 None — 호출 측에서 브라우저 수집으로 전환.
+        """
+        all_pairs = QnASet()
+        for pg in range(1, NAVER_MAX_QNA_PAGES + 1):
+            if progress_cb:
+                progress_cb(f"Q&A 수집 중... (API 페이지 {pg})")
+            try:
+                resp = session.get(product_info["qna_api"], params={
+                    "merchantNo": merchant_no,
+                    "originProductNo": origin_product_no,
+                    "page": pg,
+                    "pageSize": 20,
+                    "sortType": "RECENT",
+                }, timeout=15)
+                if resp.status_code != 200:
+                    return None if pg == 1 else all_pairs
+                data = resp.json()
+            except Exception:
+                return None if pg == 1 else all_pairs
+
+            items = (
+                data.get("contents", [])
+                or data.get("inquiries", [])
+                or data.get("items", [])
+            )
+            if not isinstance(items, list) or not items:
+                break
+            all_pairs.extend(QnAPair.from_dicts(p for p in map(self._normalize_api_qna, items) if p))
+            if pg >= data.get("totalPages", pg + 1):
+                break
+            await asyncio.sleep(random.uniform(NAVER_PAGE_DELAY_MIN, NAVER_PAGE_DELAY_MAX))
+
+        if progress_cb:
+            progress_cb(f"Q&A {len(all_pairs)}건 수집 완료")
+        return all_pairs
 
     async def _try_api_fallback(
         self, browser, product_info: dict, next_data: dict | None
-    ) -> list[dict]:
+    ) -> list[QnAPair]:
         """API로 보조 수집 (429가 아닌 경우에만)."""
         try:
             merchant_no = browser.get_merchant_no(next_data)
@@ -418,17 +522,12 @@ class NaverQnAScraper:
             if not isinstance(items, list):
                 return []
 
-            pairs = []
-            for item in items:
-                p = self._normalize_api_qna(item)
-                if p:
-                    pairs.append(p)
-            return pairs
+            return QnAPair.from_dicts(p for p in map(self._normalize_api_qna, items) if p)
         except Exception:
             return []
 
     def _normalize_api_qna(self, item: dict) -> dict | None:
-        """API Q&A JSON → 표준 dict 변환."""
+        """API Q&A JSON → QnAPair 원시 dict (정규화는 QnAPair.from_dicts에서 페이지 단위로)."""
         if not isinstance(item, dict):
             return None
 
@@ -464,10 +563,6 @@ class NaverQnAScraper:
             seller = ""
 
         q_date = item.get("createDate", "") or item.get("inquiryDate", "") or ""
-        if isinstance(q_date, str) and len(q_date) > 10:
-            q_date = q_date[:10]
-        if isinstance(a_date, str) and len(a_date) > 10:
-            a_date = a_date[:10]
 
         return {
             "question": question,
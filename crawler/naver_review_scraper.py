@@ -6,7 +6,6 @@ API는 보조 수단 (429 레이트 리밋 빈번).
 """
 
 import asyncio
-import re
 import time
 import random
 from typing import Callable
@@ -15,7 +14,15 @@ from config.settings import (
     NAVER_MAX_REVIEW_PAGES,
     NAVER_MAX_REVIEWS,
     NAVER_REVIEWS_PER_PAGE,
+    NAVER_REVIEW_PAGE_SIZES,
+    NAVER_REVIEW_SAMPLE_STRATA,
+    NAVER_PAGE_DELAY_MIN,
+    NAVER_PAGE_DELAY_MAX,
 )
+from crawler.checkpoint import CrawlCheckpoint, skip_to_page
+from crawler.waits import page_blocked
+from crawler.sampling import Stratum, probe_page_size, sample_strata
+from models.records import Review, ReviewSet, review_key
 
 
 class NaverReviewScraper:
@@ -27,16 +34,19 @@ class NaverReviewScraper:
         product_info: dict,
         next_data: dict | None,
         progress_cb: Callable[[str, float], None] | None = None,
-    ) -> list[dict]:
+    ) -> ReviewSet:
         """전체 리뷰 수집.
 
+        CAPTCHA·오류 화면으로 멈추면 받은 데까지 반환하고 체크포인트를 남긴다
+        (빈 목록·마지막 페이지·수집 한도에서 끝났을 때만 삭제).
+
         Args:
             browser: NaverBrowser / NaverBrowserCloud
             product_info: parse_naver_url() 결과
             next_data: 페이지 데이터 (호환용, 실제로는 미사용)
             progress_cb: 진행 상황 콜백 (message, percentage)
         """
-        all_reviews = []
+        all_reviews = ReviewSet()
         seen = set()
 
         # 1단계: 스크롤 후 리뷰 탭 클릭
@@ -73,8 +83,31 @@ class NaverReviewScraper:
             pass
         await asyncio.sleep(1)
 
+        # 이전 시도가 중단됐으면 저장분을 복원하고 마지막 페이지 다음으로 이동
+        checkpoint = CrawlCheckpoint("naver-reviews", product_info["product_id"], Review)
+        for r in checkpoint.load():
+            key = (r.author, r.content[:50])
+            if key not in seen:
+                seen.add(key)
+                all_reviews.append(r)
+        start = checkpoint.last_page + 1
+        if start > 1:
+            if progress_cb:
+                progress_cb(f"이전 수집분 {len(all_reviews)}건에서 이어서 수집 (페이지 {start}부터)", 0.0)
+            jumped = await skip_to_page(
+                lambda n: self._click_page_number(browser.driver, n), start,
+                lambda: asyncio.sleep(random.uniform(2.0, 3.5)),
+            )
+            if not jumped:
+                # 이동 실패 — 저장분은 유지하고 현재 페이지부터 번호를 다시 매김
+                checkpoint.clear()
+                checkpoint.add_page(0, all_reviews)
+                start = 1
+
+        interrupted = None  # 차단·오류로 멈춘 페이지 (None: 목록 끝이나 한도까지 수집)
+
         # 2단계: DOM에서 페이지별 리뷰 수집
-        for pg in range(1, NAVER_MAX_REVIEW_PAGES + 1):
+        for pg in range(start, NAVER_MAX_REVIEW_PAGES + 1):
             if progress_cb:
                 pct = (pg / min(NAVER_MAX_REVIEW_PAGES, 10)) * 0.8
                 progress_cb(f"리뷰 수집 중... (페이지 {pg})", min(pct, 0.9))
@@ -82,13 +115,18 @@ class NaverReviewScraper:
             page_reviews = self._extract_reviews_from_dom(browser.driver)
 
             if not page_reviews:
+                # 빈 목록: CAPTCHA·에러 화면이면 중단(체크포인트 유지), 아니면 목록 끝
+                interrupted = pg if page_blocked(browser.driver) else None
                 break
 
+            fresh = []
             for r in page_reviews:
-                key = (r.get("author", ""), r.get("content", "")[:50])
+                key = (r.author, r.content[:50])
                 if key not in seen:
                     seen.add(key)
-                    all_reviews.append(r)
+                    fresh.append(r)
+            all_reviews.extend(fresh)
+            checkpoint.add_page(pg, fresh)
 
             if len(all_reviews) >= NAVER_MAX_REVIEWS:
                 break
@@ -96,7 +134,12 @@ class NaverReviewScraper:
             # 다음 페이지 클릭
             next_page = pg + 1
             clicked = self._click_page_number(browser.driver, next_page)
+            if clicked == "end":
+                break  # 마지막 페이지
             if not clicked:
+                # 페이지네이션 없음: 첫 페이지면 한 페이지짜리 목록, 그 뒤라면 화면이 바뀐 것 (차단·오류)
+                if pg > 1 or page_blocked(browser.driver):
+                    interrupted = next_page
                 break
             await asyncio.sleep(random.uniform(2.0, 3.5))
 
@@ -108,17 +151,24 @@ class NaverReviewScraper:
                 browser, product_info, next_data
             )
             for r in api_reviews:
-                key = (r.get("author", ""), r.get("content", "")[:50])
+                key = (r.author, r.content[:50])
                 if key not in seen:
                     seen.add(key)
                     all_reviews.append(r)
 
-        if progress_cb:
-            progress_cb(f"리뷰 {len(all_reviews)}건 수집 완료", 1.0)
+        if interrupted is None:
+            checkpoint.clear()
+            if progress_cb:
+                progress_cb(f"리뷰 {len(all_reviews)}건 수집 완료", 1.0)
+        elif progress_cb:
+            progress_cb(
+                f"리뷰 수집 중단 (페이지 {interrupted}, CAPTCHA·오류) — {len(all_reviews)}건까지 저장, "
+                "다시 실행하면 이어서 수집합니다", 1.0,
+            )
 
         return all_reviews[:NAVER_MAX_REVIEWS]
 
-    def _extract_reviews_from_dom(self, driver) -> list[dict]:
+    def _extract_reviews_from_dom(self, driver) -> list[Review]:
         """현재 페이지 DOM에서 리뷰 추출. 클래스명 의존 없이 구조 기반."""
         try:
             reviews = driver.execute_script("""
@@ -199,19 +249,21 @@ class NaverReviewScraper:
                 }
                 return results;
             """)
-            return reviews or []
+            return Review.from_dicts(reviews or [])
         except Exception:
             return []
 
-    def _click_page_number(self, driver, page_num: int) -> bool:
+    def _click_page_number(self, driver, page_num: int) -> str:
         """페이지 번호 링크 클릭. 화면에 보이는 링크만 클릭.
-        번호가 현재 블록에 없으면 '다음' 버튼을 클릭."""
+        번호가 현재 블록에 없으면 '다음' 버튼을 클릭.
+        반환: 'page'(번호 클릭) / 'next'(다음 블록) / 'end'(마지막 페이지) / ''(실패)"""
         try:
             clicked = driver.execute_script("""
                 var num = arguments[0].toString();
                 var links = document.querySelectorAll('a');
                 var candidates = [];
                 var nextBtns = [];
+                var hasPager = false;
 
                 for (var i = 0; i < links.length; i++) {
                     var text = links[i].textContent.trim();
@@ -219,6 +271,13 @@ class NaverReviewScraper:
                     if (rect.width === 0 && rect.height === 0) continue;
                     var style = window.getComputedStyle(links[i]);
                     if (style.display === 'none' || style.visibility === 'hidden') continue;
+                    if (!hasPager && /^\\d+$/.test(text) && links[i].parentElement) {
+                        var pagerNums = 0;
+                        links[i].parentElement.querySelectorAll('a').forEach(function(s) {
+                            if (/^\\d+$/.test(s.textContent.trim())) pagerNums++;
+                        });
+                        if (pagerNums >= 2) hasPager = true;
+                    }
 
                     if (text === num) {
                         var parent = links[i].parentElement;
@@ -259,15 +318,90 @@ class NaverReviewScraper:
                     nextBtns[0].click();
                     return 'next';
                 }
+                // 번호 페이지네이션은 보이는데 목표 번호도 '다음'도 없음 → 마지막 페이지
+                if (hasPager) return 'end';
                 return '';
             """, page_num)
-            return bool(clicked)
+            return clicked or ""
         except Exception:
-            return False
+            return ""
+
+    async def scrape_api(
+        self,
+        session,
+        product_info: dict,
+        merchant_no: str,
+        origin_product_no: str,
+        progress_cb: Callable[[str, float], None] | None = None,
+    ) -> ReviewSet | None:
+        """리뷰 API 페이지를 차례로 수집 (브라우저 없이 저장된 쿠키 세션으로 호출).
+
+        첫 페이지가 거부(비정상 응답)되면 None — 호출 측에서 브라우저 수집으로 전환.
+        첫 페이지로 허용되는 가장 큰 페이지 크기를 정하고, 리뷰가 NAVER_MAX_REVIEWS보다 많으면
+        랭킹순 앞 페이지 대신 정렬별 층화 표본을 받는다 (crawler.sampling).
+        """
+        total_count = None
+
+        def fetch(params: dict, page: int, size: int) -> list[Review] | None:
+            nonlocal total_count
+            try:
+                resp = session.get(product_info["review_api"], params={
+                    "merchantNo": merchant_no,
+                    "originProductNo": origin_product_no,
+                    "page": page,
+                    "pageSize": size,
+                    **params,
+                }, timeout=15)
+                if resp.status_code != 200:
+                    return None
+                data = resp.json()
+            except Exception:
+                return None
+            total_count = data.get("totalElements") or total_count
+            items = data.get("contents", []) or data.get("reviews", [])
+            if not isinstance(items, list):
+                return []
+            return Review.from_dicts(r for r in map(self._normalize_api_review, items) if r)
+
+        def delay():
+            return asyncio.sleep(random.uniform(NAVER_PAGE_DELAY_MIN, NAVER_PAGE_DELAY_MAX))
+
+        if progress_cb:
+            progress_cb("리뷰 수집 중... (API 페이지 1)", 0.0)
+        base = {"sortType": "REVIEW_RANKING"}
+        size, first = probe_page_size(lambda n: fetch(base, 1, n), NAVER_REVIEW_PAGE_SIZES, NAVER_REVIEWS_PER_PAGE)
+        if first is None:
+            return None
+
+        if total_count and total_count > NAVER_MAX_REVIEWS:
+            strata = [Stratum({"sortType": st}, share, filtered)
+                      for st, share, filtered in NAVER_REVIEW_SAMPLE_STRATA]
+            sample, weights = await sample_strata(
+                fetch, strata, size, NAVER_MAX_REVIEWS, review_key, delay,
+                first=(base, first), progress_cb=progress_cb, group=lambda r: r.star,
+            )
+            all_reviews = ReviewSet(sample, weights)
+        else:
+            all_reviews = ReviewSet(first)
+            target = min(total_count or NAVER_MAX_REVIEWS, NAVER_MAX_REVIEWS)
+            pg = 1
+            while first and len(all_reviews) < target and pg < NAVER_MAX_REVIEW_PAGES:
+                pg += 1
+                if progress_cb:
+                    progress_cb(f"리뷰 수집 중... (API 페이지 {pg})", min(pg / 10, 0.9))
+                await delay()
+                reviews = fetch(base, pg, size)
+                if not reviews:
+                    break
+                all_reviews.extend(reviews)
+
+        if progress_cb:
+            progress_cb(f"리뷰 {len(all_reviews)}건 수집 완료", 1.0)
+        return all_reviews[:NAVER_MAX_REVIEWS]
 
     async def _try_api_fallback(
         self, browser, product_info: dict, next_data: dict | None
-    ) -> list[dict]:
+    ) -> list[Review]:
         """API로 보조 수집 (429가 아닌 경우에만)."""
         try:
             merchant_no = browser.get_merchant_no(next_data)
@@ -299,17 +433,12 @@ class NaverReviewScraper:
             if not isinstance(items, list):
                 return []
 
-            reviews = []
-            for item in items:
-                r = self._normalize_api_review(item)
-                if r:
-                    reviews.append(r)
-            return reviews
+            return Review.from_dicts(r for r in map(self._normalize_api_review, items) if r)
         except Exception:
             return []
 
     def _normalize_api_review(self, item: dict) -> dict | None:
-        """API 리뷰 JSON → 표준 dict 변환."""
+        """API 리뷰 JSON → Review 원시 dict (정규화는 Review.from_dicts에서 페이지 단위로)."""
         if not isinstance(item, dict):
             return None
 
@@ -327,14 +456,7 @@ class NaverReviewScraper:
         )
 
         rating = item.get("reviewScore") or item.get("score") or item.get("rating")
-        try:
-            rating = float(rating) if rating else None
-        except (ValueError, TypeError):
-            rating = None
-
         date = item.get("createDate", "") or item.get("writtenDate", "") or ""
-        if isinstance(date, str) and len(date) > 10:
-            date = date[:10]
 
         option = ""
         product_option = item.get("productOption", "") or item.get("optionText", "")
@@ -352,6 +474,6 @@ class NaverReviewScraper:
             "date": date,
             "headline": item.get("headline", "") or item.get("title", "") or "",
             "content": content,
-            "helpful": item.get("helpCount", 0) or 0,
+            "helpful": item.get("helpCount", 0),
             "option": option,
         }
@@ -0,0 +1,78 @@
+"""네이버 __PRELOADED_STATE__ (Redux) 추출
+
+스마트스토어·브랜드스토어 상품 페이지의 Redux 상태에서 필요한 부분(상품, 채널,
+리뷰 요약, 상세 HTML, 속성)만 골라 한 번의 execute_script로 직렬화한다.
+상품 정보 / merchantNo / originProductNo 소비자는 모두 이 dict를 재사용한다.
+"""
+
+# 반환 형식: {"_source": "preloaded", "product": {...}, "channel": {...}}
+# product 키 이름은 __NEXT_DATA__의 pageProps.product와 맞춘다 (NaverProductPageScraper 공용).
+PRELOADED_STATE_JS = """
+    var s;
+    try { s = __PRELOADED_STATE__; } catch (e) { return null; }
+    if (!s) return null;
+    function pick(slice) { return slice && (slice.A || slice); }
+
+    var p = pick(s.simpleProductForDetailPage) || pick(s.product) || {};
+    var ch = p.channel || (s.smartStoreV2 && s.smartStoreV2.channel) || {};
+    var bs = pick(s.brandStore) || {};
+    var benefit = p.benefitsView || {};
+
+    var review = p.reviewAmount || pick(s.productReviewSummary) || {};
+
+    var detail = p.detailContents;
+    if (detail && typeof detail === 'object') detail = detail.detailContentText || detail.editorContent || '';
+    if (!detail) {
+        var pd = pick(s.productDetail) || {};
+        detail = pd.contents || pd.renderContent || pd.detailContentText || '';
+    }
+
+    var attrs = [];
+    (p.productAttributes || pick(s.productAttributes) || []).forEach(function (a) {
+        if (!a) return;
+        var name = a.attributeName || a.name;
+        var value = a.attributeValue || a.attributeValueName || a.value;
+        if (name && value) attrs.push({attributeName: String(name), attributeValue: String(value)});
+    });
+
+    var images = [];
+    (p.productImages || []).forEach(function (img) {
+        var url = img && (img.url || img);
+        if (typeof url === 'string') images.push({url: url});
+    });
+
+    var channelNo = ch.channelNo || bs.channelNo || null;
+    return {
+        _source: 'preloaded',
+        product: {
+            id: p.id ? String(p.id) : null,
+            productNo: p.productNo ? String(p.productNo) : null,
+            name: p.name || p.productName || '',
+            salePrice: p.salePrice || null,
+            discountedSalePrice: benefit.discountedSalePrice || p.discountedSalePrice || null,
+            reviewAmount: {
+                totalReviewCount: review.totalReviewCount || null,
+                averageReviewScore: review.averageReviewScore || null
+            },
+            detailContents: typeof detail === 'string' ? detail : '',
+            productImages: images,
+            productAttributes: attrs
+        },
+        channel: {
+            channelNo: channelNo ? String(channelNo) : null,
+            channelName: ch.channelName || bs.channelName || ''
+        }
+    };
+"""
+
+
+def is_preloaded(page_data: dict | None) -> bool:
+    return bool(page_data) and page_data.get("_source") == "preloaded"
+
+
+def preloaded_merchant_no(page_data: dict) -> str | None:
+    return (page_data.get("channel") or {}).get("channelNo")
+
+
+def preloaded_origin_product_no(page_data: dict) -> str | None:
+    return (page_data.get("product") or {}).get("id")
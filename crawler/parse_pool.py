@@ -0,0 +1,101 @@
+"""HTML 파싱 프로세스 풀
+
+리뷰 API 페이지의 BeautifulSoup 파싱은 CPU 작업이라 수집 스레드에서 하면 GIL을 잡고
+Streamlit 스레드와 번갈아 실행된다. 받은 원문 HTML을 프로세스 풀에 넘겨 코어 수만큼
+병렬로 파싱하고, 결과는 피클 비용이 작은 튜플 레코드로 돌려받는다.
+- 워커 수가 1 이하이거나 풀을 띄우지 못하면 호출 스레드에서 바로 파싱
+- 워커는 spawn으로 시작 (Streamlit·수집 스레드가 떠 있는 프로세스를 fork하지 않음)
+- 파서 함수는 워커가 이름으로 import할 수 있는 모듈 최상위 함수여야 한다
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable
+
+from config.settings import PARSE_WORKERS, PARSE_WORKERS_MAX
+
+
+def default_workers() -> int:
+    if PARSE_WORKERS > 0:
+        return PARSE_WORKERS
+    return max(1, min(PARSE_WORKERS_MAX, (os.cpu_count() or 1) - 1))
+
+
+class ParsePool:
+    def __init__(self, workers: int | None = None):
+        self.workers = default_workers() if workers is None else workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._broken = False
+
+    def _get_executor(self) -> ProcessPoolExecutor | None:
+        if self.workers <= 1 or self._broken:
+            return None
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None and not self._broken:
+                    try:
+                        self._executor = ProcessPoolExecutor(
+                            self.workers, mp_context=multiprocessing.get_context("spawn"),
+                        )
+                    except Exception as e:
+                        print(f"[ParsePool] 프로세스 풀 시작 실패, 수집 스레드에서 파싱합니다: {e}")
+                        self._broken = True
+        return self._executor
+
+    def _submit(self, fn: Callable, text: str) -> Future:
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                return executor.submit(fn, text)
+            except (BrokenProcessPool, RuntimeError) as e:
+                print(f"[ParsePool] 프로세스 풀 사용 불가, 수집 스레드에서 파싱합니다: {e}")
+                self._broken = True
+        future = Future()
+        try:
+            future.set_result(fn(text))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _result(self, future: Future, fn: Callable, text: str):
+        """결과 대기 (대기 중에는 GIL을 놓는다). 워커가 죽었으면 이 페이지만 직접 다시 파싱."""
+        try:
+            return future.result()
+        except BrokenProcessPool as e:
+            print(f"[ParsePool] 파싱 워커 종료, 수집 스레드에서 파싱합니다: {e}")
+            self._broken = True
+            return fn(text)
+
+    def run(self, fn: Callable, text: str):
+        """fn(text)를 워커에서 실행하고 결과 반환 (파서 예외는 그대로 전달)"""
+        return self._result(self._submit(fn, text), fn, text)
+
+    def map(self, fn: Callable, texts: Iterable[str]) -> list:
+        """여러 페이지를 한꺼번에 제출하고 입력 순서대로 결과 반환"""
+        texts = list(texts)
+        futures = [self._submit(fn, t) for t in texts]
+        return [self._result(f, fn, t) for f, t in zip(futures, texts)]
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+
+_pool: ParsePool | None = None
+_pool_lock = threading.Lock()
+
+
+def parse_pool() -> ParsePool:
+    """프로세스 공용 파싱 풀 (첫 사용 시 워커 시작)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ParsePool()
+    return _pool
@@ -1,13 +1,57 @@
-"""상품 페이지 정보 스크래핑 (제목, 가격, 평점, 상세 이미지 URL)"""
+"""상품 페이지 정보 스크래핑 (제목, 가격, 평점, 상세 이미지 URL)
 
-import re
+요소마다 WebDriver를 왕복하지 않도록 페이지 안에서 스크립트 한 번으로
+제목·가격·리뷰 탭 문구·상세 이미지(중복 제거)·스펙 행을 모아 받는다.
+"""
 
 from config.selectors import (
     PRODUCT_TITLE,
     PRODUCT_PRICE,
+    PRODUCT_SPEC_ROW,
     DETAIL_IMAGE,
-    TAB_REVIEW_XPATH,
 )
+from utils.text_cleaner import parse_paren_count
+
+# arguments[0]: {title, price, image, spec} 셀렉터
+PRODUCT_SNAPSHOT_JS = """(function (sel) {
+    function text(q) {
+        var el = document.querySelector(q);
+        return el ? el.innerText.trim() : '';
+    }
+
+    // 리뷰 수: '상품평(1,234)' 탭 (textContent로 먼저 걸러 레이아웃 계산 최소화)
+    var reviewTab = '';
+    var links = document.getElementsByTagName('a');
+    for (var i = 0; i < links.length; i++) {
+        if (links[i].textContent.indexOf('상품평') >= 0) {
+            reviewTab = links[i].innerText.trim();
+            break;
+        }
+    }
+
+    var images = [], seen = {};
+    document.querySelectorAll(sel.image).forEach(function (img) {
+        var src = img.getAttribute('src') || img.getAttribute('data-img-src');
+        if (!src || (src.indexOf('vendor_inventory') < 0 && src.indexOf('product') < 0)) return;
+        if (src.indexOf('http') !== 0) src = 'https:' + src;
+        if (!seen[src]) { seen[src] = true; images.push(src); }
+    });
+
+    var specs = [];
+    document.querySelectorAll(sel.spec).forEach(function (row) {
+        var t = row.innerText.trim();
+        if (t) specs.push(t);
+    });
+
+    return {
+        docTitle: document.title,
+        title: text(sel.title),
+        price: text(sel.price),
+        reviewTab: reviewTab,
+        images: images,
+        specs: specs
+    };
+})(arguments[0])"""
 
 
 class ProductPageScraper:
@@ -24,61 +68,24 @@ class ProductPageScraper:
             "specifications": [],
         }
 
-        # 제목 (title 태그에서 추출)
-        title_tag = await page.title()
-        if title_tag:
-            # "상품명 - 카테고리 | 쿠팡" 형식에서 상품명만 추출
-            data["title"] = title_tag.split(" | ")[0].strip()
-
-        # 제목 (buy 섹션에서 추출 시도)
-        try:
-            title_el = await page.query_selector(PRODUCT_TITLE)
-            if title_el:
-                data["title"] = (await title_el.inner_text()).strip()
-        except Exception:
-            pass
-
-        # 가격
         try:
-            price_el = await page.query_selector(PRODUCT_PRICE)
-            if price_el:
-                data["price"] = (await price_el.inner_text()).strip()
+            snap = await page.evaluate(PRODUCT_SNAPSHOT_JS, {
+                "title": PRODUCT_TITLE,
+                "price": PRODUCT_PRICE,
+                "image": DETAIL_IMAGE,
+                "spec": PRODUCT_SPEC_ROW,
+            })
         except Exception:
-            pass
+            return data
+        if not snap:
+            return data
 
-        # 리뷰 수 (탭에서 추출)
-        try:
-            tabs = await page.query_selector_all("a")
-            for tab in tabs:
-                text = (await tab.inner_text()).strip()
-                if "상품평" in text:
-                    m = re.search(r"\((\d[\d,]*)\)", text)
-                    if m:
-                        data["review_count"] = int(m.group(1).replace(",", ""))
-                    break
-        except Exception:
-            pass
-
-        # 상세페이지 이미지 URL
-        try:
-            images = await page.query_selector_all(DETAIL_IMAGE)
-            for img in images:
-                src = await img.get_attribute("src") or await img.get_attribute("data-img-src")
-                if src and ("vendor_inventory" in src or "product" in src):
-                    if not src.startswith("http"):
-                        src = "https:" + src
-                    data["detail_image_urls"].append(src)
-        except Exception:
-            pass
-
-        # 상품 속성 / 스펙
-        try:
-            spec_rows = await page.query_selector_all(".prod-attr-item")
-            for row in spec_rows:
-                text = (await row.inner_text()).strip()
-                if text:
-                    data["specifications"].append(text)
-        except Exception:
-            pass
+        # 제목: buy 섹션 우선, 없으면 "상품명 - 카테고리 | 쿠팡" 형식의 title 태그에서 상품명만
+        data["title"] = snap.get("title") or (snap.get("docTitle") or "").split(" | ")[0].strip()
+        data["price"] = snap.get("price") or ""
+        if snap.get("reviewTab"):
+            data["review_count"] = parse_paren_count(snap["reviewTab"])
+        data["detail_image_urls"] = snap.get("images") or []
+        data["specifications"] = snap.get("specs") or []
 
         return data
@@ -1,25 +1,208 @@
-"""쿠팡 Q&A(상품문의) 수집기"""
+"""쿠팡 Q&A(상품문의) 수집기 (HTTP 우선 + UI fallback)
 
-import re
+HTTP: 브라우저 쿠키 세션으로 문의 페이지 조각을 여러 페이지 동시에 받아 오프라인 파싱.
+UI: 탭 클릭 → 페이지 버튼 클릭 → 엔트리별 WebDriver 조회 (HTTP가 거부될 때만).
+"""
+
+import asyncio
+import time
 from typing import Callable
 
-from config.selectors import TAB_QNA_XPATH, QNA_ENTRY, QNA_CONTENT
-from config.settings import MAX_QNA_PAGES
+from bs4 import BeautifulSoup
+
+from config.selectors import TAB_QNA_XPATH, QNA_ENTRY, QNA_CONTENT, QNA_SELLER, QNA_EMPTY_MARKERS
+from config.settings import (
+    MAX_QNA_PAGES,
+    COUPANG_QNA_API,
+    COUPANG_QNA_API_CONCURRENCY,
+    COUPANG_QNA_API_MIN_INTERVAL,
+)
 from crawler.anti_detect import page_transition_delay, short_delay
+from models.records import QnAPair, QnASet, qna_key
+from utils.text_cleaner import find_date
+
+# lxml이 설치되어 있으면 더 빠른 파서 사용
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+
+def _entry_type(text: str) -> str:
+    """배지 텍스트로 질문/답변 판별"""
+    if "질문" in text[:10]:
+        return "question"
+    if "답변" in text[:10]:
+        return "answer"
+    return "unknown"
+
+
+def _strip_badge_and_date(text: str) -> str:
+    """본문 셀렉터가 없을 때: 전체 텍스트에서 첫 줄(배지)과 마지막 줄(날짜) 제외"""
+    lines = [l.strip() for l in text.split("\n") if l.strip()]
+    if len(lines) > 2:
+        return " ".join(lines[1:-1])
+    elif len(lines) > 1:
+        return lines[1]
+    return ""
+
+
+def _pair_entries(entries) -> list[QnAPair]:
+    """(유형, 본문, 날짜, 판매자) 순서열 → 질문-답변 페어"""
+    pairs = []  # 원시 dict — 끝에서 한꺼번에 정규화
+    current_question = None
+
+    for entry_type, content, date, seller in entries:
+        if entry_type == "question":
+            # 이전 질문이 답변 없이 남아있으면 저장
+            if current_question:
+                pairs.append(current_question)
+            current_question = {
+                "question": content,
+                "answer": "",
+                "q_date": date,
+                "a_date": "",
+                "seller": "",
+            }
+        elif entry_type == "answer" and current_question:
+            current_question["answer"] = content
+            current_question["a_date"] = date
+            current_question["seller"] = seller
+            pairs.append(current_question)
+            current_question = None
+
+    # 마지막 질문이 답변 없이 남은 경우
+    if current_question:
+        pairs.append(current_question)
+
+    return QnAPair.from_dicts(pairs)
+
+
+class _Pacer:
+    """요청 시작 간격을 interval 이상으로 유지 (동시 요청 전체에 대한 속도 예산)"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+            self._next = max(now, self._next) + self.interval
 
 
 class QnAScraper:
+    async def scrape_all(
+        self,
+        browser,
+        product_info: dict,
+        progress_cb: Callable[[str], None] | None = None,
+    ) -> QnASet:
+        """HTTP로 먼저 수집, 거부되면 UI로 수집"""
+        session = await browser.extract_cookies_session(product_info["full_url"])
+        pairs = await self.scrape_api(session, product_info, progress_cb)
+        if pairs is None:
+            pairs = await self.scrape(browser.page, progress_cb)
+        return pairs
+
+    async def scrape_api(
+        self,
+        session,
+        product_info: dict,
+        progress_cb: Callable[[str], None] | None = None,
+    ) -> QnASet | None:
+        """문의 페이지 조각을 HTTP로 수집. 첫 페이지부터 거부되면 None.
+
+        첫 페이지에 문의 항목도 '문의 없음' 안내도 없으면 (마크업 변경, 차단 페이지) 역시 None —
+        빈 QnASet은 문의가 없다고 확인된 상품에만 반환한다.
+
+        COUPANG_QNA_API_CONCURRENCY 페이지씩 동시에 요청하고, 요청 시작 간격은
+        COUPANG_QNA_API_MIN_INTERVAL 이상으로 유지한다.
+        브라우저 없이 저장된 쿠키 세션으로도 호출할 수 있다 (crawler.fast_path).
+        """
+        first = await asyncio.to_thread(self._fetch_qna_api, session, product_info, 1)
+        if first is None:
+            return None
+
+        all_pairs = QnASet(first)
+        seen = {qna_key(q) for q in first}
+        pacer = _Pacer(COUPANG_QNA_API_MIN_INTERVAL)
+
+        async def fetch(pg: int):
+            await pacer.wait()
+            return await asyncio.to_thread(self._fetch_qna_api, session, product_info, pg)
+
+        pg = 2
+        done = not first
+        while not done and pg <= MAX_QNA_PAGES:
+            batch = range(pg, min(pg + COUPANG_QNA_API_CONCURRENCY, MAX_QNA_PAGES + 1))
+            if progress_cb:
+                progress_cb(f"Q&A 수집 중... (페이지 {batch[0]}~{batch[-1]})")
+            for pairs in await asyncio.gather(*(fetch(n) for n in batch)):
+                # 빈 페이지 / 실패 / 마지막 페이지 반복 응답이면 끝
+                new = [q for q in pairs or [] if qna_key(q) not in seen]
+                if not new:
+                    done = True
+                    break
+                seen.update(qna_key(q) for q in new)
+                all_pairs.extend(new)
+            pg = batch.stop
+
+        return all_pairs
+
+    def _fetch_qna_api(self, session, product_info: dict, page: int) -> list[QnAPair] | None:
+        """문의 페이지 조각 요청 후 파싱. 요청이 거부되거나 첫 페이지를 해석할 수 없으면 None."""
+        params = {
+            "pageNo": page,
+            "isPreview": "false",
+            "vendorItemId": product_info.get("vendor_item_id", ""),
+        }
+        try:
+            resp = session.get(
+                COUPANG_QNA_API.format(product_id=product_info["product_id"]),
+                params=params, timeout=10,
+            )
+            if resp.status_code != 200 or "Access Denied" in resp.text[:500]:
+                return None
+            pairs = self._parse_qna_html(resp.text)
+            if page == 1 and not pairs and not any(m in resp.text for m in QNA_EMPTY_MARKERS):
+                print("[QnAScraper] 첫 페이지에 문의 항목이 없고 '문의 없음' 안내도 없음 — 실패로 처리")
+                return None
+            return pairs
+        except Exception:
+            return None
+
+    def _parse_qna_html(self, html_text: str) -> list[QnAPair]:
+        """문의 HTML 조각 오프라인 파싱 (UI 파싱과 같은 규칙)"""
+        soup = BeautifulSoup(html_text, _HTML_PARSER)
+        items = []
+        for entry in soup.select(QNA_ENTRY):
+            text = entry.get_text("\n", strip=True)
+            entry_type = _entry_type(text)
+            content_el = entry.select_one(QNA_CONTENT)
+            content = content_el.get_text(strip=True) if content_el else ""
+            seller = ""
+            if entry_type == "answer":
+                seller_el = entry.select_one(QNA_SELLER)
+                seller = seller_el.get_text(strip=True) if seller_el else ""
+            items.append((entry_type, content or _strip_badge_and_date(text), find_date(text), seller))
+        return _pair_entries(items)
+
     async def scrape(
         self,
         page,
         progress_cb: Callable[[str], None] | None = None,
-    ) -> list[dict]:
-        """Q&A 탭 클릭 후 질문-답변 페어 수집"""
+    ) -> QnASet:
+        """Q&A 탭 클릭 후 질문-답변 페어 수집 (UI)"""
 
         # Q&A 탭 클릭
         await self._click_qna_tab(page)
 
-        all_pairs = []
+        all_pairs = QnASet()
         pg = 1
 
         while pg <= MAX_QNA_PAGES:
@@ -41,53 +224,27 @@ class QnAScraper:
 
         return all_pairs
 
-    async def _parse_qna_page(self, page) -> list[dict]:
+    async def _parse_qna_page(self, page) -> list[QnAPair]:
         """현재 페이지의 Q&A 엔트리 파싱"""
         entries = await page.query_selector_all(QNA_ENTRY)
         if not entries:
             return []
 
-        pairs = []
-        current_question = None
-
+        items = []
         for entry in entries:
             entry_type = await self._detect_type(entry)
-            content = await self._extract_content(entry)
-            date = await self._extract_date(entry)
-
-            if entry_type == "question":
-                # 이전 질문이 답변 없이 남아있으면 저장
-                if current_question:
-                    pairs.append(current_question)
-                current_question = {
-                    "question": content,
-                    "answer": "",
-                    "q_date": date,
-                    "a_date": "",
-                    "seller": "",
-                }
-            elif entry_type == "answer" and current_question:
-                current_question["answer"] = content
-                current_question["a_date"] = date
-                current_question["seller"] = await self._extract_seller(entry)
-                pairs.append(current_question)
-                current_question = None
-
-        # 마지막 질문이 답변 없이 남은 경우
-        if current_question:
-            pairs.append(current_question)
-
-        return pairs
+            items.append((
+                entry_type,
+                await self._extract_content(entry),
+                await self._extract_date(entry),
+                await self._extract_seller(entry) if entry_type == "answer" else "",
+            ))
+        return _pair_entries(items)
 
     async def _detect_type(self, entry) -> str:
         """Q&A 엔트리가 질문인지 답변인지 판별"""
         try:
-            full_text = await entry.inner_text()
-            # 배지 텍스트로 판별
-            if "질문" in full_text[:10]:
-                return "question"
-            if "답변" in full_text[:10]:
-                return "answer"
+            return _entry_type(await entry.inner_text())
         except Exception:
             pass
         return "unknown"
@@ -103,13 +260,7 @@ class QnAScraper:
 
         # fallback: 전체 텍스트에서 배지/날짜 제거
         try:
-            text = await entry.inner_text()
-            lines = [l.strip() for l in text.split("\n") if l.strip()]
-            # 첫 줄(배지)과 마지막 줄(날짜) 제외
-            if len(lines) > 2:
-                return " ".join(lines[1:-1])
-            elif len(lines) > 1:
-                return lines[1]
+            return _strip_badge_and_date(await entry.inner_text())
         except Exception:
             pass
         return ""
@@ -117,10 +268,7 @@ class QnAScraper:
     async def _extract_date(self, entry) -> str:
         """날짜 추출"""
         try:
-            text = await entry.inner_text()
-            m = re.search(r"\d{4}/\d{2}/\d{2}", text)
-            if m:
-                return m.group(0)
+            return find_date(await entry.inner_text())
         except Exception:
             pass
         return ""
@@ -128,7 +276,7 @@ class QnAScraper:
     async def _extract_seller(self, entry) -> str:
         """판매자 정보 추출"""
         try:
-            bold = await entry.query_selector(".twc-font-bold")
+            bold = await entry.query_selector(QNA_SELLER)
             if bold:
                 return (await bold.inner_text()).strip()
         except Exception:
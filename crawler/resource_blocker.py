@@ -0,0 +1,34 @@
+"""크롤링 브라우저 리소스 차단 (CDP Network.setBlockedURLs)
+
+수집기는 DOM 텍스트와 이미지 URL(src 속성)만 읽으므로 이미지·미디어·폰트 다운로드와
+광고·분석 스크립트 요청을 막아 페이지 로드와 리뷰 페이지 이동마다의 전송량을 줄인다.
+요청만 막을 뿐 src 속성은 DOM에 그대로 남아 상세 이미지 URL 수집에는 영향이 없다.
+봇 탐지 스크립트(Akamai 등)는 차단하면 접속이 막히므로 대상에서 제외한다.
+"""
+
+from config.settings import BLOCK_RESOURCES, BLOCKED_RESOURCE_PATTERNS, BLOCKED_TRACKER_DOMAINS
+
+
+def blocked_urls() -> list[str]:
+    return list(BLOCKED_RESOURCE_PATTERNS) + [f"*://*{domain}/*" for domain in BLOCKED_TRACKER_DOMAINS]
+
+
+def block_resources(driver) -> bool:
+    """브라우저 세션 전체에 차단 목록 적용. 실패하면 전체 로드로 진행."""
+    if not BLOCK_RESOURCES:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls()})
+        return True
+    except Exception as e:
+        print(f"[ResourceBlocker] 리소스 차단 설정 실패 (전체 로드로 진행): {e}")
+        return False
+
+
+def unblock_resources(driver):
+    """차단 해제 (CAPTCHA 이미지처럼 사용자가 봐야 하는 화면용)"""
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+    except Exception:
+        pass
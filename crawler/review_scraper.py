@@ -4,7 +4,8 @@
 주요 개선: API 우선 전략, content 빈값 문제 fallback 셀렉터 체인.
 """
 
-import re
+import asyncio
+from dataclasses import astuple
 from typing import Callable
 
 from bs4 import BeautifulSoup
@@ -15,6 +16,8 @@ from config.settings import (
     MAX_REVIEWS,
     REVIEWS_PER_PAGE,
     UI_PAGE_LIMIT,
+    COUPANG_REVIEW_PAGE_SIZES,
+    COUPANG_REVIEW_SAMPLE_STRATA,
 )
 from config.selectors import (
     REVIEW_ARTICLE_TW,
@@ -35,23 +38,128 @@ from config.selectors import (
     HEADLINE_API,
     CONTENT_API,
     HELPFUL_API,
+    REVIEW_TOTAL_COUNT_API,
+    REVIEW_AVERAGE_STAR_API,
 )
 from crawler.anti_detect import page_transition_delay, short_delay
+from crawler.checkpoint import CrawlCheckpoint
+from crawler.parse_pool import parse_pool
+from crawler.sampling import Stratum, probe_page_size, sample_strata
+from models.records import Review, ReviewSet, review_key
+from utils.text_cleaner import parse_int, parse_paren_count
+
+# '상품평(1,234)' 탭 문구 — textContent로 먼저 걸러 innerText(레이아웃 계산)는 한 번만
+REVIEW_TAB_TEXT_JS = """(function () {
+    var links = document.getElementsByTagName('a');
+    for (var i = 0; i < links.length; i++) {
+        if (links[i].textContent.indexOf('상품평') >= 0) return links[i].innerText.trim();
+    }
+    return '';
+})()"""
+
+
+def _parse_rating_summary(soup) -> tuple[int | None, float | None]:
+    """평점 요약 영역에서 (총 리뷰 수, 평균 평점). 응답에 없으면 None."""
+    total_count = average_rating = None
+    try:
+        count_el = soup.select_one(REVIEW_TOTAL_COUNT_API)
+        if count_el:
+            total_count = parse_int(count_el.get_text(strip=True)) or None
+        star = soup.select_one(REVIEW_AVERAGE_STAR_API)
+        style = star.get("style", "") if star else ""
+        if "width:" in style:
+            w = style.split("width:")[1].split("%")[0].strip()
+            average_rating = round(float(w) / 20, 1)
+    except Exception:
+        pass
+    return total_count, average_rating
+
+
+def parse_reviews_html(html_text: str) -> tuple[list[tuple], int | None, float | None]:
+    """API 응답 HTML 파싱 (sdp-review 전통 구조) → (Review 필드 튜플 목록, 총 리뷰 수, 평균 평점)
+
+    파싱 프로세스 풀(crawler.parse_pool) 워커에서 실행되므로 모듈 최상위 함수로 두고,
+    결과는 피클이 가벼운 튜플로 반환한다 (Review(*row)로 복원).
+    """
+    soup = BeautifulSoup(html_text, "html.parser")
+    total_count, average_rating = _parse_rating_summary(soup)
+    raw = []
+
+    articles = soup.select(REVIEW_ARTICLE_API)
+    if not articles:
+        articles = soup.select(REVIEW_ARTICLE_API_ALT)
+
+    for art in articles:
+        r = {}
+
+        # 별점 (width 퍼센트 → 5점 만점)
+        try:
+            star = art.select_one(STAR_API)
+            if star:
+                style = star.get("style", "")
+                if "width:" in style:
+                    w = style.split("width:")[1].split("%")[0].strip()
+                    r["rating"] = round(float(w) / 20, 1)
+        except Exception:
+            r["rating"] = None
+
+        # 작성자
+        try:
+            r["author"] = art.select_one(AUTHOR_API).get_text(strip=True)
+        except Exception:
+            r["author"] = ""
+
+        # 날짜
+        try:
+            r["date"] = art.select_one(DATE_API).get_text(strip=True)
+        except Exception:
+            r["date"] = ""
+
+        # 헤드라인
+        try:
+            r["headline"] = art.select_one(HEADLINE_API).get_text(strip=True)
+        except Exception:
+            r["headline"] = ""
+
+        # 본문
+        try:
+            r["content"] = art.select_one(CONTENT_API).get_text(strip=True)
+        except Exception:
+            r["content"] = ""
+
+        # 도움이 돼요
+        r["helpful"] = 0
+        try:
+            r["helpful"] = parse_int(art.select_one(HELPFUL_API).get_text(strip=True))
+        except Exception:
+            pass
+
+        if r.get("author") or r.get("content"):
+            raw.append(r)
+
+    return [astuple(r) for r in Review.from_dicts(raw)], total_count, average_rating
 
 
 class ReviewScraper:
     """하이브리드 리뷰 수집기: API 우선, UI fallback"""
 
+    def __init__(self):
+        # API 첫 페이지의 평점 요약 (ratingSummary=true)
+        self.total_count: int | None = None
+        self.average_rating: float | None = None
+
     async def scrape_all(
         self,
         browser,
         product_info: dict,
         progress_cb: Callable[[str, float], None] | None = None,
-    ) -> list[dict]:
-        """전체 리뷰 수집. API → UI fallback 순서."""
-        all_reviews = []
-        total_expected = None
+        known: set[str] | None = None,
+    ) -> ReviewSet:
+        """전체 리뷰 수집. API → UI fallback 순서.
 
+        known: 이전 수집분의 리뷰 키(review_key). 주어지면 최신순으로 받고
+        새 리뷰가 없는 페이지에서 멈춘다 (감시 모드 증분 수집).
+        """
         # 상품평 탭 클릭
         await self._click_review_tab(browser.page)
 
@@ -60,54 +168,211 @@ class ReviewScraper:
 
         # --- Phase 1: API로 전체 수집 시도 ---
         session = await browser.extract_cookies_session(product_info["full_url"])
-        api_success = False
-
-        for pg in range(1, MAX_REVIEW_PAGES + 1):
-            if progress_cb:
-                pct = min(pg / max((total_expected or 100) / REVIEWS_PER_PAGE, 1), 1.0)
-                progress_cb(f"리뷰 수집 중... (API 페이지 {pg})", pct)
-
-            reviews = self._fetch_and_parse_api(session, product_info, pg)
-            if not reviews:
-                if pg == 1:
-                    # API 첫 페이지부터 실패 → UI fallback
-                    break
-                # 더 이상 리뷰 없음
-                api_success = True
-                break
-
-            all_reviews.extend(reviews)
-            api_success = True
-
-            if total_expected and len(all_reviews) >= total_expected:
-                break
-            if len(all_reviews) >= MAX_REVIEWS:
-                break
-
-            await page_transition_delay()
+        all_reviews, api_success = await self.scrape_api(
+            session, product_info, total_expected, progress_cb, known
+        )
 
         # --- Phase 2: API 실패 시 UI로 fallback (최대 10페이지) ---
-        if not api_success:
+        if not api_success and not all_reviews:
             all_reviews = await self._scrape_ui(
                 browser.page, total_expected, progress_cb
             )
 
         return all_reviews
 
+    async def start_api(
+        self,
+        browser,
+        product_info: dict,
+        progress_cb: Callable[[str, float], None] | None = None,
+        known: set[str] | None = None,
+        on_done: Callable[[ReviewSet], None] | None = None,
+    ) -> asyncio.Future:
+        """리뷰 API 수집을 별도 스레드(자체 이벤트 루프)에서 시작하고 바로 반환.
+
+        API는 브라우저 쿠키를 복사한 세션만 쓰므로, 그동안 브라우저는 상품 정보·Q&A 수집을
+        이어갈 수 있다. 결과는 finish()로 받는다. on_done(reviews)은 리뷰가 확정되는 즉시
+        (API 성공 시 워커 스레드에서, UI fallback 시 finish()에서) 한 번 호출된다.
+        """
+        total_expected = await self._get_total_count(browser.page)
+        session = await browser.extract_cookies_session(product_info["full_url"])
+
+        def run() -> tuple[ReviewSet, bool]:
+            reviews, ok = asyncio.run(
+                self.scrape_api(session, product_info, total_expected, progress_cb, known)
+            )
+            if ok and on_done:
+                on_done(reviews)
+            return reviews, ok
+
+        self._ui_fallback = (total_expected, progress_cb, on_done)
+        job = asyncio.ensure_future(asyncio.to_thread(run))
+        await asyncio.sleep(0)  # 워커 스레드 시작
+        return job
+
+    async def finish(self, browser, job: asyncio.Future) -> ReviewSet:
+        """start_api() 결과 대기. API가 첫 페이지부터 실패했으면 UI로 수집 (브라우저 작업이 끝난 뒤 호출).
+
+        도중에 거부됐으면 받은 데까지 반환한다 (UI는 앞 10페이지뿐이라 더 받을 것이 없고,
+        나머지는 체크포인트로 다음 시도에서 이어받는다).
+        """
+        reviews, api_success = await job
+        if not api_success and reviews:
+            total_expected, progress_cb, on_done = self._ui_fallback
+            if on_done:
+                on_done(reviews)
+        elif not api_success:
+            total_expected, progress_cb, on_done = self._ui_fallback
+            await self._click_review_tab(browser.page)
+            reviews = await self._scrape_ui(browser.page, total_expected, progress_cb)
+            if on_done:
+                on_done(reviews)
+        return reviews
+
+    async def scrape_api(
+        self,
+        session,
+        product_info: dict,
+        total_expected: int | None = None,
+        progress_cb: Callable[[str, float], None] | None = None,
+        known: set[str] | None = None,
+    ) -> tuple[ReviewSet, bool]:
+        """리뷰 API만으로 수집. (리뷰, 완료 여부)
+
+        요청이 거부되면(429·파싱 실패 등) 그때까지 받은 리뷰와 False를 반환하고 체크포인트는 남긴다
+        — 첫 페이지부터 거부됐으면 빈 목록. 빈 페이지(목록 끝)나 수집 한도에 닿았을 때만 체크포인트를 지운다.
+
+        브라우저 없이 저장된 쿠키 세션으로도 호출할 수 있다 (crawler.fast_path).
+        첫 페이지로 허용되는 가장 큰 페이지 크기를 정하고, 리뷰가 MAX_REVIEWS보다 많으면
+        앞 페이지 대신 정렬·별점 층화 표본을 받는다 (crawler.sampling).
+        순차 수집은 받은 페이지를 체크포인트에 쌓고, 이전 시도가 중단됐으면 그 다음 페이지부터 이어서 받는다.
+        페이지 HTML 파싱은 프로세스 풀(crawler.parse_pool)에서 하고, 그동안 다음 페이지를 요청한다.
+        """
+        sort_by = "DATE_DESC" if known is not None else "ORDER_SCORE_ASC"
+        checkpoint = CrawlCheckpoint(f"coupang-reviews-{sort_by}", product_info["product_id"], Review)
+        all_reviews = ReviewSet(checkpoint.load())
+        seen = {review_key(r) for r in all_reviews}
+        resumed = checkpoint.last_page
+        size = checkpoint.meta.get("size", REVIEWS_PER_PAGE)
+        first = None
+
+        def fetch(params: dict, page: int, n: int) -> list[Review] | None:
+            return self._fetch_and_parse_api(session, product_info, page, params["sortBy"], n, params["ratings"])
+
+        if resumed:
+            if progress_cb:
+                progress_cb(f"이전 수집분 {len(all_reviews)}건에서 이어서 수집 (페이지 {resumed + 1}부터)", 0.0)
+        else:
+            base = {"sortBy": sort_by, "ratings": ""}
+            size, first = probe_page_size(lambda n: fetch(base, 1, n), COUPANG_REVIEW_PAGE_SIZES, REVIEWS_PER_PAGE)
+            if not first:
+                return all_reviews, False  # API 사용 불가
+            # 탭에서 총 리뷰 수를 못 얻었으면 (브라우저 없는 수집 등) API 요약 사용
+            total_expected = total_expected or self.total_count
+            if known is None and total_expected and total_expected > MAX_REVIEWS:
+                strata = [Stratum({"sortBy": sb, "ratings": rt}, share, filtered=bool(rt))
+                          for sb, rt, share in COUPANG_REVIEW_SAMPLE_STRATA]
+                sample, weights = await sample_strata(
+                    fetch, strata, size, MAX_REVIEWS, review_key, page_transition_delay,
+                    first=(base, first), progress_cb=progress_cb, group=lambda r: r.star,
+                )
+                return ReviewSet(sample, weights), True
+
+        # 받은 원문 페이지는 곧바로 파싱 풀에 넘기고 다음 페이지를 받는다 (파싱 결과는 큐 순서대로 소비).
+        # 큐 크기 1 — 중단 조건이 한 페이지 늦게 판정되므로 끝에서 최대 한두 페이지를 더 요청할 수 있다.
+        pages: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+        async def parse(html_text: str) -> list[Review] | None:
+            try:
+                return await asyncio.to_thread(self._parse_api_page, html_text)
+            except Exception:
+                return None
+
+        async def produce():
+            for pg in range(resumed + 1, MAX_REVIEW_PAGES + 1):
+                if pg == 1:
+                    parsed = asyncio.get_running_loop().create_future()
+                    parsed.set_result(first)
+                else:
+                    await page_transition_delay()
+                    html_text = await asyncio.to_thread(
+                        self._fetch_reviews_api, session, product_info, pg, sort_by, size,
+                    )
+                    if html_text is None:
+                        await pages.put((pg, None))
+                        return
+                    parsed = asyncio.ensure_future(parse(html_text))
+                await pages.put((pg, parsed))
+            await pages.put((None, None))
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                pg, parsed = await pages.get()
+                if pg is None:
+                    break
+                reviews = await parsed if parsed is not None else None
+                if progress_cb:
+                    pct = min(pg / max((total_expected or 100) / size, 1), 1.0)
+                    progress_cb(f"리뷰 수집 중... (API 페이지 {pg})", pct)
+
+                if reviews is None:
+                    # 거부 (429·오래된 세션 등) — 체크포인트는 남겨 두고 미완료로 반환해
+                    # 호출 측이 쿠키를 버리고 브라우저로 전환하거나, 다음 시도에서 이어받게 한다
+                    if progress_cb:
+                        progress_cb(
+                            f"리뷰 API가 페이지 {pg}에서 거부됨 — {len(all_reviews)}건까지 저장, "
+                            "다시 실행하면 이어서 수집합니다", pct,
+                        )
+                    return all_reviews, False
+                if not reviews:
+                    break  # 더 이상 리뷰 없음
+
+                fresh = [r for r in reviews if review_key(r) not in seen]
+                seen.update(review_key(r) for r in fresh)
+                all_reviews.extend(fresh)
+                checkpoint.add_page(pg, fresh, size=size)
+
+                if known is not None and all(review_key(r) in known for r in reviews):
+                    break
+                if total_expected and len(all_reviews) >= total_expected:
+                    break
+                if len(all_reviews) >= MAX_REVIEWS:
+                    break
+        finally:
+            producer.cancel()
+
+        checkpoint.clear()
+        return all_reviews, True
+
     # --- API 기반 수집 (기존 coupang_reviews.py 로직 재활용) ---
 
     def _fetch_and_parse_api(
-        self, session, product_info: dict, page: int
-    ) -> list[dict]:
-        """Review API 호출 후 파싱"""
+        self, session, product_info: dict, page: int, sort_by: str = "ORDER_SCORE_ASC",
+        size: int = REVIEWS_PER_PAGE, ratings: str = "",
+    ) -> list[Review] | None:
+        """Review API 호출 후 파싱. 요청이 거부되면 None."""
+        html_text = self._fetch_reviews_api(session, product_info, page, sort_by, size, ratings)
+        if html_text is None:
+            return None
+        try:
+            return self._parse_api_page(html_text)
+        except Exception:
+            return None
+
+    def _fetch_reviews_api(
+        self, session, product_info: dict, page: int, sort_by: str = "ORDER_SCORE_ASC",
+        size: int = REVIEWS_PER_PAGE, ratings: str = "",
+    ) -> str | None:
+        """Review API 원문 HTML. 요청이 거부되면 None."""
         params = {
             "productId": product_info["product_id"],
             "itemId": product_info.get("item_id", ""),
             "vendorItemId": product_info.get("vendor_item_id", ""),
             "page": page,
-            "size": REVIEWS_PER_PAGE,
-            "sortBy": "ORDER_SCORE_ASC",
-            "ratings": "",
+            "size": size,
+            "sortBy": sort_by,
+            "ratings": ratings,
             "q": "",
             "viRoleCode": "3",
             "ratingSummary": "true",
@@ -115,80 +380,26 @@ class ReviewScraper:
         try:
             resp = session.get(COUPANG_REVIEW_API, params=params, timeout=10)
             if resp.status_code != 200:
-                return []
-            return self._parse_reviews_api(resp.text)
+                return None
+            return resp.text
         except Exception:
-            return []
-
-    def _parse_reviews_api(self, html_text: str) -> list[dict]:
-        """API 응답 HTML 파싱 (sdp-review 전통 구조)"""
-        soup = BeautifulSoup(html_text, "html.parser")
-        reviews = []
-
-        articles = soup.select(REVIEW_ARTICLE_API)
-        if not articles:
-            articles = soup.select(REVIEW_ARTICLE_API_ALT)
+            return None
 
-        for art in articles:
-            r = {}
-
-            # 별점 (width 퍼센트 → 5점 만점)
-            try:
-                star = art.select_one(STAR_API)
-                if star:
-                    style = star.get("style", "")
-                    if "width:" in style:
-                        w = style.split("width:")[1].split("%")[0].strip()
-                        r["rating"] = round(float(w) / 20, 1)
-            except Exception:
-                r["rating"] = None
-
-            # 작성자
-            try:
-                r["author"] = art.select_one(AUTHOR_API).get_text(strip=True)
-            except Exception:
-                r["author"] = ""
-
-            # 날짜
-            try:
-                r["date"] = art.select_one(DATE_API).get_text(strip=True)
-            except Exception:
-                r["date"] = ""
-
-            # 헤드라인
-            try:
-                r["headline"] = art.select_one(HEADLINE_API).get_text(strip=True)
-            except Exception:
-                r["headline"] = ""
-
-            # 본문
-            try:
-                r["content"] = art.select_one(CONTENT_API).get_text(strip=True)
-            except Exception:
-                r["content"] = ""
-
-            # 도움이 돼요
-            r["helpful"] = 0
-            try:
-                help_text = art.select_one(HELPFUL_API).get_text(strip=True)
-                m = re.search(r"(\d+)", help_text)
-                if m:
-                    r["helpful"] = int(m.group(1))
-            except Exception:
-                pass
-
-            if r.get("author") or r.get("content"):
-                reviews.append(r)
-
-        return reviews
+    def _parse_api_page(self, html_text: str) -> list[Review]:
+        """API 응답 HTML → Review 목록 (파싱은 프로세스 풀에서, 평점 요약은 응답에 있을 때만 갱신)"""
+        rows, total_count, average_rating = parse_pool().run(parse_reviews_html, html_text)
+        self.total_count = total_count or self.total_count
+        if average_rating is not None:
+            self.average_rating = average_rating
+        return [Review(*row) for row in rows]
 
     # --- UI 기반 수집 (Playwright, 최대 10페이지) ---
 
     async def _scrape_ui(
         self, page, total_expected, progress_cb
-    ) -> list[dict]:
+    ) -> ReviewSet:
         """Playwright UI 파싱으로 리뷰 수집 (fallback)"""
-        all_reviews = []
+        all_reviews = ReviewSet()
 
         for pg in range(1, UI_PAGE_LIMIT + 1):
             if progress_cb:
@@ -220,9 +431,9 @@ class ReviewScraper:
 
         return all_reviews
 
-    async def _parse_page_ui(self, page) -> list[dict]:
+    async def _parse_page_ui(self, page) -> list[Review]:
         """현재 페이지의 리뷰를 Playwright로 파싱"""
-        reviews = []
+        raw = []
         articles = await page.query_selector_all(REVIEW_ARTICLE_TW)
 
         for art in articles:
@@ -268,16 +479,14 @@ class ReviewScraper:
             try:
                 help_el = await art.query_selector(HELPFUL_TW)
                 if help_el:
-                    m = re.search(r"(\d+)", (await help_el.inner_text()).strip())
-                    if m:
-                        r["helpful"] = int(m.group(1))
+                    r["helpful"] = parse_int(await help_el.inner_text())
             except Exception:
                 pass
 
             if r.get("author") or r.get("content"):
-                reviews.append(r)
+                raw.append(r)
 
-        return reviews
+        return Review.from_dicts(raw)
 
     async def _go_next_page_ui(self, page, current_page: int) -> bool:
         """UI에서 다음 페이지로 이동"""
@@ -314,15 +523,8 @@ class ReviewScraper:
             pass
 
     async def _get_total_count(self, page) -> int | None:
-        """총 리뷰 수 추출"""
+        """총 리뷰 수 추출 (상품평 탭 문구, 스크립트 1회)"""
         try:
-            tabs = await page.query_selector_all("a")
-            for tab in tabs:
-                text = (await tab.inner_text()).strip()
-                if "상품평" in text:
-                    m = re.search(r"\((\d[\d,]*)\)", text)
-                    if m:
-                        return int(m.group(1).replace(",", ""))
+            return parse_paren_count(await page.evaluate(REVIEW_TAB_TEXT_JS))
         except Exception:
-            pass
-        return None
+            return None
@@ -0,0 +1,119 @@
+"""리뷰 API 수집 계획 (페이지 크기 탐색 + 층화 표본)
+
+- 첫 페이지를 허용될 만한 가장 큰 크기부터 요청해, 응답 건수로 엔드포인트가 실제로 받아들인
+  페이지 크기를 정한다 (첫 페이지 결과는 그대로 수집분으로 사용).
+- 리뷰가 수집 예산보다 많으면 앞쪽 페이지만 받는 대신 정렬·별점 필터 조합(층)별 비중만큼
+  나눠 받는다. 한 층이 모자라면 남은 몫은 다음 층으로, 끝까지 남으면 첫 층에서 더 받는다.
+- 별점 필터·평점순 층은 낮은 별점을 일부러 많이 받으므로, 표본 항목마다 가중치를 붙여
+  돌려준다 (사후 층화: 필터 없는 층의 별점 분포를 전체 분포로 보고 별점별 비중을 맞춤).
+
+fetch(params, page, size)는 리뷰 목록을 반환하고, 요청이 거부되면 None을 반환한다.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+
+@dataclass(slots=True)
+class Stratum:
+    params: dict     # 엔드포인트별 정렬·필터 파라미터
+    share: float     # 예산 중 비중
+    filtered: bool = False  # 별점 필터·평점순처럼 별점이 치우친 층 (전체 분포 추정에서 제외)
+
+
+def probe_page_size(
+    fetch_first: Callable[[int], list | None],
+    candidates: tuple[int, ...],
+    default: int,
+) -> tuple[int, list | None]:
+    """(이후 페이지에 쓸 크기, 첫 페이지 결과). 모든 크기가 거부되면 (default, None)."""
+    for size in sorted(set(candidates) | {default}, reverse=True):
+        items = fetch_first(size)
+        if items is None:
+            continue  # 이 크기는 거부 — 더 작게
+        if len(items) >= size:
+            return size, items
+        # 상한에 걸렸거나 리뷰가 이만큼뿐 — 어느 쪽이든 받은 건수가 실제 크기
+        return max(len(items), default), items
+    return default, None
+
+
+async def sample_strata(
+    fetch: Callable[[dict, int, int], list | None],
+    strata: list[Stratum],
+    size: int,
+    budget: int,
+    key: Callable,
+    delay: Callable[[], Awaitable],
+    first: tuple[dict, list] | None = None,
+    progress_cb: Callable[[str, float], None] | None = None,
+    max_pages: int = 50,
+    group: Callable | None = None,
+) -> tuple[list, list[float] | None]:
+    """층별 비중만큼 페이지를 받아 중복 없이 합친 최대 budget건과 항목별 가중치.
+
+    first: 이미 받은 (params, 1페이지 결과) — 같은 params의 층은 1페이지를 다시 요청하지 않음.
+    group: 항목 → 사후 층화 기준값 (별점). 가중치는 치우친 층에서 받은 항목이 없거나
+    group이 없으면 None (표본 그대로 집계).
+    """
+    quotas = [int(budget * s.share) for s in strata]
+    quotas[0] += budget - sum(quotas)
+    next_page = [1] * len(strata)
+    exhausted = [False] * len(strata)
+    seen, out, biased = set(), [], []
+
+    async def take(i: int, want: int) -> int:
+        got = 0
+        while got < want and not exhausted[i] and next_page[i] <= max_pages:
+            page = next_page[i]
+            if first is not None and page == 1 and strata[i].params == first[0]:
+                items = first[1]
+            else:
+                await delay()
+                items = fetch(strata[i].params, page, size)
+            next_page[i] += 1
+            if not items:
+                exhausted[i] = True
+                break
+            for item in items:
+                k = key(item)
+                if k not in seen and got < want:
+                    seen.add(k)
+                    out.append(item)
+                    biased.append(strata[i].filtered)
+                    got += 1
+            if progress_cb:
+                progress_cb(f"리뷰 표본 수집 중... ({len(out)}/{budget})", min(len(out) / budget, 1.0))
+        return got
+
+    carry = 0
+    for i, quota in enumerate(quotas):
+        want = quota + carry
+        carry = want - await take(i, want)
+    if carry > 0:
+        await take(0, carry)
+    if group is None or not any(biased):
+        return out, None
+    return out, post_stratify([group(item) for item in out], biased)
+
+
+def post_stratify(groups: list, biased: list[bool], smoothing: float = 0.5) -> list[float] | None:
+    """항목별 가중치 = (그룹의 추정 전체 비중) / (표본 내 비중). 합계는 항목 수와 같다.
+
+    전체 비중은 치우치지 않은 층에서 받은 항목의 그룹 분포로 추정하고, 표본에 나온 그룹마다
+    smoothing을 더해 비필터 층에 없던 그룹(예: 1점)도 0이 되지 않게 한다.
+    치우치지 않은 항목이 하나도 없으면 추정할 수 없으므로 None.
+    """
+    base = [g for g, b in zip(groups, biased) if not b]
+    if not base:
+        return None
+    sampled = Counter(groups)
+    counts = Counter(base)
+    denom = len(base) + smoothing * len(sampled)
+    n = len(groups)
+    factor = {
+        g: (counts[g] + smoothing) / denom * n / s
+        for g, s in sampled.items()
+    }
+    return [factor[g] for g in groups]
@@ -0,0 +1,142 @@
+"""준비 상태 기반 대기 (고정 sleep 대체)
+
+정해진 시간만큼 자는 대신 DOM 조건을 짧은 간격으로 확인하다가 만족하는 즉시 진행한다.
+조건이 끝내 만족되지 않으면 timeout 후 None을 반환하고, 호출 측은 기존과 같이 페이지 상태를 판정한다.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Callable
+
+from config.selectors import NAVER_CAPTCHA_SELECTOR
+from config.settings import WAIT_POLL_INTERVAL, DOM_SETTLE_TIME, CAPTCHA_SCAN_MAX_ELEMENTS
+
+# 쿠팡 상품 페이지: 차단 페이지 또는 상품명/본문 렌더링 완료
+COUPANG_READY_JS = """
+    if (document.title.indexOf('Access Denied') >= 0) return 'denied';
+    if (document.readyState === 'loading') return null;
+    if (document.querySelector(arguments[0])) return 'ready';
+    if (document.readyState === 'complete' && document.body
+        && document.body.innerText.length > 2000) return 'ready';
+    return null;
+"""
+
+CAPTCHA_MARKERS = ["보안 확인", "captcha", "보안확인", "정답을 입력"]
+ERROR_MARKERS = ["429", "시스템 에러", "Error", "에러가 발생", "찾을 수 없", "존재하지 않"]
+
+# CAPTCHA·에러 판별 공통 함수. 로딩 중에도 짧은 간격으로 불리므로 문서 전체(outerHTML)를
+# 직렬화하지 않는다 — 제목과 CAPTCHA 요소를 보고, 본문 텍스트는 요소 수가 적은
+# (CAPTCHA·에러 화면 크기의) 페이지에서만 앞부분을 확인한다.
+_PAGE_CHECK_JS = (
+    "var CAPTCHA_MARKERS = " + json.dumps(CAPTCHA_MARKERS, ensure_ascii=False) + ";\n"
+    "var ERROR_MARKERS = " + json.dumps(ERROR_MARKERS, ensure_ascii=False) + ";\n"
+    "var CAPTCHA_SELECTOR = " + json.dumps(NAVER_CAPTCHA_SELECTOR) + ";\n"
+    "var SMALL_PAGE_ELEMENTS = " + str(CAPTCHA_SCAN_MAX_ELEMENTS) + ";\n"
+    """
+    function has(text, markers) {
+        for (var i = 0; i < markers.length; i++) if (text.indexOf(markers[i]) >= 0) return true;
+        return false;
+    }
+    function smallPageText() {
+        if (!document.body || document.getElementsByTagName('*').length > SMALL_PAGE_ELEMENTS) return '';
+        return (document.body.innerText || '').slice(0, 2000);
+    }
+    function isCaptcha(text) {
+        return has(document.title, CAPTCHA_MARKERS)
+            || !!document.querySelector(CAPTCHA_SELECTOR)
+            || has(text, CAPTCHA_MARKERS);
+    }
+"""
+)
+
+# 네이버 상품 페이지: CAPTCHA / 페이지 데이터(__PRELOADED_STATE__, __NEXT_DATA__) / 본문 렌더링
+NAVER_READY_JS = _PAGE_CHECK_JS + """
+    if (isCaptcha(smallPageText())) return 'captcha';
+    if (document.readyState === 'loading') return null;
+    if (typeof window.__PRELOADED_STATE__ !== 'undefined'
+        || document.querySelector('script#__NEXT_DATA__')) return 'data';
+    if (document.readyState === 'complete' && document.body
+        && document.body.innerText.length > 2000) return 'content';
+    return null;
+"""
+
+DOCUMENT_COMPLETE_JS = "return document.readyState === 'complete';"
+
+# 페이지 상태 요약 — page_source(수 MB) 대신 브라우저 안에서 검사하고 작은 객체만 반환
+# (arguments[0]: 문서 길이까지 잴지 — 길이가 필요한 판정에서만 innerHTML을 직렬화)
+PAGE_STATE_JS = _PAGE_CHECK_JS + """
+    var text = smallPageText();
+    var root = document.documentElement;
+    return {
+        captcha: isCaptcha(text),
+        error: has(document.title + ' ' + text, ERROR_MARKERS),
+        product_page: location.href.indexOf('/products/') >= 0,
+        next_data: !!document.querySelector('script#__NEXT_DATA__'),
+        preloaded: typeof window.__PRELOADED_STATE__ !== 'undefined',
+        length: arguments[0] && root ? root.innerHTML.length : null
+    };
+"""
+
+# 탭 클릭 후 내용 변화 감지용 (URL + 목록 항목 수)
+DOM_SIGNATURE_JS = "return location.href + '|' + document.querySelectorAll('li').length;"
+
+
+async def wait_until(
+    condition: Callable[[], Any], timeout: float, poll: float = WAIT_POLL_INTERVAL
+) -> Any:
+    """condition()이 참 값을 반환하면 그 값을, timeout까지 만족하지 않으면 None"""
+    end = time.monotonic() + timeout
+    while True:
+        try:
+            value = condition()
+            if value:
+                return value
+        except Exception:
+            pass
+        if time.monotonic() >= end:
+            return None
+        await asyncio.sleep(poll)
+
+
+async def wait_for_script(driver, script: str, timeout: float, *args) -> Any:
+    """JS 조건식(return 값)이 참이 될 때까지 대기"""
+    return await wait_until(lambda: driver.execute_script(script, *args), timeout)
+
+
+def page_state(driver, with_length: bool = True) -> dict | None:
+    """{"captcha", "error", "product_page", "next_data", "preloaded", "length"}. 실패 시 None.
+
+    with_length=False면 length는 None (문서 직렬화 생략).
+    """
+    try:
+        return driver.execute_script(PAGE_STATE_JS, with_length)
+    except Exception:
+        return None
+
+
+def page_blocked(driver) -> bool:
+    """CAPTCHA·에러 화면이거나 브라우저가 응답하지 않으면 True (빈 목록이 목록 끝인지 차단인지 구분용)"""
+    state = page_state(driver, with_length=False)
+    return not state or bool(state["captcha"] or state["error"])
+
+
+def dom_signature(driver) -> str:
+    try:
+        return driver.execute_script(DOM_SIGNATURE_JS) or ""
+    except Exception:
+        return ""
+
+
+async def wait_for_dom_change(driver, before: str, timeout: float, settle: float = DOM_SETTLE_TIME) -> bool:
+    """DOM 서명이 before와 달라진 뒤 settle 동안 더 바뀌지 않으면 True (timeout 시 False)"""
+    end = time.monotonic() + timeout
+    last, stable_since = before, None
+    while time.monotonic() < end:
+        current = dom_signature(driver)
+        if current != last:
+            last, stable_since = current, time.monotonic()
+        elif stable_since is not None and time.monotonic() - stable_since >= settle:
+            return True
+        await asyncio.sleep(WAIT_POLL_INTERVAL)
+    return last != before
@@ -0,0 +1,155 @@
+"""원본 수집 데이터 열 기반 내보내기 (Parquet / Arrow IPC)
+
+리뷰·Q&A·상품 정보를 타입이 지정된 테이블로 저장하여 pandas/DuckDB에서 바로 읽을 수 있게 한다.
+- 별점: float64, 날짜: date32, 도움수·가격: int64 (가격 표시 문자열은 price_text)
+- 작성자·옵션·판매자 등 반복 문자열: dictionary 인코딩
+- 여러 상품을 합쳐 분석할 수 있도록 모든 행에 platform / product_id 포함
+
+테이블 3개(reviews / qna / product)를 zip 하나로 묶어 반환한다.
+"""
+
+import io
+import zipfile
+from datetime import date
+
+from models.records import ReviewSet, QnASet
+from utils.text_cleaner import parse_int
+
+FORMATS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+
+
+def _to_date(value: str):
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _to_float(value):
+    try:
+        return float(value) if value not in (None, "") else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_price(value) -> int | None:
+    """'12,900원' 같은 표시 문자열에서 원 단위 정수 추출. 숫자가 없으면 None."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)
+    return parse_int(str(value or ""), default=None)
+
+
+def _to_int(value):
+    try:
+        return int(value) if value not in (None, "") else None
+    except (ValueError, TypeError):
+        return None
+
+
+class ArrowExporter:
+    def __init__(self):
+        # pyarrow는 이 내보내기에서만 사용하므로 필요할 때 import
+        import pyarrow
+
+        self.pa = pyarrow
+
+    def generate(
+        self,
+        platform: str,
+        product_data: dict | None,
+        reviews: ReviewSet,
+        qna_pairs: QnASet,
+        fmt: str = "parquet",
+    ) -> bytes:
+        """reviews / qna / product 테이블을 fmt 형식으로 저장한 zip 바이트 반환"""
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+        product_data = product_data or {}
+        product_id = str(product_data.get("product_id") or "")
+        tables = {
+            "reviews": self._review_table(platform, product_id, reviews),
+            "qna": self._qna_table(platform, product_id, qna_pairs),
+            "product": self._product_table(platform, product_data),
+        }
+
+        output = io.BytesIO()
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as zf:
+            for name, table in tables.items():
+                zf.writestr(f"{name}{FORMATS[fmt]}", self._serialize(table, fmt))
+        return output.getvalue()
+
+    def _serialize(self, table, fmt: str) -> bytes:
+        sink = io.BytesIO()
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, sink, compression="zstd")
+        else:
+            import pyarrow.ipc as ipc
+
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return sink.getvalue()
+
+    def _dict_column(self, values: list[str]):
+        return self.pa.array(values, type=self.pa.string()).dictionary_encode()
+
+    def _key_columns(self, platform: str, product_id: str, n: int) -> dict:
+        return {
+            "platform": self._dict_column([platform] * n),
+            "product_id": self._dict_column([product_id] * n),
+        }
+
+    def _review_table(self, platform: str, product_id: str, reviews: ReviewSet):
+        pa = self.pa
+        ratings = reviews.column("rating")
+        columns = self._key_columns(platform, product_id, len(reviews))
+        columns.update({
+            # NaN(별점 없음)은 null로 저장
+            "rating": pa.array(ratings, type=pa.float64(), from_pandas=True),
+            "author": self._dict_column(reviews.column("author")),
+            "date": pa.array([_to_date(d) for d in reviews.column("date")], type=pa.date32()),
+            "headline": pa.array(reviews.column("headline"), type=pa.string()),
+            "content": pa.array(reviews.column("content"), type=pa.string()),
+            "helpful": pa.array(reviews.column("helpful"), type=pa.int64()),
+            "option": self._dict_column(reviews.column("option")),
+        })
+        return pa.table(columns)
+
+    def _qna_table(self, platform: str, product_id: str, qna_pairs: QnASet):
+        pa = self.pa
+        columns = self._key_columns(platform, product_id, len(qna_pairs))
+        columns.update({
+            "question": pa.array(qna_pairs.column("question"), type=pa.string()),
+            "answer": pa.array(qna_pairs.column("answer"), type=pa.string()),
+            "q_date": pa.array([_to_date(d) for d in qna_pairs.column("q_date")], type=pa.date32()),
+            "a_date": pa.array([_to_date(d) for d in qna_pairs.column("a_date")], type=pa.date32()),
+            "seller": self._dict_column(qna_pairs.column("seller")),
+            "author": self._dict_column(qna_pairs.column("author")),
+        })
+        return pa.table(columns)
+
+    def _product_table(self, platform: str, product_data: dict):
+        pa = self.pa
+        str_list = pa.list_(pa.string())
+        return pa.table({
+            "platform": pa.array([platform], type=pa.string()),
+            "product_id": pa.array([str(product_data.get("product_id") or "")], type=pa.string()),
+            "url": pa.array([product_data.get("url") or ""], type=pa.string()),
+            "title": pa.array([product_data.get("title") or ""], type=pa.string()),
+            # 분석용 정수 가격(원)과 화면 표시 문자열을 따로 저장
+            "price": pa.array([_to_price(product_data.get("price"))], type=pa.int64()),
+            "price_text": pa.array([str(product_data.get("price") or "")], type=pa.string()),
+            "rating": pa.array([_to_float(product_data.get("rating"))], type=pa.float64()),
+            "review_count": pa.array([_to_int(product_data.get("review_count"))], type=pa.int64()),
+            "detail_image_urls": pa.array(
+                [[str(u) for u in product_data.get("detail_image_urls") or []]], type=str_list
+            ),
+            "specifications": pa.array(
+                [[str(s) for s in product_data.get("specifications") or []]], type=str_list
+            ),
+        })
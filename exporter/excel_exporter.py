@@ -1,9 +1,13 @@
-"""Excel 내보내기 (3시트: 스토리/리뷰/문의)"""
+"""Excel 내보내기 (4시트: 스토리/리뷰/리뷰 통계/문의, 비교 모드: 비교 + 상품별 시트)"""
 
 import io
+import re
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 
+from analyzer.comparison import ComparedProduct, comparison_rows
+from analyzer.review_stats import compute_review_stats
+
 
 HEADER_FONT = Font(bold=True, size=11, color="FFFFFF")
 HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
@@ -15,6 +19,9 @@ THIN_BORDER = Border(
     top=Side(style="thin"),
     bottom=Side(style="thin"),
 )
+# 시트 이름에 쓸 수 없는 문자
+_SHEET_NAME_INVALID = re.compile(r"[\\/*?:\[\]]")
+COMPARE_SECTIONS = (("full", "종합 리포트"), ("story", "스토리 분석"), ("review", "리뷰 분석"), ("qna", "Q&A 분석"))
 
 
 class ExcelExporter:
@@ -39,14 +46,88 @@ class ExcelExporter:
         ws2 = wb.create_sheet("리뷰 분석")
         self._write_review_sheet(ws2, reviews, review_result)
 
-        # Sheet 3: Q&A 분석
-        ws3 = wb.create_sheet("문의 분석")
-        self._write_qna_sheet(ws3, qna_pairs, qna_result)
+        # Sheet 3: 리뷰 통계
+        ws3 = wb.create_sheet("리뷰 통계")
+        self._write_review_stats_sheet(ws3, reviews)
+
+        # Sheet 4: Q&A 분석
+        ws4 = wb.create_sheet("문의 분석")
+        self._write_qna_sheet(ws4, qna_pairs, qna_result)
+
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        return buffer.getvalue()
+
+    def generate_comparison(self, products: list[ComparedProduct], comparison_result: str) -> bytes:
+        """비교 시트 + 상품별 요약 시트"""
+        wb = Workbook()
+
+        ws = wb.active
+        ws.title = "상품 비교"
+        self._write_comparison_sheet(ws, products, comparison_result)
+
+        used = {ws.title}
+        for i, product in enumerate(products, 1):
+            name = _SHEET_NAME_INVALID.sub("", f"{i}. {product.name}")[:31]
+            while name in used:
+                name = name[:29] + f"_{i}"
+            used.add(name)
+            self._write_product_summary_sheet(wb.create_sheet(name), product)
 
         buffer = io.BytesIO()
         wb.save(buffer)
         return buffer.getvalue()
 
+    def _write_comparison_sheet(self, ws, products, comparison_result):
+        headers = ["지표"] + [p.name for p in products]
+        row = self._write_table(ws, 1, "비교 지표", headers, [
+            [metric] + values for metric, values in comparison_rows(products)
+        ])
+
+        if comparison_result:
+            ws.cell(row=row, column=1, value="AI 비교 리포트").font = Font(bold=True, size=12)
+            row += 1
+            for line in comparison_result.split("\n"):
+                ws.cell(row=row, column=1, value=line)
+                row += 1
+
+        ws.column_dimensions["A"].width = 20
+        for col in range(2, len(products) + 2):
+            ws.column_dimensions[ws.cell(row=1, column=col).column_letter].width = 24
+
+    def _write_product_summary_sheet(self, ws, product: ComparedProduct):
+        data = product.product_data or {}
+        stats = compute_review_stats(product.reviews)
+        row = self._write_table(ws, 1, product.name, ["항목", "값"], [
+            ("플랫폼", product.platform),
+            ("상품명", data.get("title", "")),
+            ("가격", data.get("price", "")),
+            ("URL", data.get("url", "")),
+            ("수집 리뷰", stats.total),
+            ("표본 여부", "층화 표본 (별점 가중 추정)" if stats.weighted else "전체"),
+            ("평균 별점", stats.mean),
+            ("도움수 가중 평균", stats.helpful_weighted_mean),
+            ("수집 문의", len(product.qna_pairs)),
+        ])
+        row = self._write_table(ws, row, "별점 분포", ["별점", "건수", "비율(%)"], [
+            (f"{star}점", cnt, round(stats.pct(star), 1))
+            for star, cnt in stats.histogram.items()
+        ])
+
+        for section, title in COMPARE_SECTIONS:
+            text = product.results.get(section)
+            if not text:
+                continue
+            ws.cell(row=row, column=1, value=title).font = Font(bold=True, size=12)
+            row += 1
+            for line in text.split("\n"):
+                ws.cell(row=row, column=1, value=line)
+                row += 1
+            row += 1
+
+        ws.column_dimensions["A"].width = 20
+        ws.column_dimensions["B"].width = 60
+
     def _write_story_sheet(self, ws, product_data, story_result, full_result):
         # 상품 정보
         ws.append(["상품 분석 리포트"])
@@ -97,15 +178,13 @@ class ExcelExporter:
 
         for i, r in enumerate(reviews, 1):
             ws.cell(row=i + 1, column=1, value=i).border = THIN_BORDER
-            ws.cell(row=i + 1, column=2, value=r.get("rating")).border = THIN_BORDER
-            ws.cell(row=i + 1, column=3, value=r.get("author", "")).border = THIN_BORDER
-            ws.cell(row=i + 1, column=4, value=r.get("date", "")).border = THIN_BORDER
-            content = r.get("content", "")
-            if r.get("headline"):
-                content = f"[{r['headline']}] {content}"
+            ws.cell(row=i + 1, column=2, value=r.rating).border = THIN_BORDER
+            ws.cell(row=i + 1, column=3, value=r.author).border = THIN_BORDER
+            ws.cell(row=i + 1, column=4, value=r.date).border = THIN_BORDER
+            content = f"[{r.headline}] {r.content}" if r.headline else r.content
             ws.cell(row=i + 1, column=5, value=content).border = THIN_BORDER
             ws.cell(row=i + 1, column=5).alignment = CELL_ALIGNMENT
-            ws.cell(row=i + 1, column=6, value=r.get("helpful", 0)).border = THIN_BORDER
+            ws.cell(row=i + 1, column=6, value=r.helpful).border = THIN_BORDER
 
         # AI 분석 결과
         result_row = len(reviews) + 4
@@ -123,6 +202,54 @@ class ExcelExporter:
         ws.column_dimensions["E"].width = 60
         ws.column_dimensions["F"].width = 8
 
+    def _write_table(self, ws, row, title, headers, rows) -> int:
+        """제목 + 헤더 + 데이터 행을 쓰고 다음 빈 행 번호 반환"""
+        ws.cell(row=row, column=1, value=title).font = Font(bold=True, size=12)
+        row += 1
+        for col, h in enumerate(headers, 1):
+            cell = ws.cell(row=row, column=col, value=h)
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = HEADER_ALIGNMENT
+            cell.border = THIN_BORDER
+        for values in rows:
+            row += 1
+            for col, v in enumerate(values, 1):
+                ws.cell(row=row, column=col, value=v).border = THIN_BORDER
+        return row + 2
+
+    def _write_review_stats_sheet(self, ws, reviews):
+        stats = compute_review_stats(reviews)
+
+        row = self._write_table(ws, 1, "요약", ["항목", "값"], [
+            ("리뷰 수", stats.total),
+            ("표본 여부", "층화 표본 (별점 가중 추정)" if stats.weighted else "전체"),
+            ("별점 있는 리뷰", stats.rated),
+            ("평균 별점", stats.mean),
+            ("중앙값", stats.median),
+            ("도움수 가중 평균", stats.helpful_weighted_mean),
+            ("본문 길이 중앙값", stats.length.get("median")),
+            ("본문 길이 평균", stats.length.get("mean")),
+            ("본문 길이 최대", stats.length.get("max")),
+        ])
+        row = self._write_table(ws, row, "별점 분포", ["별점", "건수", "비율(%)"], [
+            (f"{star}점", cnt, round(stats.pct(star), 1))
+            for star, cnt in stats.histogram.items()
+        ])
+        row = self._write_table(ws, row, "월별 추이", ["월", "건수", "평균 별점"], [
+            (p.period, p.count, p.mean) for p in stats.monthly
+        ])
+        row = self._write_table(ws, row, "주별 추이 (주 시작일)", ["주", "건수", "평균 별점"], [
+            (p.period, p.count, p.mean) for p in stats.weekly
+        ])
+        self._write_table(ws, row, "옵션별", ["옵션", "건수", "평균 별점"], [
+            (o.option, o.count, o.mean) for o in stats.options
+        ])
+
+        ws.column_dimensions["A"].width = 30
+        ws.column_dimensions["B"].width = 12
+        ws.column_dimensions["C"].width = 12
+
     def _write_qna_sheet(self, ws, qna_pairs, qna_result):
         headers = ["번호", "질문", "답변", "질문일", "판매자"]
         for col, h in enumerate(headers, 1):
@@ -134,12 +261,12 @@ class ExcelExporter:
 
         for i, q in enumerate(qna_pairs, 1):
             ws.cell(row=i + 1, column=1, value=i).border = THIN_BORDER
-            ws.cell(row=i + 1, column=2, value=q.get("question", "")).border = THIN_BORDER
+            ws.cell(row=i + 1, column=2, value=q.question).border = THIN_BORDER
             ws.cell(row=i + 1, column=2).alignment = CELL_ALIGNMENT
-            ws.cell(row=i + 1, column=3, value=q.get("answer", "")).border = THIN_BORDER
+            ws.cell(row=i + 1, column=3, value=q.answer).border = THIN_BORDER
             ws.cell(row=i + 1, column=3).alignment = CELL_ALIGNMENT
-            ws.cell(row=i + 1, column=4, value=q.get("q_date", "")).border = THIN_BORDER
-            ws.cell(row=i + 1, column=5, value=q.get("seller", "")).border = THIN_BORDER
+            ws.cell(row=i + 1, column=4, value=q.q_date).border = THIN_BORDER
+            ws.cell(row=i + 1, column=5, value=q.seller).border = THIN_BORDER
 
         result_row = len(qna_pairs) + 4
         ws.cell(row=result_row, column=1, value="AI Q&A 분석 결과").font = Font(bold=True, size=12)
@@ -0,0 +1,276 @@
+"""리뷰 / Q&A 공통 레코드 타입
+
+모든 수집기(쿠팡 API·UI, 네이버 DOM·API)는 여기 정의된 레코드로 결과를 반환한다.
+필드 정규화(별점 float, 날짜 ISO, 도움수 int)는 from_dict()에서 한 번만 수행하므로
+분석기·내보내기에서는 .get()으로 다시 확인할 필요가 없다.
+수집기는 페이지 단위로 모은 원시 dict를 from_dicts()로 넘겨 텍스트 정규화를 일괄 처리한다.
+
+대량 수집분은 ReviewSet / QnASet에 열(column) 단위로 보관한다.
+수치 열은 array로, 반복이 많은 문자열(작성자, 옵션, 날짜)은 intern하여 메모리를 줄인다.
+"""
+
+import math
+import sys
+from array import array
+from dataclasses import dataclass, fields, asdict
+from typing import Iterable, Iterator
+
+from utils.text_cleaner import normalize_date, normalize_text, normalize_records
+
+
+def _to_float(value) -> float | None:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value or 0)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _to_str(value) -> str:
+    return str(value).strip() if value is not None else ""
+
+
+def _same(value: str) -> str:
+    return value
+
+
+def _from_dicts(cls, items: Iterable[dict]) -> list:
+    """원시 dict 목록을 일괄 정규화(normalize_records) 후 레코드 목록으로"""
+    return [cls.from_dict(d, clean=False) for d in normalize_records(list(items))]
+
+
+@dataclass(slots=True)
+class Review:
+    rating: float | None = None
+    author: str = ""
+    date: str = ""          # YYYY-MM-DD, 알 수 없으면 ""
+    headline: str = ""
+    content: str = ""
+    helpful: int = 0
+    option: str = ""
+
+    @classmethod
+    def from_dict(cls, d: dict, clean: bool = True) -> "Review":
+        """수집기 원시 dict → 정규화된 Review (clean=False: 텍스트·날짜 정규화 완료된 dict)"""
+        text, date = (normalize_text, normalize_date) if clean else (_same, _same)
+        return cls(
+            rating=_to_float(d.get("rating")),
+            author=_to_str(d.get("author")),
+            date=date(_to_str(d.get("date"))),
+            headline=text(_to_str(d.get("headline"))),
+            content=text(_to_str(d.get("content"))),
+            helpful=_to_int(d.get("helpful")),
+            option=_to_str(d.get("option")),
+        )
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> list["Review"]:
+        """from_dict()의 배치 버전 (페이지 하나 분량을 한 번에 정규화)"""
+        return _from_dicts(cls, items)
+
+    @property
+    def text(self) -> str:
+        """headline + 본문"""
+        if self.headline:
+            return f"{self.headline} {self.content}".strip()
+        return self.content
+
+    @property
+    def star(self) -> int | None:
+        """반올림한 정수 별점 (별점 없으면 None)"""
+        return None if self.rating is None else round(self.rating)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class QnAPair:
+    question: str = ""
+    answer: str = ""
+    q_date: str = ""        # YYYY-MM-DD, 알 수 없으면 ""
+    a_date: str = ""
+    seller: str = ""
+    author: str = ""
+
+    @classmethod
+    def from_dict(cls, d: dict, clean: bool = True) -> "QnAPair":
+        """수집기 원시 dict → 정규화된 QnAPair (clean=False: 텍스트·날짜 정규화 완료된 dict)"""
+        text, date = (normalize_text, normalize_date) if clean else (_same, _same)
+        return cls(
+            question=text(_to_str(d.get("question"))),
+            answer=text(_to_str(d.get("answer"))),
+            q_date=date(_to_str(d.get("q_date"))),
+            a_date=date(_to_str(d.get("a_date"))),
+            seller=_to_str(d.get("seller")),
+            author=_to_str(d.get("author")),
+        )
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> list["QnAPair"]:
+        """from_dict()의 배치 버전 (페이지 하나 분량을 한 번에 정규화)"""
+        return _from_dicts(cls, items)
+
+    @property
+    def is_secret(self) -> bool:
+        return "(비공개" in self.question or "비밀글" in self.question
+
+    @property
+    def is_answered(self) -> bool:
+        return bool(self.answer) and self.answer != "(답변완료)"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class _RecordSet:
+    """레코드 묶음의 열 기반 저장소 (공통 구현).
+
+    _NUMERIC: {필드명: array typecode}. 나머지 필드는 문자열 list.
+    _INTERNED: 값이 자주 반복되어 intern할 문자열 필드.
+    """
+
+    __slots__ = ("_columns",)
+
+    _RECORD: type = None
+    _NUMERIC: dict[str, str] = {}
+    _INTERNED: tuple[str, ...] = ()
+
+    def __init__(self, records: Iterable = ()):
+        self._columns = {
+            f.name: array(self._NUMERIC[f.name]) if f.name in self._NUMERIC else []
+            for f in fields(self._RECORD)
+        }
+        self.extend(records)
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]):
+        """원시 dict 목록을 일괄 정규화(normalize_records) 후 묶음으로 변환"""
+        return cls(cls._RECORD.from_dicts(items))
+
+    def append(self, record):
+        for name, col in self._columns.items():
+            value = getattr(record, name)
+            if name in self._NUMERIC:
+                value = self._encode_number(name, value)
+            elif name in self._INTERNED:
+                value = sys.intern(value)
+            col.append(value)
+
+    def extend(self, records: Iterable):
+        for r in records:
+            self.append(r)
+
+    def column(self, name: str):
+        """열 원본 (array 또는 list). 통계 계산 등 일괄 처리용."""
+        return self._columns[name]
+
+    def to_dicts(self) -> list[dict]:
+        return [r.to_dict() for r in self]
+
+    def _encode_number(self, name: str, value):
+        return value
+
+    def _decode_number(self, name: str, value):
+        return value
+
+    def _record_at(self, i: int):
+        kwargs = {}
+        for name, col in self._columns.items():
+            value = col[i]
+            if name in self._NUMERIC:
+                value = self._decode_number(name, value)
+            kwargs[name] = value
+        return self._RECORD(**kwargs)
+
+    def __len__(self) -> int:
+        return len(next(iter(self._columns.values())))
+
+    def __iter__(self) -> Iterator:
+        for i in range(len(self)):
+            yield self._record_at(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return type(self)(self._record_at(i) for i in range(*key.indices(len(self))))
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(key)
+        return self._record_at(key)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)}건)"
+
+
+class ReviewSet(_RecordSet):
+    """리뷰 묶음. rating은 float64 array(별점 없음 = NaN), helpful은 int64 array.
+
+    weights: 층화 표본이면 리뷰별 가중치 float64 array (crawler.sampling), 전수 수집이면 None.
+    통계·키워드 집계는 가중치가 있으면 가중 합으로 전체 분포를 추정한다.
+    """
+
+    __slots__ = ("weights",)
+
+    _RECORD = Review
+    _NUMERIC = {"rating": "d", "helpful": "q"}
+    _INTERNED = ("author", "date", "option")
+
+    def __init__(self, records: Iterable = (), weights: Iterable[float] | None = None):
+        self.weights = None
+        super().__init__(records)
+        if weights is not None:
+            self.weights = array("d", weights)
+            if len(self.weights) != len(self):
+                raise ValueError(f"가중치 {len(self.weights)}개, 리뷰 {len(self)}건")
+
+    @property
+    def is_sample(self) -> bool:
+        """층화 표본(가중치 있음) 여부"""
+        return self.weights is not None
+
+    def append(self, record):
+        super().append(record)
+        if self.weights is not None:
+            self.weights.append(1.0)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            weights = self.weights[key] if self.weights is not None else None
+            return type(self)((self._record_at(i) for i in range(*key.indices(len(self)))), weights)
+        return super().__getitem__(key)
+
+    def _encode_number(self, name: str, value):
+        if name == "rating":
+            return math.nan if value is None else value
+        return value
+
+    def _decode_number(self, name: str, value):
+        if name == "rating":
+            return None if math.isnan(value) else value
+        return value
+
+
+class QnASet(_RecordSet):
+    """Q&A 묶음."""
+
+    __slots__ = ()
+
+    _RECORD = QnAPair
+    _INTERNED = ("q_date", "a_date", "seller", "author")
+
+
+def review_key(review: Review) -> str:
+    """수집 회차가 달라도 같은 리뷰면 같은 값 (감시 모드 신규 판별용)"""
+    return f"{review.author}|{review.date}|{review.content[:40]}"
+
+
+def qna_key(pair: QnAPair) -> str:
+    """수집 회차가 달라도 같은 질문이면 같은 값 (답변은 나중에 달릴 수 있으므로 제외)"""
+    return f"{pair.author}|{pair.q_date}|{pair.question[:40]}"
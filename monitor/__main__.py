@@ -0,0 +1,145 @@
+"""감시 목록 정기 수집 + 변화 분석
+
+사용법:
+    python -m monitor watchlist.txt                 # 주기가 된 상품만 한 번 수집 (cron용)
+    python -m monitor watchlist.txt --loop          # 상주하며 주기마다 수집
+    python -m monitor watchlist.txt --force         # 주기와 관계없이 전체 수집
+
+watchlist.txt: 한 줄에 상품 URL 하나 (# 주석 허용).
+API 키는 환경변수 ANTHROPIC_API_KEY / OPENAI_API_KEY에서 읽는다.
+처음 수집한 상품은 기준 스냅샷만 저장하고, 이후 회차부터 신규 리뷰·문의만 AI로 분석해
+watch_data/reports/에 "무엇이 바뀌었나" 리포트를 남긴다.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+
+from analyzer.ai_client import create_ai_client
+from analyzer.delta import DeltaAnalyzer, diff_snapshot, format_trend_table
+from analyzer.review_stats import compute_review_stats
+from crawler.url_parser import parse_url
+from config.settings import WATCH_DATA_DIR, WATCH_INTERVAL_HOURS, WATCH_POLL_MINUTES
+from models.records import ReviewSet, QnASet, review_key
+from monitor.collector import collect
+from monitor.store import SnapshotStore
+from utils.validators import validate_product_url, validate_api_key
+
+_API_KEY_ENV = {"claude": "ANTHROPIC_API_KEY", "openai": "OPENAI_API_KEY"}
+
+
+def load_watchlist(path: str) -> list[tuple[str, str]]:
+    """(url, platform) 목록. 잘못된 URL은 건너뜀."""
+    targets = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            url = line.split("#", 1)[0].strip()
+            if not url:
+                continue
+            valid, msg, platform = validate_product_url(url)
+            if not valid:
+                print(f"[Monitor] 건너뜀: {url} ({msg})")
+                continue
+            targets.append((url, platform))
+    return targets
+
+
+def check_product(url: str, platform: str, store: SnapshotStore, analyzer: DeltaAnalyzer) -> str | None:
+    """상품 하나 재수집 → 변화 분석 → 스냅샷 갱신. 저장한 리포트 경로 반환."""
+    product_info = parse_url(url, platform)
+    snap = store.load(url, platform, product_info["product_id"])
+    known = {review_key(r) for r in snap.reviews} if not snap.is_baseline else None
+
+    result = asyncio.run(collect(platform, product_info, known))
+    if result is None:
+        return None
+    product_data, reviews, qna_pairs = result
+    # 이미 묶음이면 그대로 (층화 표본 가중치 유지)
+    reviews = reviews if isinstance(reviews, ReviewSet) else ReviewSet(reviews)
+    qna_pairs = qna_pairs if isinstance(qna_pairs, QnASet) else QnASet(qna_pairs)
+
+    checked_at = datetime.now().isoformat(timespec="minutes")
+    delta = diff_snapshot(snap.reviews, snap.qna_pairs, reviews, qna_pairs)
+    baseline = snap.is_baseline
+    snap.merge(product_data, reviews, qna_pairs)
+
+    data = product_data or {}
+    snap.record({
+        "checked_at": checked_at,
+        "rating": data.get("rating"),
+        "review_count": data.get("review_count"),
+        "price": data.get("price") or None,
+        "collected_mean": compute_review_stats(snap.reviews).mean,
+        "new_reviews": 0 if baseline else len(delta.new_reviews),
+        "new_qna": 0 if baseline else len(delta.new_qna),
+    })
+
+    title = snap.product.get("title") or url
+    if baseline:
+        summary = f"기준 스냅샷 저장 (리뷰 {len(snap.reviews)}건, 문의 {len(snap.qna_pairs)}건). 다음 회차부터 변화를 분석합니다."
+    else:
+        print(f"[Monitor] 신규 리뷰 {len(delta.new_reviews)}건, 신규 문의 {len(delta.new_qna)}건, "
+              f"새 답변 {len(delta.newly_answered)}건")
+        try:
+            summary = analyzer.analyze(title, delta, snap.history)
+        except Exception as e:
+            # 분석 실패해도 스냅샷은 저장하지 않음 — 다음 회차에 같은 변화분을 다시 분석
+            print(f"[Monitor] 변화 분석 실패: {e}")
+            return None
+
+    report = (
+        f"# {title}\n\n{url}\n\n수집 시각: {checked_at}\n\n"
+        f"## 회차별 추이\n\n{format_trend_table(snap.history)}\n\n"
+        f"## 변화 분석\n\n{summary}\n"
+    )
+    store.save(snap)
+    return store.save_report(snap, checked_at, report)
+
+
+def run_once(targets: list[tuple[str, str]], store: SnapshotStore, analyzer: DeltaAnalyzer,
+             interval_hours: float, force: bool = False):
+    """주기가 된 상품만 수집"""
+    for url, platform in targets:
+        try:
+            snap = store.load(url, platform, parse_url(url, platform)["product_id"])
+            if not force and not snap.due(interval_hours):
+                continue
+            print(f"[Monitor] 수집 시작: {url}")
+            path = check_product(url, platform, store, analyzer)
+            if path:
+                print(f"[Monitor] 리포트 저장: {path}")
+        except Exception as e:
+            print(f"[Monitor] {url} 처리 실패: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감시 목록 정기 수집 + 변화 분석")
+    parser.add_argument("watchlist")
+    parser.add_argument("--provider", choices=sorted(_API_KEY_ENV), default="claude")
+    parser.add_argument("--interval-hours", type=float, default=WATCH_INTERVAL_HOURS)
+    parser.add_argument("--data-dir", default=WATCH_DATA_DIR)
+    parser.add_argument("--loop", action="store_true", help="상주하며 주기마다 수집")
+    parser.add_argument("--force", action="store_true", help="주기와 관계없이 전체 수집")
+    args = parser.parse_args()
+
+    api_key = os.environ.get(_API_KEY_ENV[args.provider], "")
+    key_valid, key_msg = validate_api_key(api_key, args.provider)
+    if not key_valid:
+        parser.error(f"{_API_KEY_ENV[args.provider]}: {key_msg}")
+
+    targets = load_watchlist(args.watchlist)
+    store = SnapshotStore(args.data_dir)
+    analyzer = DeltaAnalyzer(create_ai_client(args.provider, api_key))
+
+    run_once(targets, store, analyzer, args.interval_hours, args.force)
+    while args.loop:
+        time.sleep(WATCH_POLL_MINUTES * 60)
+        # 실행 중 목록 수정 반영
+        targets = load_watchlist(args.watchlist)
+        run_once(targets, store, analyzer, args.interval_hours)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""감시 모드용 수집기 (UI 없이 상품 정보·리뷰·Q&A 수집)
+
+앱의 크롤링 흐름과 같지만 진행 상황은 로그로만 남긴다.
+쿠팡 리뷰는 이전 수집분 키를 넘겨 최신순으로 받다가 새 리뷰가 없는 페이지에서 멈춘다.
+저장된 쿠키가 유효하면 리뷰·Q&A는 브라우저와 동시에 별도 스레드에서 HTTP로 받고,
+브라우저는 상품 정보를 수집한 뒤 빠른 수집이 실패한 데이터만 대신 수집한다.
+"""
+
+from crawler.browser import CoupangBrowser, NaverBrowser
+from crawler.product_page import ProductPageScraper
+from crawler.review_scraper import ReviewScraper
+from crawler.qna_scraper import QnAScraper
+from crawler.naver_product_page import NaverProductPageScraper
+from crawler.naver_review_scraper import NaverReviewScraper
+from crawler.naver_qna_scraper import NaverQnAScraper
+from crawler.fast_path import (
+    fetch_coupang_reviews, fetch_coupang_qna, fetch_naver_reviews, fetch_naver_qna, remember_naver_ids,
+    start_in_thread, fast_results,
+)
+
+
+def _log(msg: str, *_):
+    print(f"[Monitor] {msg}")
+
+
+async def collect(platform: str, product_info: dict, known_reviews: set[str] | None = None):
+    """(product_data, reviews, qna_pairs). 접속 실패 시 빠른 수집분만 (product_data=None), 그것도 없으면 None."""
+    if platform == "coupang":
+        return await _collect_coupang(product_info, known_reviews)
+    return await _collect_naver(product_info)
+
+
+async def _collect_coupang(product_info: dict, known_reviews: set[str] | None):
+    # 저장된 쿠키가 유효하면 리뷰·Q&A는 브라우저 없이 별도 스레드에서 수집
+    fast_reviews = await start_in_thread(fetch_coupang_reviews(product_info, _log, known_reviews))
+    fast_qna = await start_in_thread(fetch_coupang_qna(product_info, _log))
+
+    browser = CoupangBrowser()
+    try:
+        await browser.launch()
+        if not await browser.navigate(product_info["full_url"]):
+            _log("쿠팡 페이지 접속 실패 (봇 차단 가능)")
+            return await fast_results(fast_reviews, fast_qna)
+
+        # 리뷰 API는 별도 스레드에서, 그동안 브라우저는 상품 정보·Q&A 수집
+        # 빠른 수집이 이미 실패로 끝났으면 바로 시작, 아직 진행 중이면 상품 정보·Q&A 뒤에 결과 확인
+        review_scraper = ReviewScraper()
+        review_job = None
+        if fast_reviews.done() and fast_reviews.result() is None:
+            review_job = await review_scraper.start_api(browser, product_info, _log, known=known_reviews)
+        product_data = await ProductPageScraper().scrape(browser.page, product_info)
+        qna_pairs = await fast_qna
+        if qna_pairs is None:
+            qna_pairs = await QnAScraper().scrape_all(browser, product_info, _log)
+        if review_job is None:
+            reviews = await fast_reviews
+            if reviews is None:
+                review_job = await review_scraper.start_api(browser, product_info, _log, known=known_reviews)
+        if review_job is not None:
+            reviews = await review_scraper.finish(browser, review_job)
+        return (product_data, reviews, qna_pairs)
+    finally:
+        await browser.close()
+
+
+async def _collect_naver(product_info: dict):
+    fast_reviews = await start_in_thread(fetch_naver_reviews(product_info, _log))
+    fast_qna = await start_in_thread(fetch_naver_qna(product_info, _log))
+
+    browser = NaverBrowser()
+    try:
+        await browser.launch()
+        browser.set_status_callback(_log)
+        success = await browser.navigate_with_mobile_fallback(
+            product_info["desktop_url"],
+            product_info["mobile_url"],
+        )
+        if not success:
+            _log("네이버 스마트스토어 접속 실패")
+            return await fast_results(fast_reviews, fast_qna)
+
+        next_data = await browser.extract_page_data_json()
+        remember_naver_ids(browser, product_info, next_data)
+        product_data = await NaverProductPageScraper().scrape(browser.page, product_info, next_data)
+        reviews = await fast_reviews
+        if reviews is None:
+            reviews = await NaverReviewScraper().scrape_all(browser, product_info, next_data, _log)
+        qna_pairs = await fast_qna
+        if qna_pairs is None:
+            qna_pairs = await NaverQnAScraper().scrape(browser, product_info, next_data, _log)
+        return (product_data, reviews, qna_pairs)
+    finally:
+        await browser.close()
@@ -0,0 +1,135 @@
+"""감시 상품 스냅샷 저장소 (상품별 JSON 파일)
+
+파일 하나에 마지막 수집 시각, 상품 요약, 지금까지 누적된 리뷰·문의, 회차별 추이를 담는다.
+기준 수집이 층화 표본이었으면 리뷰별 가중치도 함께 저장한다 (이후 신규 리뷰는 가중치 1).
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+
+from config.settings import WATCH_DATA_DIR, WATCH_HISTORY_LIMIT
+from models.records import Review, QnAPair, ReviewSet, QnASet, review_key, qna_key
+
+_UNSAFE = re.compile(r"[^\w.-]+")
+
+# 추이·리포트에 남길 상품 정보 필드 (이미지·상세 텍스트는 저장하지 않음)
+PRODUCT_FIELDS = ("title", "price", "rating", "review_count")
+
+
+class Snapshot:
+    """상품 하나의 저장 상태"""
+
+    def __init__(self, url: str, platform: str, product_id: str):
+        self.url = url
+        self.platform = platform
+        self.product_id = product_id
+        self.last_checked: str = ""
+        self.product: dict = {}
+        self.reviews = ReviewSet()
+        self.qna_pairs = QnASet()
+        self.history: list[dict] = []
+
+    @property
+    def is_baseline(self) -> bool:
+        """아직 한 번도 수집하지 않은 상품"""
+        return not self.last_checked
+
+    def due(self, interval_hours: float, now: datetime | None = None) -> bool:
+        if self.is_baseline:
+            return True
+        elapsed = (now or datetime.now()) - datetime.fromisoformat(self.last_checked)
+        return elapsed.total_seconds() >= interval_hours * 3600
+
+    def merge(self, product_data: dict | None, reviews: ReviewSet, qna_pairs: QnASet):
+        """이번 수집분을 누적 (리뷰는 신규만 추가, 문의는 답변 상태 갱신)"""
+        if product_data:
+            self.product = {k: product_data.get(k) for k in PRODUCT_FIELDS}
+
+        if not self.reviews and reviews.is_sample:
+            self.reviews = reviews[:]  # 층화 표본 기준분은 가중치째 보관
+        known = {review_key(r) for r in self.reviews}
+        for r in reviews:
+            key = review_key(r)
+            if key not in known:
+                known.add(key)
+                self.reviews.append(r)
+
+        latest = {qna_key(q): q for q in qna_pairs}
+        merged = QnASet()
+        for q in self.qna_pairs:
+            merged.append(latest.pop(qna_key(q), q))
+        merged.extend(latest.values())
+        self.qna_pairs = merged
+
+    def record(self, point: dict):
+        self.last_checked = point["checked_at"]
+        self.history.append(point)
+        del self.history[:-WATCH_HISTORY_LIMIT]
+
+    def to_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "platform": self.platform,
+            "product_id": self.product_id,
+            "last_checked": self.last_checked,
+            "product": self.product,
+            "reviews": self.reviews.to_dicts(),
+            "review_weights": list(self.reviews.weights) if self.reviews.is_sample else None,
+            "qna": self.qna_pairs.to_dicts(),
+            "history": self.history,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Snapshot":
+        snap = cls(d["url"], d["platform"], d["product_id"])
+        snap.last_checked = d.get("last_checked", "")
+        snap.product = d.get("product") or {}
+        # 저장된 값은 이미 정규화되어 있음
+        snap.reviews = ReviewSet(
+            (Review.from_dict(r, clean=False) for r in d.get("reviews", [])), d.get("review_weights"),
+        )
+        snap.qna_pairs = QnASet(QnAPair.from_dict(q, clean=False) for q in d.get("qna", []))
+        snap.history = d.get("history", [])
+        return snap
+
+
+class SnapshotStore:
+    def __init__(self, root: str = WATCH_DATA_DIR):
+        self.root = root
+        self.report_dir = os.path.join(root, "reports")
+
+    def slug(self, platform: str, product_id: str) -> str:
+        return _UNSAFE.sub("_", f"{platform}_{product_id}")
+
+    def load(self, url: str, platform: str, product_id: str) -> Snapshot:
+        """저장된 스냅샷. 없거나 읽을 수 없으면 빈 스냅샷."""
+        path = os.path.join(self.root, self.slug(platform, product_id) + ".json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                snap = Snapshot.from_dict(json.load(f))
+            snap.url = url
+            return snap
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[Monitor] 스냅샷 읽기 실패 ({path}): {e}")
+        return Snapshot(url, platform, product_id)
+
+    def save(self, snap: Snapshot):
+        """임시 파일에 쓴 뒤 교체 — 중간에 중단돼도 이전 스냅샷 유지"""
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, self.slug(snap.platform, snap.product_id) + ".json")
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snap.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def save_report(self, snap: Snapshot, checked_at: str, text: str) -> str:
+        os.makedirs(self.report_dir, exist_ok=True)
+        stamp = checked_at.replace(":", "").replace("T", "_")
+        path = os.path.join(self.report_dir, f"{self.slug(snap.platform, snap.product_id)}_{stamp}.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
@@ -0,0 +1,154 @@
+"""브라우저 쿠키 영구 저장소 (사이트별, 암호화 저장)
+
+브라우저로 접속에 성공한 뒤의 쿠키를 사이트(coupang.com, naver.com)별로 저장해 두고,
+다음 실행에서 만료 전이면 브라우저 없이 API를 바로 호출하는 데 쓴다.
+- 파일 전체를 Fernet(AES-128-CBC + HMAC)으로 암호화 (cryptography 미설치 시 저장하지 않음)
+- 키: 환경변수 COOKIE_JAR_KEY, 없으면 처음 실행 시 생성한 키 파일 (권한 600)
+- 쿠키별 expiry를 확인해 만료분은 버리고, 저장 후 COOKIE_JAR_MAX_AGE_HOURS가 지나면 통째로 무효
+- 네이버 API 호출에 필요한 상품별 식별자(merchantNo 등)도 함께 보관
+"""
+
+import json
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+from config.settings import COOKIE_JAR_PATH, COOKIE_JAR_KEY_PATH, COOKIE_JAR_MAX_AGE_HOURS
+
+
+def site_of(url: str) -> str:
+    """URL → 쿠키를 묶어 저장할 사이트 (등록 도메인 기준, 예: smartstore.naver.com → naver.com)"""
+    host = urlparse(url).hostname or ""
+    return ".".join(host.split(".")[-2:])
+
+
+class CookieJar:
+    def __init__(self, path: str = COOKIE_JAR_PATH, key_path: str = COOKIE_JAR_KEY_PATH):
+        self.path = os.path.expanduser(path)
+        self.key_path = os.path.expanduser(key_path)
+        self._lock = threading.Lock()
+        self._fernet = None
+        try:
+            from cryptography.fernet import Fernet
+            self._fernet = Fernet(self._load_key(Fernet))
+        except ImportError:
+            print("[CookieJar] cryptography 미설치 — 쿠키를 저장하지 않습니다")
+        except Exception as e:
+            print(f"[CookieJar] 암호화 키 준비 실패 — 쿠키를 저장하지 않습니다: {e}")
+
+    @property
+    def enabled(self) -> bool:
+        return self._fernet is not None
+
+    def _load_key(self, fernet_cls) -> bytes:
+        env_key = os.environ.get("COOKIE_JAR_KEY")
+        if env_key:
+            return env_key.encode()
+        try:
+            with open(self.key_path, "rb") as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            pass
+        key = fernet_cls.generate_key()
+        os.makedirs(os.path.dirname(self.key_path) or ".", exist_ok=True)
+        fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        return key
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "rb") as f:
+                return json.loads(self._fernet.decrypt(f.read()))
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            # 키가 바뀌었거나 파일이 손상됨 — 새로 시작
+            print(f"[CookieJar] 저장소 읽기 실패, 초기화합니다: {e}")
+            return {}
+
+    def _write(self, data: dict):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self._fernet.encrypt(json.dumps(data).encode()))
+        os.replace(tmp, self.path)
+
+    def save(self, url: str, cookies: list[dict], user_agent: str = ""):
+        """브라우저(get_cookies()) 쿠키를 사이트 단위로 저장 (쿠키를 받은 User-Agent 포함)"""
+        if not self.enabled or not cookies:
+            return
+        keep = ("name", "value", "domain", "path", "expiry")
+        with self._lock:
+            data = self._read()
+            data.setdefault("sites", {})[site_of(url)] = {
+                "saved_at": time.time(),
+                "user_agent": user_agent,
+                "cookies": [{k: c[k] for k in keep if k in c} for c in cookies],
+            }
+            self._write(data)
+
+    def load(self, url: str) -> dict | None:
+        """{"cookies": 아직 유효한 쿠키 목록, "user_agent": str}. 없거나 오래됐으면 None."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._read().get("sites", {}).get(site_of(url))
+        if not entry or time.time() - entry["saved_at"] > COOKIE_JAR_MAX_AGE_HOURS * 3600:
+            return None
+        now = time.time()
+        cookies = [c for c in entry["cookies"] if c.get("expiry") is None or c["expiry"] > now]
+        if not cookies:
+            return None
+        return {"cookies": cookies, "user_agent": entry.get("user_agent", "")}
+
+    def invalidate(self, url: str):
+        """API가 쿠키를 거부했을 때 해당 사이트 쿠키 폐기"""
+        if not self.enabled:
+            return
+        with self._lock:
+            data = self._read()
+            if data.get("sites", {}).pop(site_of(url), None) is not None:
+                self._write(data)
+
+    def remember(self, key: str, values: dict):
+        """상품별 API 식별자 저장 (예: 네이버 merchantNo / originProductNo)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            data = self._read()
+            data.setdefault("products", {})[key] = values
+            self._write(data)
+
+    def recall(self, key: str) -> dict | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._read().get("products", {}).get(key)
+
+
+def save_driver_cookies(driver):
+    """브라우저 종료 직전 현재 사이트 쿠키 저장 (차단 페이지면 저장하지 않음)"""
+    try:
+        if "Access Denied" in driver.title:
+            return
+        user_agent = driver.execute_script("return navigator.userAgent;")
+        cookie_jar().save(driver.current_url, driver.get_cookies(), user_agent)
+    except Exception as e:
+        print(f"[CookieJar] 쿠키 저장 실패: {e}")
+
+
+_jar: CookieJar | None = None
+_jar_lock = threading.Lock()
+
+
+def cookie_jar() -> CookieJar:
+    """프로세스 공용 쿠키 저장소"""
+    global _jar
+    if _jar is None:
+        with _jar_lock:
+            if _jar is None:
+                _jar = CookieJar()
+    return _jar
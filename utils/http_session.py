@@ -0,0 +1,72 @@
+"""공용 HTTP 세션 팩토리
+
+수집(리뷰·Q&A API)과 이미지 다운로드가 같은 연결 풀을 재사용하도록
+HTTPAdapter 풀 크기와 keep-alive, 압축 응답 수락을 한곳에서 설정한다.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_USER_AGENT
+
+# brotli 디코더가 설치되어 있을 때만 br 수락 (없으면 urllib3가 풀지 못함)
+try:
+    import brotli  # noqa: F401
+    _ENCODINGS = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ENCODINGS = "gzip, deflate, br"
+    except ImportError:
+        _ENCODINGS = "gzip, deflate"
+
+_shared: requests.Session | None = None
+_shared_lock = threading.Lock()
+
+
+def create_session(headers: dict | None = None) -> requests.Session:
+    """풀 크기를 조정한 어댑터를 붙인 새 세션"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": HTTP_USER_AGENT,
+        "Accept-Encoding": _ENCODINGS,
+        "Accept-Language": "ko-KR,ko;q=0.9",
+        "Connection": "keep-alive",
+    })
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def shared_session() -> requests.Session:
+    """프로세스 공용 세션 (이미지 다운로드 등 쿠키가 필요 없는 요청용)"""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = create_session()
+    return _shared
+
+
+def apply_cookies(session: requests.Session, cookies: list[dict]):
+    """브라우저 형식 쿠키 목록(name/value/domain/path)을 세션에 설정"""
+    for cookie in cookies:
+        session.cookies.set(
+            cookie["name"], cookie["value"],
+            domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+        )
+
+
+def sync_browser_cookies(session: requests.Session, driver, referer: str, headers: dict | None = None):
+    """브라우저 쿠키(도메인·경로 포함)와 User-Agent / Referer를 세션에 반영"""
+    apply_cookies(session, driver.get_cookies())
+    session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    session.headers["Referer"] = referer
+    if headers:
+        session.headers.update(headers)
+    return session
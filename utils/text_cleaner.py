@@ -1,13 +1,46 @@
-"""텍스트 정제 유틸리티"""
+"""텍스트 정제 유틸리티
+
+모든 패턴은 모듈 로드 시 한 번만 컴파일한다.
+- normalize_text(): HTML 태그·이모지·제로폭 문자 제거 + 공백 정리를 한 함수에서 처리
+- normalize_texts() / normalize_records(): 목록 전체를 구분자로 이어 붙여 정규식을 한 번만 실행
+- parse_int() / parse_paren_count() / normalize_date() / find_image_urls(): 수집기용 파싱
+"""
 
 import re
 
+_HTML_TAG = re.compile(r"<[^>\x00]+>")
+# 사용자 본문용: 실제 태그 문법(영문 태그명 + 속성)과 주석만 — "<사이즈 추천>", "a<b 그리고 c>d"는 보존
+_TAG = (
+    r"<!--[^\x00]*?-->"
+    r"|</?[A-Za-z][A-Za-z0-9]*"
+    r"(?:\s+[A-Za-z_:][-A-Za-z0-9_:.]*(?:\s*=\s*(?:\"[^\"\x00]*\"|'[^'\x00]*'|[^\s\"'=<>`\x00]+))?)*"
+    r"\s*/?>"
+)
+_ZERO_WIDTH = "\u200b-\u200f\u2060\ufeff"
+_EMOJI = (
+    "\U0001f000-\U0001faff"     # 이모티콘, 그림 문자, 교통, 보충 기호
+    # 기타 기호·딩뱃(U+2600-27BF) 중 기본 표시가 그림 문자인 것만 (★☆♥✓ 같은 텍스트 기호는 보존)
+    "\u2614\u2615\u2648-\u2653\u267f\u2693\u26a1\u26aa\u26ab\u26bd\u26be\u26c4\u26c5"
+    "\u26ce\u26d4\u26ea\u26f2\u26f3\u26f5\u26fa\u26fd\u2705\u270a\u270b\u2728\u274c"
+    "\u274e\u2753-\u2755\u2757\u2795-\u2797\u27b0\u27bf"
+    "\ufe0e\ufe0f"              # 이모지 변형 선택자
+)
+# 태그 / 이모지 / 제로폭 문자를 한 번의 치환으로 제거
+_STRIP = re.compile(rf"{_TAG}|[{_ZERO_WIDTH}{_EMOJI}]+")
+_STRIP_KEEP_EMOJI = re.compile(rf"{_TAG}|[{_ZERO_WIDTH}]+")
+
+_FIRST_INT = re.compile(r"\d[\d,]*")
+_PAREN_COUNT = re.compile(r"\((\d[\d,]*)\)")
+_DATE_PATTERN = re.compile(r"(\d{2,4})\s*[./-]\s*(\d{1,2})\s*[./-]\s*(\d{1,2})")
+_IMAGE_URL = re.compile(r"https?://[^\s\"'<>]+\.(?:jpg|jpeg|png|gif|webp)")
+
+# 배치 처리 시 레코드 사이 구분자 (위 패턴들이 가로지르지 않으며 공백으로 취급되지 않음)
+_SEP = "\x00"
+
 
 def clean_html_text(text: str) -> str:
     """HTML 태그 제거 및 공백 정리"""
-    text = re.sub(r"<[^>]+>", "", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    return " ".join(_HTML_TAG.sub("", text).split())
 
 
 def truncate_text(text: str, max_length: int = 500) -> str:
@@ -15,3 +48,87 @@ def truncate_text(text: str, max_length: int = 500) -> str:
     if len(text) <= max_length:
         return text
     return text[:max_length] + "..."
+
+
+def normalize_text(text: str, strip_emoji: bool = True) -> str:
+    """HTML 태그·제로폭 문자(·이모지) 제거 후 연속 공백을 한 칸으로"""
+    if not text:
+        return ""
+    strip = _STRIP if strip_emoji else _STRIP_KEEP_EMOJI
+    # 공백 정리는 정규식보다 str.split()/join이 훨씬 빠름
+    return " ".join(strip.sub("", text).split())
+
+
+def normalize_texts(texts: list[str], strip_emoji: bool = True) -> list[str]:
+    """normalize_text()의 배치 버전. 전체를 이어 붙여 정규식을 한 번씩만 실행."""
+    if not texts:
+        return []
+    strip = _STRIP if strip_emoji else _STRIP_KEEP_EMOJI
+    joined = _SEP.join(t.replace(_SEP, "") if t else "" for t in texts)
+    return [" ".join(t.split()) for t in strip.sub("", joined).split(_SEP)]
+
+
+def normalize_records(
+    records: list[dict],
+    text_fields: tuple[str, ...] = ("headline", "content", "question", "answer"),
+    date_fields: tuple[str, ...] = ("date", "q_date", "a_date"),
+    strip_emoji: bool = True,
+) -> list[dict]:
+    """레코드 목록의 텍스트·날짜 필드를 한꺼번에 정규화한 새 dict 목록 반환"""
+    out = [dict(r) for r in records]
+    for name in text_fields:
+        rows = [r for r in out if name in r]
+        if not rows:
+            continue
+        cleaned = normalize_texts([str(r[name] or "") for r in rows], strip_emoji)
+        for r, value in zip(rows, cleaned):
+            r[name] = value
+    # 날짜는 값 종류가 적으므로 한 번 변환한 결과를 재사용
+    dates: dict[str, str] = {}
+    for name in date_fields:
+        for r in out:
+            if name in r:
+                raw = str(r[name] or "")
+                value = dates.get(raw)
+                if value is None:
+                    value = dates[raw] = normalize_date(raw)
+                r[name] = value
+    return out
+
+
+def parse_int(text: str, default: int = 0) -> int:
+    """문자열의 첫 번째 숫자 (천 단위 쉼표 허용). 없으면 default."""
+    m = _FIRST_INT.search(text or "")
+    return int(m.group(0).replace(",", "")) if m else default
+
+
+def parse_paren_count(text: str) -> int | None:
+    """'상품평 (1,234)' 같은 괄호 안 개수. 없으면 None."""
+    m = _PAREN_COUNT.search(text or "")
+    return int(m.group(1).replace(",", "")) if m else None
+
+
+def normalize_date(text: str) -> str:
+    """날짜 표기를 ISO(YYYY-MM-DD)로 통일.
+
+    2024.01.15 / 24.01.15. / 2024/01/15 / 2024-01-15T12:00:00 등을 처리.
+    날짜 형식이 아니면 ("한 달 전" 등) "" 반환.
+    """
+    m = _DATE_PATTERN.search(text or "")
+    if not m:
+        return ""
+    year, month, day = m.groups()
+    if len(year) == 2:
+        year = "20" + year
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def find_date(text: str) -> str:
+    """문자열에서 첫 날짜를 찾아 ISO로 반환. 없으면 ""."""
+    m = _DATE_PATTERN.search(text or "")
+    return normalize_date(m.group(0)) if m else ""
+
+
+def find_image_urls(html: str) -> list[str]:
+    """HTML 문자열 안의 이미지 URL 목록 (등장 순서)"""
+    return _IMAGE_URL.findall(html or "")